@@ -6,9 +6,7 @@ class PID:
         self.prev_error = 0
         self.integral = 0
 
-    def compute(self, error):
-        dt = 1/60
-
+    def compute(self, error, dt=1/60):
         self.integral += error * dt  # Accumulate integral
         derivative = (error - self.prev_error) / dt  # Compute derivative
         self.prev_error = error
@@ -1,3 +1,4 @@
+import random
 from abc import ABC, abstractmethod
 
 from algorithms.control_api import RobotControlAPI
@@ -11,7 +12,8 @@ class BaseController(ABC):
         self.controls: RobotControlAPI | None = None
         self.debug: RobotDebugAPI | None = None
         self.robot_is_initialized = False
-        
+        # Replaced by the robot's seeded stream when the controller is attached
+        self.rng: random.Random = random.Random()
 
     def set_apis(self, sensors, controls, debug: RobotDebugAPI = None):
         self.sensors = sensors
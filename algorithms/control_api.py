@@ -1,4 +1,6 @@
 from engine.environment import Resource
+from engine.message_bus import BusMessage
+from engine.types import IWaypointData
 
 
 class RobotControlAPI:
@@ -23,6 +25,18 @@ class RobotControlAPI:
     def set_message(self, message: str):
         return self._robot.set_message(message=message)
 
+    def send(self, message: BusMessage | None):
+        """Send a typed message on the message bus until another one is sent, None stops sending"""
+        self._robot.sim.message_bus.send(self._robot, message)
+
+    def intern_message(self, kind: int, qualifier: int, waypoint_ids) -> BusMessage:
+        """The shared message with this content, equal messages are the same object"""
+        return self._robot.sim.message_bus.intern(kind, qualifier, waypoint_ids)
+
+    def deposit_pheromone(self, channel: str, waypoint: IWaypointData, amount: float = 1.0):
+        """Add to the world's pheromone field at a waypoint"""
+        self._robot.sim.environment.pheromones.deposit(channel, waypoint.id, amount)
+
     def enable_light(self):
         self._robot.light_switch = True
 
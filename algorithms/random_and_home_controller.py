@@ -4,7 +4,6 @@ from enum import Enum
 from algorithms.PID import PID
 from algorithms.base_controller import BaseController
 from engine.types import IWaypointData
-from random import choice
 
 
 class RobotState(Enum):
@@ -47,7 +46,6 @@ class RandomHomeController(BaseController):
     def search(self):
         waypoint_distance = self.sensors.get_waypoint_distance()
         all_waypoints = self.sensors.get_all_waypoints()
-        robot_position = self.sensors.get_robot_position()
 
         def get_new_waypoint():
             directions = ["up", "down", "left", "right"]
@@ -64,9 +62,9 @@ class RandomHomeController(BaseController):
                         fallback_options.append(neighbor)
 
             if unvisited_options:
-                new_target_waypoint = choice(unvisited_options)
+                new_target_waypoint = self.rng.choice(unvisited_options)
             elif fallback_options:
-                new_target_waypoint = choice(fallback_options)
+                new_target_waypoint = self.rng.choice(fallback_options)
             else:
                 raise RuntimeError("No waypoint to target")
 
@@ -84,7 +82,7 @@ class RandomHomeController(BaseController):
                     break
         assert self.target_waypoint is not None
 
-        if self.target_waypoint.position.get_distance(robot_position) < waypoint_distance//4:
+        if self.sensors.is_near_waypoint(self.target_waypoint, waypoint_distance//4):
             if len(self.visited_waypoints) >= 5:
                 self.state = RobotState.GO_HOME
                 self.target_waypoint = None
@@ -106,7 +104,7 @@ class RandomHomeController(BaseController):
         angle_to_target = (angle_to_target + math.pi) % (2 * math.pi) - math.pi
 
         # Compute PID correction
-        control = self.pid.compute(angle_to_target)
+        control = self.pid.compute(angle_to_target, dt=self.sensors.get_control_dt())
 
         # Convert control signal into motor values
         turn = max(-1, min(1, control))  # Clamp turn value to [-1, 1]
@@ -119,7 +117,6 @@ class RandomHomeController(BaseController):
 
     def go_home(self):
         waypoint_distance = self.sensors.get_waypoint_distance()
-        robot_position = self.sensors.get_robot_position()
 
         def get_new_waypoint():
             new_target_waypoint = self.visited_waypoints.pop()
@@ -128,7 +125,7 @@ class RandomHomeController(BaseController):
         if self.target_waypoint is None:
             self.target_waypoint = get_new_waypoint()
 
-        if self.target_waypoint.position.get_distance(robot_position) < waypoint_distance // 4:
+        if self.sensors.is_near_waypoint(self.target_waypoint, waypoint_distance // 4):
             if len(self.visited_waypoints) == 0:
                 self.state = RobotState.SEARCH
                 self.target_waypoint = None
@@ -150,7 +147,7 @@ class RandomHomeController(BaseController):
         angle_to_target = (angle_to_target + math.pi) % (2 * math.pi) - math.pi
 
         # Compute PID correction
-        control = self.pid.compute(angle_to_target)
+        control = self.pid.compute(angle_to_target, dt=self.sensors.get_control_dt())
 
         # Convert control signal into motor values
         turn = max(-1, min(1, control))  # Clamp turn value to [-1, 1]
@@ -3,8 +3,8 @@ from enum import Enum, auto
 from algorithms.PID import PID
 from algorithms.base_controller import BaseController
 from engine.environment import Resource
+from engine.message_bus import BusMessage, MessageKind
 from engine.types import IWaypointData
-from random import choice, randint
 from sim_math.angles import normalize_angle
 from sim_math.units import Speed
 
@@ -26,9 +26,16 @@ class RandomRecruitController(BaseController):
         self.visited_waypoints: list[IWaypointData] = []
         self.max_speed = Speed(0.0)
         self.RECRUITMENT_THRESHOLD = 1 / 5  # speed threshold where the robot will start recruiting
+        self.RECRUITMENT_LIGHTS = True  # whether retrieving robots turn their light on to recruit
         self.path_qualifier = None
+        self.path_message: BusMessage | None = None  # path sent, None when it changed since
+        self.resolved_paths: dict[BusMessage, tuple[IWaypointData, ...]] = {}  # paths adopted before
         self.PID = PID(Kp=0.92712943, Ki=0.0, Kd=0.11295359)
         self.BASE_SPEED = 0.8
+        # Explore towards the neighbors least visited by the whole swarm (the world's "visits"
+        # pheromone) instead of those missing from the own visited waypoints
+        self.PHEROMONE_EXPLORATION = False
+        self.pheromones_enabled = False
         self.show_pop_ups = False
 
         # variables needed to be initialized
@@ -44,12 +51,17 @@ class RandomRecruitController(BaseController):
         self.WAYPOINTS_DICT = self.sensors.get_waypoints_dict()
         self.HOME_BASE_WAYPOINT = self.find_home_base_waypoint()
         self.WAYPOINT_THRESHOLD = self.sensors.get_robot_diameter()/2
+        self.pheromones_enabled = self.sensors.has_pheromones()
+        if self.PHEROMONE_EXPLORATION and not self.pheromones_enabled:
+            raise RuntimeError("pheromone exploration needs a pheromone field, see Environment.generate_pheromones")
 
     def switch_state(self, state: RobotState):
         self.target_waypoint = None
         self.path_qualifier = None
+        self.path_message = None
+        self.resolved_paths.clear()
         self.state = state
-        self.controls.set_message(None)
+        self.controls.send(None)
 
     def robot_update(self):
         self.max_speed = max(self.max_speed, self.sensors.get_robot_speed())  # update max speed
@@ -60,7 +72,6 @@ class RandomRecruitController(BaseController):
         if self.state == RobotState.JOIN: self.join()
 
     def search(self):
-        robot_position = self.sensors.get_robot_position()
         self.controls.disable_light()
 
         # go home
@@ -76,8 +87,9 @@ class RandomRecruitController(BaseController):
                 return self.switch_state(RobotState.RETRIEVE)
 
         # if arrived at the waypoint, get new waypoint
-        if self.target_waypoint.position.get_distance(robot_position) < self.WAYPOINT_THRESHOLD:
+        if self.sensors.is_near_waypoint(self.target_waypoint, self.WAYPOINT_THRESHOLD):
             self.visited_waypoints.append(self.target_waypoint)
+            self.deposit("visits", self.target_waypoint)
             self.target_waypoint = self.get_random_waypoint()
 
         # check if recruited
@@ -92,69 +104,71 @@ class RandomRecruitController(BaseController):
         if self.target_waypoint is None:
             self.target_waypoint = self.get_next_waypoint_home()
 
-        robot_position = self.sensors.get_robot_position()
-
         # recruit other robots
-        if self.sensors.get_robot_speed() < self.max_speed * self.RECRUITMENT_THRESHOLD:
+        if self.RECRUITMENT_LIGHTS and self.sensors.get_robot_speed() < self.max_speed * self.RECRUITMENT_THRESHOLD:
             self.controls.enable_light()
         else:
             self.controls.disable_light()
 
         # share path with other robots
         if self.path_qualifier is None:
-            self.path_qualifier = randint(0, 100_000)
-        msg_prefix = f"retrieve-path:{self.path_qualifier}:"
-        full_path = [str(waypoint.id) for waypoint in self.visited_waypoints]
-        full_path.append(str(self.target_waypoint.id))
-        own_path_str = msg_prefix + ",".join(full_path)
-        self.controls.set_message(message=own_path_str)
-        self.debug.print(message=own_path_str, pop_up=self.show_pop_ups)
+            self.path_qualifier = self.rng.randint(0, 100_000)
+        own_path = self.share_path()
 
         # compare to other paths
-        for message in self.sensors.get_received_messages():
-            # Ignore unless message contains a path different from its own
-            if (
-                not message
-                or not message.startswith("retrieve-path:")
-                or message == own_path_str
-            ):
+        for message in self.sensors.receive():
+            # Ignore unless message contains a path different from its own (interned, so equal
+            # paths are the same message)
+            if message is own_path or message.kind != MessageKind.RETRIEVE_PATH:
                 continue
 
-            other_path = message.split(":")[2].split(",")
-
             # Ignore empty paths and paths that are longer than the current path
-            if not other_path or len(other_path) > len(full_path):
+            if not message.length or message.length > own_path.length:
                 continue
 
-            other_qualifier = int(message.split(":")[1])
-            resolved_path = [
-                self.WAYPOINTS_DICT[int(waypoint_id)] for waypoint_id in other_path
-            ]
-
+            other_qualifier = message.qualifier
             # Received shorter path
-            if len(resolved_path) < len(full_path):
+            if message.length < own_path.length:
                 self.debug.print(f"Adopting shorter path {other_qualifier}", self.show_pop_ups)
-                self.visited_waypoints = resolved_path
-                self.path_qualifier = other_qualifier
-                self.target_waypoint = self.get_next_waypoint_home()
+                self.adopt_path(message)
             # Received different path with equal length
-            if len(resolved_path) == len(full_path):
+            elif message.length == own_path.length:
                 if other_qualifier < self.path_qualifier:
                     self.debug.print(f"Adopting equal path by qualifier {other_qualifier}", self.show_pop_ups)
-                    self.visited_waypoints = resolved_path
-                    self.path_qualifier = other_qualifier
-                    self.target_waypoint = self.get_next_waypoint_home()
+                    self.adopt_path(message)
 
         # move to next waypoint on the way to home base
-        if self.target_waypoint.position.get_distance(robot_position) < self.WAYPOINT_THRESHOLD:
+        if self.sensors.is_near_waypoint(self.target_waypoint, self.WAYPOINT_THRESHOLD):
+            self.deposit("trail", self.target_waypoint)
             if len(self.visited_waypoints) == 0:
                 return self.switch_state(RobotState.SEARCH)
             self.target_waypoint = self.get_next_waypoint_home()
+            self.path_message = None
 
         self.move_to_target_waypoint()
 
+    def share_path(self) -> BusMessage:
+        """Send the path home (visited waypoints and the target), only when it changed"""
+        if self.path_message is None:
+            path_ids = [waypoint.id for waypoint in self.visited_waypoints]
+            path_ids.append(self.target_waypoint.id)
+            self.path_message = self.controls.intern_message(MessageKind.RETRIEVE_PATH, self.path_qualifier, path_ids)
+            self.controls.send(self.path_message)
+            if self.show_pop_ups:
+                self.debug.print(message=f"retrieve-path:{self.path_qualifier}:{','.join(map(str, path_ids))}", pop_up=True)
+        return self.path_message
+
+    def adopt_path(self, message: BusMessage):
+        """Follow a path received from another robot"""
+        path = self.resolved_paths.get(message)
+        if path is None:
+            path = self.resolved_paths[message] = tuple(self.WAYPOINTS_DICT[waypoint_id] for waypoint_id in message.waypoint_ids.tolist())
+        self.visited_waypoints = list(path)
+        self.path_qualifier = message.qualifier
+        self.target_waypoint = self.get_next_waypoint_home()
+        self.path_message = None
+
     def join(self):
-        robot_position = self.sensors.get_robot_position()
         lights = self.sensors.get_light_detectors()
 
         # check if a resource is found
@@ -176,14 +190,28 @@ class RandomRecruitController(BaseController):
             self.target_waypoint = self.get_waypoint_by_angle(global_light_angle)
 
         # if arrived at waypoint get a new one
-        if self.target_waypoint.position.get_distance(robot_position) < self.WAYPOINT_THRESHOLD:
+        if self.sensors.is_near_waypoint(self.target_waypoint, self.WAYPOINT_THRESHOLD):
             self.visited_waypoints.append(self.target_waypoint)
+            self.deposit("visits", self.target_waypoint)
             self.target_waypoint = self.get_waypoint_by_angle(global_light_angle)
 
         self.move_to_target_waypoint()
 
+    def deposit(self, channel: str, waypoint: IWaypointData):
+        """Mark a waypoint in the world's pheromone field, if there is one"""
+        if self.pheromones_enabled:
+            self.controls.deposit_pheromone(channel, waypoint)
+
     def get_random_waypoint(self) -> IWaypointData:
         directions = ["up", "down", "left", "right"]
+        if self.PHEROMONE_EXPLORATION:
+            # O(1) per neighbor, the least visited neighbors are the options
+            visits = self.sensors.get_neighbor_pheromones("visits", self.target_waypoint)
+            if not visits:
+                raise RuntimeError("no waypoint to target")
+            least = min(visits.values())
+            return self.rng.choice([self.target_waypoint.neighbors[direction] for direction in directions if visits.get(direction) == least])
+
         unvisited_options = []
         fallback_options = []
         for direction in directions:
@@ -195,9 +223,9 @@ class RandomRecruitController(BaseController):
                     fallback_options.append(neighbor)
 
         if unvisited_options:
-            new_target_waypoint = choice(unvisited_options)
+            new_target_waypoint = self.rng.choice(unvisited_options)
         elif fallback_options:
-            new_target_waypoint = choice(fallback_options)
+            new_target_waypoint = self.rng.choice(fallback_options)
         else:
             raise RuntimeError("no waypoint to target")
         return new_target_waypoint
@@ -215,10 +243,10 @@ class RandomRecruitController(BaseController):
         return neighbor
 
     def find_home_base_waypoint(self) -> IWaypointData:
-        for waypoint in self.ALL_WAYPOINTS:
-            if waypoint.is_homebase:
-                return waypoint
-        raise RuntimeError("cannot find any home base waypoint")
+        waypoint = self.sensors.get_home_base_waypoint()
+        if waypoint is None:
+            raise RuntimeError("cannot find any home base waypoint")
+        return waypoint
 
     def get_next_waypoint_home(self):
         new_target_waypoint = self.visited_waypoints.pop()
@@ -234,7 +262,7 @@ class RandomRecruitController(BaseController):
         angle_to_target = target_angle - robot_angle  # Compute angle differences
         angle_to_target = (angle_to_target + math.pi) % (2 * math.pi) - math.pi  # Normalize angles to [-π, π]
         # Apply the movement
-        control = self.PID.compute(angle_to_target)  # Compute PID correction
+        control = self.PID.compute(angle_to_target, dt=self.sensors.get_control_dt())  # Compute PID correction
         turn = max(-1, min(1, control))  # Clamp turn value to [-1, 1]
         # Turn in place if angle is large
         if abs(angle_to_target) > math.radians(90):
@@ -1,5 +1,4 @@
 import math
-import random
 import time
 from enum import Enum
 from algorithms.base_controller import BaseController
@@ -40,7 +39,7 @@ class RandomSearchController(BaseController):
         # If the robot just started searching or finished a movement cycle
         if time.time() - self.start_time > self.search_duration:
             self.start_time = time.time()
-            self.random_direction = (random.uniform(0.5, 1), random.uniform(0.5, 1))
+            self.random_direction = (self.rng.uniform(0.5, 1), self.rng.uniform(0.5, 1))
 
         # Move in the random direction
         left_motor, right_motor = self.random_direction
@@ -1,5 +1,8 @@
+import math
 from pymunk import vec2d
-from engine.types import ILightData, IWaypointData
+from engine.message_bus import BusMessage
+from engine.types import ILightData, ILocationData, ILocationEvent, IWaypointData
+from engine.waypoints import WaypointGrid
 from sim_math.units import Speed
 from typing import TYPE_CHECKING
 
@@ -26,12 +29,57 @@ class RobotSensorAPI:
     def get_received_messages(self) -> list[str]:
         return self._robot.get_received_messages()
 
+    def receive(self) -> list[BusMessage]:
+        """Typed messages of the robots in comms range, received while sending one"""
+        return self._robot.sim.message_bus.receive(self._robot)
+
     def get_all_waypoints(self) -> list[IWaypointData]:
         return self._robot.sim.environment.get_all_waypoints()
 
-    def get_waypoints_dict(self) -> dict[str, IWaypointData]:
+    def get_waypoints_dict(self) -> dict[int, IWaypointData]:
         return self._robot.sim.environment.get_waypoints_dict()
 
+    def get_nearest_waypoint(self) -> IWaypointData:
+        return self._robot.sim.environment.nearest_waypoint(self._robot.body.position)
+
+    def get_next_waypoint_home(self, waypoint: IWaypointData) -> IWaypointData | None:
+        """Neighbor of the waypoint one hop closer to the homebase (on a shortest route)"""
+        return self._robot.sim.environment.next_waypoint_home(waypoint)
+
+    def get_route_home(self, waypoint: IWaypointData) -> list[IWaypointData]:
+        """Shortest route of waypoints from the waypoint to the homebase"""
+        return self._robot.sim.environment.route_home(waypoint)
+
+    def get_home_base_waypoint(self) -> IWaypointData | None:
+        """The first homebase waypoint, by id"""
+        return self._robot.sim.environment.locations.home_waypoint
+
+    def get_location(self) -> ILocationData:
+        """Grid cell, nearest waypoint and regions of the robot this frame"""
+        return self._robot.sim.environment.locations.location(self._robot)
+
+    def is_near_waypoint(self, waypoint: IWaypointData, threshold: float) -> bool:
+        return self._robot.sim.environment.locations.is_near(self._robot, waypoint, threshold)
+
+    def is_in_region(self, region: str) -> bool:
+        return self._robot.sim.environment.locations.is_inside(self._robot, region)
+
+    def get_location_events(self) -> list[ILocationEvent]:
+        """Waypoint arrivals and region changes of the robot this frame"""
+        return self._robot.sim.environment.locations.events(self._robot)
+
+    def has_pheromones(self) -> bool:
+        return self._robot.sim.environment.pheromones is not None
+
+    def get_pheromone(self, channel: str, waypoint: IWaypointData) -> float:
+        """Amount of a pheromone channel at a waypoint"""
+        return self._robot.sim.environment.pheromones.read(channel, waypoint.id)
+
+    def get_neighbor_pheromones(self, channel: str, waypoint: IWaypointData) -> dict[str, float]:
+        """Amount of a pheromone channel at each existing neighbor of a waypoint, by direction"""
+        amounts = self._robot.sim.environment.pheromones.read_neighbors(channel, waypoint.id).tolist()
+        return {direction: amount for direction, amount in zip(WaypointGrid.DIRECTIONS, amounts) if not math.isnan(amount)}
+
     def get_waypoint_distance(self) -> float:
         return self._robot.sim.environment.get_waypoint_distance()
 
@@ -41,5 +89,9 @@ class RobotSensorAPI:
     def get_robot_speed(self) -> Speed:
         return self._robot.speedometer
 
+    def get_control_dt(self) -> float:
+        """Seconds between two controller updates"""
+        return self._robot.control_period / self._robot.sim.fps
+
     def get_robot_diameter(self) -> float:
         return self._robot.spec.robot_diameter.base_unit
@@ -80,7 +80,7 @@ class WaypointController(BaseController):
         adjusted_angle_difference = angle_to_target + counter_steering
 
         # Compute PID correction
-        control = self.pid.compute(adjusted_angle_difference)
+        control = self.pid.compute(adjusted_angle_difference, dt=self.sensors.get_control_dt())
 
         # Convert control signal into motor values
         # base_speed *= min((distance_to_target / waypoint_distance), 1.0)  # slow down before each waypoint
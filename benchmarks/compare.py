@@ -0,0 +1,62 @@
+import argparse
+import json
+import sys
+
+# (metric, direction), where +1 means higher is better
+METRICS = [
+    ("steps_per_second", +1),
+    ("frame_ms.p50", -1),
+    ("frame_ms.p99", -1),
+    ("peak_rss_mb", -1),
+]
+
+
+def get_metric(result: dict, metric: str) -> float:
+    value = result
+    for key in metric.split("."):
+        value = value[key]
+    return value
+
+
+def compare(baseline: dict, candidate: dict, threshold: float = 0.1) -> list[dict]:
+    """Relative change of every metric for the scenarios in both result files. A change for the
+    worse larger than the threshold (a fraction) is flagged as a regression."""
+    rows = []
+    for name, base_result in baseline["scenarios"].items():
+        if name not in candidate["scenarios"]:
+            continue
+        for metric, direction in METRICS:
+            before = get_metric(base_result, metric)
+            after = get_metric(candidate["scenarios"][name], metric)
+            change = (after - before) / before if before else 0.0
+            rows.append({
+                "scenario": name,
+                "metric": metric,
+                "before": before,
+                "after": after,
+                "change": change,
+                "regression": change * direction < -threshold,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files and flag regressions")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change that counts as a regression (default: 0.1)")
+    args = parser.parse_args()
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.candidate) as file:
+        candidate = json.load(file)
+
+    rows = compare(baseline, candidate, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(f"{row['scenario']:24} {row['metric']:18} {row['before']:10.2f} -> {row['after']:10.2f} ({row['change']:+7.1%}) {flag}")
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"{regressions} regressions")
+    sys.exit(1 if regressions else 0)
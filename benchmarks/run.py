@@ -0,0 +1,85 @@
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+from dataclasses import asdict, replace
+from datetime import datetime
+from time import perf_counter
+import numpy as np
+from benchmarks.scenarios import SCENARIOS, Scenario, build_scenario
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of this process's address space. VmHWM starts over when a spawned
+    process execs, unlike ru_maxrss, which Linux carries over from the forking parent."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_scenario(scenario: Scenario) -> dict:
+    """Build and step the scenario, timing every frame"""
+    start = perf_counter()
+    sim = build_scenario(scenario)
+    build_time = perf_counter() - start
+
+    frame_times = []
+    while sim.frame_count < scenario.frames and sim.physics_thread:
+        start = perf_counter()
+        sim.step(1)
+        frame_times.append(perf_counter() - start)
+    frame_times_ms = np.array(frame_times) * 1000
+    p50, p90, p99 = np.percentile(frame_times_ms, [50, 90, 99])
+
+    return {
+        "scenario": asdict(scenario),
+        "frames": len(frame_times),
+        "build_time_s": build_time,
+        "steps_per_second": len(frame_times) / sum(frame_times),
+        "frame_ms": {"p50": p50, "p90": p90, "p99": p99, "max": frame_times_ms.max()},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_benchmarks(scenarios: list[Scenario]) -> dict:
+    results = {}
+    # A freshly spawned process per scenario, so the peak RSS belongs to that scenario alone:
+    # a forked one would start with the parent's resident pages
+    with multiprocessing.get_context("spawn").Pool(processes=1, maxtasksperchild=1) as pool:
+        for scenario in scenarios:
+            result = pool.apply(run_scenario, (scenario,))
+            results[scenario.name] = result
+            print(f"{scenario.name:24} {result['steps_per_second']:10.1f} steps/s   p99 {result['frame_ms']['p99']:7.2f} ms   {result['peak_rss_mb']:7.1f} MB")
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "scenarios": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the engine benchmark scenarios headless and save the results as JSON")
+    parser.add_argument("--out", default="benchmark_results.json", help="result file")
+    parser.add_argument("--only", nargs="*", help="scenario names to run (default: all)")
+    parser.add_argument("--frames", type=int, help="override the number of frames per scenario")
+    args = parser.parse_args()
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.only or scenario.name in args.only]
+    if args.frames:
+        scenarios = [replace(scenario, frames=args.frames) for scenario in scenarios]
+
+    results = run_benchmarks(scenarios)
+    with open(args.out, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Saved {len(scenarios)} scenarios to {args.out}")
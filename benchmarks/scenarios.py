@@ -0,0 +1,69 @@
+import os;os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+from dataclasses import dataclass
+from algorithms.random_and_recruit_controller import RandomRecruitController
+from engine.environment import Environment
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from sim_math.units import Mass
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A canned headless colony, built the same way as the demo scripts in tests/"""
+    name: str
+    robot_count: int = 30
+    waypoint_count: int = 31
+    ir_sensors: int = 8
+    lights: bool = True
+    pheromones: bool = False
+    frames: int = 600
+    seed: int = 1
+
+
+SCENARIOS: list[Scenario] = [
+    # Colony size
+    *[Scenario(name=f"robots_{count}", robot_count=count) for count in (3, 10, 30, 100, 300)],
+    # Waypoint grid size
+    *[Scenario(name=f"waypoints_{count}x{count}", waypoint_count=count) for count in (5, 15, 31, 61)],
+    # IR sensors per robot
+    *[Scenario(name=f"ir_sensors_{count}", ir_sensors=count) for count in (8, 16, 32)],
+    # Recruitment lights off
+    *[Scenario(name=f"robots_{count}_no_lights", robot_count=count, lights=False) for count in (30, 100)],
+    # Exploration by the pheromone field
+    *[Scenario(name=f"robots_{count}_pheromones", robot_count=count, pheromones=True) for count in (30, 100)],
+]
+
+
+def build_scenario(scenario: Scenario) -> SimulationBase:
+    sim = SimulationBase(enable_realtime=False, enable_display=False, seed=scenario.seed)
+    env = Environment(sim)
+    env.generate_waypoints(distance=100, x_count=scenario.waypoint_count, y_count=scenario.waypoint_count, homebase_threshold=80, visible=False)
+    if scenario.pheromones:
+        env.generate_pheromones()
+    env.generate_resources(count=10, radius=50, min_dist=500, max_dist=1400)
+    robot_spec = RobotSpec(
+        meta=sim.meta,
+        motor_mass=Mass.in_kg(2),
+        battery_mass=Mass.in_kg(2),
+        other_materials_mass=Mass.in_kg(16),
+    )
+    for _ in range(scenario.robot_count):
+        controller = RandomRecruitController()
+        if not scenario.lights:
+            controller.RECRUITMENT_LIGHTS = False
+        if scenario.pheromones:
+            controller.PHEROMONE_EXPLORATION = True
+        robot = RobotBase(
+            sim=sim,
+            robot_spec=robot_spec,
+            position=(sim.rng.spawn.uniform(-1, 1) * 2, sim.rng.spawn.uniform(-1, 1) * 2),
+            angle=0,
+            num_ir_sensors=scenario.ir_sensors,
+            controller=controller,
+            ignore_battery=True,
+            robot_collision=False,
+        )
+        robot._comms_range = 300
+        robot._light_range = 300
+    return sim
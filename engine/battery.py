@@ -1,6 +1,7 @@
 from typing import override
 import pygame
 from pymunk import Body
+from engine.renderer import get_font
 from engine.types import IBattery
 from sim_math.world_meta import WorldMeta
 
@@ -25,17 +26,23 @@ class Battery(IBattery):
             draw_debugging=draw_debugging,
             power_draw_scaler=power_draw_scaler,
         )
+        # Energy accounting since the start (infinite power still counts what it delivered)
+        self.drawn__wh = 0.0
+        self.failed_draws = 0
 
     @override
     def draw_power(self, volts: float, amps: float) -> bool:
-        if self.infinite_power:
-            return True
         watt_to_consume = volts * amps
         requested_power_wh = watt_to_consume / self.meta.hour_to_frames
         requested_power_wh *= self.power_draw_scaler
+        if self.infinite_power:
+            self.drawn__wh += requested_power_wh
+            return True
         # Return false if the requested power exceeds the remaining capacity
         if requested_power_wh > self.remaining__wh:
+            self.failed_draws += 1
             return False
+        self.drawn__wh += requested_power_wh
         self.remaining__wh -= requested_power_wh
         # Prevent battery from charging beyond its capacity
         self.remaining__wh = min(self.remaining__wh, self.capacity__wh)
@@ -75,7 +82,7 @@ class Battery(IBattery):
             ),
         )
         # Write the remaining percentage
-        font = pygame.font.Font(None, 15)
+        font = get_font(15, system=False)
         remaining_percentage = (self.remaining__wh / self.capacity__wh) * 100
         text = font.render(f"{remaining_percentage:.1f}%", True, (255, 255, 255))
         text_rect = text.get_rect(center=(bar_position[0] + bar_width / 2, bar_position[1] - 10))
@@ -53,8 +53,9 @@ class Colors:
     _ALL_COLORS = [Red(), Green(), Yellow(), Blue(), Magenta(), Cyan()]
 
     @staticmethod
-    def get_random_color():
-        return Colors._ALL_COLORS[random.randint(0, len(Colors._ALL_COLORS) - 1)]
+    def get_random_color(rng: random.Random = None):
+        rng = rng or random
+        return Colors._ALL_COLORS[rng.randint(0, len(Colors._ALL_COLORS) - 1)]
 
     @staticmethod
     def get_all_colors():
@@ -0,0 +1,95 @@
+import numpy as np
+
+from engine.robot import RobotBase
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class EnergyLedger:
+    """Per-robot energy accounting, sampled every Nth frame into preallocated ring buffers.
+
+    Each sample holds, per robot:
+        - watts: average power drawn from the battery since the previous sample
+        - amps, volts: current and voltage of the left and right motor at the sample
+        - failed_draws: draws the battery refused since the previous sample
+        - state_of_charge: remaining energy as a fraction of the capacity
+
+    Like the trajectory log, the robots in the simulation when the ledger starts get a slot.
+    Once the buffers are full the oldest samples are overwritten. The samples are exported
+    with to_arrays (oldest first) when the simulation quits, and saved to path (.npz) if set.
+    """
+
+    def __init__(self, sim: "SimulationBase", every: int = 1, capacity: int = 4096, path: str | None = None):
+        self.sim = sim
+        self.every = max(1, every)
+        self.capacity = capacity
+        self.path = path
+        self.samples = 0  # taken in total, also those overwritten
+
+        # Slots in creation order
+        self.robots: list[RobotBase] = sorted((obj for obj in sim.entities if isinstance(obj, RobotBase)), key=lambda robot: robot.entity_id)
+        robot_count = len(self.robots)
+        self.frames = np.zeros(capacity, dtype=np.int64)
+        self.watts = np.zeros((capacity, robot_count))
+        self.amps = np.zeros((capacity, robot_count, 2))
+        self.volts = np.zeros((capacity, robot_count, 2))
+        self.failed_draws = np.zeros((capacity, robot_count), dtype=np.int32)
+        self.state_of_charge = np.zeros((capacity, robot_count))
+
+        # Battery totals at the previous sample
+        self._last_frame = sim.frame_count
+        self._last_drawn__wh, self._last_failed_draws = self._battery_totals()
+        sim.energy = self
+
+    def _battery_totals(self) -> tuple[np.ndarray, np.ndarray]:
+        batteries = [robot.battery for robot in self.robots]
+        drawn__wh = np.array([battery.drawn__wh for battery in batteries], dtype=float)
+        failed_draws = np.array([battery.failed_draws for battery in batteries], dtype=np.int64)
+        return drawn__wh, failed_draws
+
+    def capture(self):
+        row = self.samples % self.capacity
+        frame = self.sim.frame_count
+        drawn__wh, failed_draws = self._battery_totals()
+        frames = max(1, frame - self._last_frame)
+
+        self.frames[row] = frame
+        self.watts[row] = (drawn__wh - self._last_drawn__wh) * self.sim.meta.hour_to_frames / frames
+        self.failed_draws[row] = failed_draws - self._last_failed_draws
+        self.amps[row] = [(robot.motor_l._amps, robot.motor_r._amps) for robot in self.robots]
+        self.volts[row] = [(robot.motor_l._volts, robot.motor_r._volts) for robot in self.robots]
+        self.state_of_charge[row] = [robot.battery.remaining__wh / robot.battery.capacity__wh if robot.battery.capacity__wh else 0.0 for robot in self.robots]
+
+        self._last_frame = frame
+        self._last_drawn__wh, self._last_failed_draws = drawn__wh, failed_draws
+        self.samples += 1
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """The kept samples, oldest first (arrays of samples x robots [x motors])"""
+        count = min(self.samples, self.capacity)
+        order = (np.arange(count) + self.samples - count) % self.capacity
+        return {
+            "entity_id": np.array([robot.entity_id for robot in self.robots], dtype=np.int64),
+            "frame": self.frames[order],
+            "watts": self.watts[order],
+            "amps": self.amps[order],
+            "volts": self.volts[order],
+            "failed_draws": self.failed_draws[order],
+            "state_of_charge": self.state_of_charge[order],
+        }
+
+    def export(self) -> dict[str, np.ndarray]:
+        arrays = self.to_arrays()
+        if self.path is not None:
+            np.savez(self.path, **arrays)
+        return arrays
+
+    def close(self):
+        if self.sim.energy is self:
+            self.sim.energy = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
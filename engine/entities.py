@@ -0,0 +1,61 @@
+import pymunk
+
+from engine.objects import IGameObject
+
+
+class EntityRegistry:
+    """Registry of the game objects in a simulation. Every object gets a stable integer id,
+    and objects can be looked up by id, shape or body in constant time. Objects are kept in a
+    dense list and removed by swapping with the last object, so the order is not stable."""
+
+    def __init__(self):
+        self._next_id = 0
+        self._objects: list[IGameObject] = []
+        self._slots: dict[int, int] = {}  # entity id -> index in _objects
+        self._by_shape: dict[pymunk.Shape, int] = {}
+        self._by_body: dict[pymunk.Body, int] = {}
+
+    def add(self, obj: IGameObject) -> int:
+        """Register the object and return its entity id. Registering twice is a no-op."""
+        if obj in self:
+            return obj.entity_id
+        obj.entity_id = self._next_id
+        self._next_id += 1
+        self._slots[obj.entity_id] = len(self._objects)
+        self._objects.append(obj)
+        self._by_shape[obj.shape] = obj.entity_id
+        self._by_body[obj.body] = obj.entity_id
+        return obj.entity_id
+
+    def remove(self, obj: IGameObject) -> bool:
+        """Unregister the object. Returns False if it was not registered."""
+        if obj not in self:
+            return False
+        slot = self._slots.pop(obj.entity_id)
+        last = self._objects.pop()
+        if last is not obj:
+            self._objects[slot] = last
+            self._slots[last.entity_id] = slot
+        del self._by_shape[obj.shape]
+        del self._by_body[obj.body]
+        return True
+
+    def get(self, entity_id: int) -> IGameObject | None:
+        slot = self._slots.get(entity_id)
+        return None if slot is None else self._objects[slot]
+
+    def get_by_shape(self, shape: pymunk.Shape) -> IGameObject | None:
+        return self.get(self._by_shape.get(shape))
+
+    def get_by_body(self, body: pymunk.Body) -> IGameObject | None:
+        return self.get(self._by_body.get(body))
+
+    def __contains__(self, obj: IGameObject) -> bool:
+        entity_id = getattr(obj, "entity_id", None)
+        return entity_id is not None and self._slots.get(entity_id) is not None and self._objects[self._slots[entity_id]] is obj
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
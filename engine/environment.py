@@ -1,8 +1,10 @@
-import random
 import pymunk
 import math
+from engine.locations import LocationService
 from engine.objects import Circle, Box
+from engine.pheromones import PheromoneField
 from engine.types import IWaypointData
+from engine.waypoints import WaypointGrid
 from typing import TYPE_CHECKING
 if TYPE_CHECKING: from engine.simulation import SimulationBase
 
@@ -11,96 +13,120 @@ class Environment:
     def __init__(self, sim):
         self.waypoint_distance = None
         self.waypointData: list[IWaypointData] = []
-        self.waypoints = None
+        self.waypoints_dict: dict[int, IWaypointData] = {}
+        self.waypoint_grid: WaypointGrid | None = None
+        self.pheromones: PheromoneField | None = None
+        self.locations: LocationService | None = None
         self.sim: SimulationBase= sim
         self.homebase = HomeBase(0, 0)
         self.sim.add_game_object(self.homebase)
-        self.resources = []
+        self._resources: dict[int, Resource] = {}  # by entity id, in generation order
         self.resources_generated_count = 0
         self.collected_count = 0
 
         # Register collision handler for HomeBase (1) and Resource (2)
         handler = self.sim.space.add_collision_handler(1, 2)
-        handler.begin = lambda arbiter, space, data: self.handle_homebase_collision(arbiter, space)
+        handler.begin = self._homebase_begin
 
         # Give sim a back reference
         self.sim.set_environment(self)
 
+    def _homebase_begin(self, arbiter, space, data):
+        # A bound method rather than a lambda, so the space can be pickled for checkpoints
+        return self.handle_homebase_collision(arbiter, space)
+
+    @property
+    def resources(self) -> list["Resource"]:
+        """Resources not delivered yet, in generation order"""
+        return list(self._resources.values())
+
     def get_homebase(self):
         return self.homebase
 
     def generate_resources(self, count, min_dist=500, max_dist=1000, radius=30, color=(255, 0, 0)):
         self.resources_generated_count = count
-        self.resources = []
+        self._resources = {}
+        rng = self.sim.rng.world
         for _ in range(count):
-            distance = random.randint(min_dist, max_dist)
-            angle = random.uniform(0, 2 * math.pi)
+            distance = rng.randint(min_dist, max_dist)
+            angle = rng.uniform(0, 2 * math.pi)
             x = distance * math.cos(angle)
             y = distance * math.sin(angle)
             resource = Resource(x, y, radius, color)
-            self.resources.append(resource)
             self.sim.add_game_object(resource)
+            self._resources[resource.entity_id] = resource
 
     def generate_waypoints(self, distance=10, x_count=5, y_count=5, homebase_threshold=50, visible=True):
         self.waypoint_distance = distance
-        self.waypoints = []
-        self.waypointData = []
-        i = 0
-        waypoint_map = {}  # Dictionary to store waypoints by their grid position
-
-        for grid_x in range(x_count):
-            for grid_y in range(y_count):
-                x = -((distance * (x_count-1)) / 2) + grid_x * distance
-                y = -((distance * (y_count-1)) / 2) + grid_y * distance
-                waypoint = Waypoint(x, y, homebase_position=self.homebase.body.position, homebase_threshold=homebase_threshold, visible=visible)
-                waypointData = IWaypointData(position=waypoint.body.position, id=i, neighbors={}, is_homebase=waypoint.is_homebase)
-                self.waypointData.append(waypointData)
-
-                waypoint_map[(grid_x, grid_y)] = waypointData
-
-                i += 1
-                self.waypoints.append(waypoint)
-                self.sim.add_game_object(waypoint)
-
-        # Assign neighbors
-        for grid_x in range(x_count):
-            for grid_y in range(y_count):
-                waypointData = waypoint_map[(grid_x, grid_y)]
-                neighbors = {
-                    "up": waypoint_map.get((grid_x, grid_y + 1)),
-                    "down": waypoint_map.get((grid_x, grid_y - 1)),
-                    "left": waypoint_map.get((grid_x - 1, grid_y)),
-                    "right": waypoint_map.get((grid_x + 1, grid_y))
-                }
-                # Remove None values (out of bounds neighbors)
-                # waypointData.neighbors = {k: v for k, v in neighbors.items() if v is not None}
-                waypointData.neighbors = neighbors
+        self.waypoint_grid = WaypointGrid(
+            meta=self.sim.meta,
+            distance=distance,
+            x_count=x_count,
+            y_count=y_count,
+            homebase_position=self.homebase.body.position,
+            homebase_threshold=homebase_threshold,
+            visible=visible,
+        )
+        self.waypointData = self.waypoint_grid.data
+        self.waypoints_dict = {waypoint.id: waypoint for waypoint in self.waypointData}
+        self.locations = LocationService(self.sim, self.waypoint_grid)
+        self.locations.register_region("homebase", self.homebase.shape.cache_bb())
+        if self.sim.profiler:
+            self.sim.profiler.instrument(self.locations, ("update",))
+        if self.pheromones is not None:
+            # Same channels over the new grid
+            self.generate_pheromones(dict(zip(self.pheromones.channels, self.pheromones.rates.tolist())), self.pheromones.every)
+        self.sim.scenery_version += 1
+
+    def generate_pheromones(self, channels: dict[str, float] | None = None, every=10):
+        """Pheromone field over the waypoints, channels by name with their evaporation rate"""
+        if self.waypoint_grid is None:
+            raise RuntimeError("generate the waypoints before the pheromone field")
+        if channels is None:
+            channels = {"visits": 0.0, "trail": 0.05}
+        self.pheromones = PheromoneField(self.waypoint_grid, channels, every=every)
+        return self.pheromones
 
     def get_all_waypoints(self) -> list[IWaypointData]:
         return self.waypointData
 
-    def get_waypoints_dict(self) -> dict[str, IWaypointData]:
-        waypoint_dict = {}
-        for waypoint in self.waypointData:
-            waypoint_dict[waypoint.id] = waypoint
-        return waypoint_dict
+    def get_waypoints_dict(self) -> dict[int, IWaypointData]:
+        """Waypoints by id, shared (built once per grid)"""
+        return self.waypoints_dict
+
+    def nearest_waypoint(self, position) -> IWaypointData:
+        return self.waypoint_grid.nearest_waypoint(position)
+
+    def next_waypoint_home(self, waypoint: IWaypointData) -> IWaypointData | None:
+        return self.waypoint_grid.next_waypoint_home(waypoint)
+
+    def route_home(self, waypoint: IWaypointData) -> list[IWaypointData]:
+        return self.waypoint_grid.route_home(waypoint)
+
+    def register_region(self, name: str, bounds: tuple[float, float, float, float]):
+        """Region robots are located in, bounds as (left, bottom, right, top)"""
+        self.locations.register_region(name, bounds)
 
     def get_waypoint_distance(self) -> float:
         return self.waypoint_distance
 
+    def draw(self, surface):
+        if self.waypoint_grid:
+            self.waypoint_grid.draw(surface)
+
     def handle_homebase_collision(self, arbiter, space):
         homebase_shape, resource_shape = arbiter.shapes  # Get colliding shapes
 
         # Find the resource object that matches the shape
-        resource: Resource = next((r for r in self.resources if r.shape == resource_shape), None)
+        resource: Resource = self.sim.entities.get_by_shape(resource_shape)
 
-        if resource:
+        if isinstance(resource, Resource):
             # Detach the resource from all attached robots
             for constraint in resource.body.constraints:
                 constraint.tether.robot.detach_from_resource()
 
             # Clean all references
-            self.resources.remove(resource)
+            del self._resources[resource.entity_id]
             self.sim.remove_game_object(resource)
 
             self.collected_count += 1
@@ -115,22 +141,6 @@ class Environment:
         return False
 
 
-class Waypoint(Circle):
-    def __init__(self, x, y, radius=5, color=(40, 40, 40), homebase_position=(0, 0), homebase_threshold=50, visible=True):
-        super().__init__(x=x, y=y, radius=radius, color=color)
-        self.shape.sensor = True
-        self.is_homebase = False
-        self.visible = visible
-        distance_to_homebase = self.body.position.get_distance(homebase_position)
-        if distance_to_homebase < homebase_threshold:
-            self.color = (255, 255, 255)
-            self.is_homebase = True
-
-    def draw(self, surface):
-        if self.visible:
-            super().draw(surface)
-
-
 class Resource(Circle):
     def __init__(self, x, y, radius=10, color=(80, 80, 80)):
         self.constraints = []
@@ -145,6 +155,8 @@ class Resource(Circle):
 
 
 class HomeBase(Box):
+    is_scenery = True
+
     def __init__(self, x, y, width=200, length=200, color=(80, 80, 80)):
         super().__init__(x=x, y=y, width=width, length=length, color=color, trigger=True)
         self.shape.collision_type = 1  # Set collision type for homebase
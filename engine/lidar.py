@@ -0,0 +1,227 @@
+import numpy as np
+import pymunk
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.robot import RobotBase
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class BatchLidar:
+    """Swarm-level IR/lidar sensing. Casts the rays of all robots against all circles and
+    polygons in the world in one NumPy batch, instead of one segment query per ray.
+
+    Mirrors pymunk's segment_query_first for the robot rays:
+        - rays have a radius of RAY_RADIUS
+        - sensor shapes are ignored
+        - shapes are filtered like pymunk.ShapeFilter (group, categories and mask)
+        - rays starting within reach of a shape hit it at distance 0
+
+    Ties between shapes at the same distance resolve to the first target, and grazing hits
+    that pymunk's bounding box culling skips are reported, so those rare cases can differ.
+    """
+
+    RAY_RADIUS = 1.0
+    RAY_MASK = 0b0001 | 0b0010 | 0b0100  # Detects robots, obstacles, and resources
+    NO_HIT = -1
+
+    def __init__(self, sim: "SimulationBase"):
+        self.sim = sim
+        self._robots: dict[int, "RobotBase"] = {}  # by entity id
+        self._frame = -1
+        self._read_frames: dict[int, int] = {}
+
+        # Ray layout (rebuilt when robots are added or removed)
+        self._rays_dirty = True
+        self._ray_robot = np.zeros(0, dtype=np.int64)
+        self._ray_angle = np.zeros(0)
+        self._ray_range = np.zeros(0)
+        self._ray_group = np.zeros(0, dtype=np.int64)
+        self._robot_slices: dict[int, tuple[int, int]] = {}
+
+        # Targets (rebuilt when game objects are added or removed)
+        self._targets_dirty = True
+        self._circle_shapes: list[pymunk.Circle] = []
+        self._poly_shapes: list[pymunk.Poly] = []
+        self.target_shapes: list[pymunk.Shape] = []
+
+        # Results, one entry per ray
+        self.distances = np.zeros(0)
+        self.hit_ids = np.zeros(0, dtype=np.int64)
+
+    def add_robot(self, robot: "RobotBase"):
+        if robot.entity_id not in self._robots:
+            self._robots[robot.entity_id] = robot
+            self._rays_dirty = True
+
+    def remove_robot(self, robot: "RobotBase"):
+        if self._robots.get(robot.entity_id) is robot:
+            del self._robots[robot.entity_id]
+            self._rays_dirty = True
+
+    def invalidate(self):
+        """Mark the targets as changed, e.g. when a game object is added or removed."""
+        self._targets_dirty = True
+
+    def read(self, robot: "RobotBase"):
+        """Write the latest batch results into the robot's ILidarData list."""
+        if self._read_frames.get(robot.entity_id) == self.sim.frame_count:
+            return
+        if self._frame != self.sim.frame_count or self._rays_dirty:
+            self.update()
+        self._read_frames[robot.entity_id] = self.sim.frame_count
+        start, count = self._robot_slices[robot.entity_id]
+        distances = self.distances[start:start + count].tolist()
+        hit_ids = self.hit_ids[start:start + count].tolist()
+        for sensor, distance, hit_id in zip(robot._ir_sensors, distances, hit_ids):
+            sensor.distance = distance
+            sensor.gameobject = None if hit_id == BatchLidar.NO_HIT else self.target_shapes[hit_id].body.gameobject
+
+    def update(self):
+        """Cast all rays for the current frame."""
+        self._frame = self.sim.frame_count
+        if self._rays_dirty:
+            self._build_rays()
+        if self._targets_dirty:
+            self._build_targets()
+
+        ray_count = len(self._ray_robot)
+        if ray_count == 0:
+            return
+
+        # Robot poses, gathered once
+        poses = np.array([(r.body.position.x, r.body.position.y, r.body.angle) for r in self._robots.values()]).reshape(-1, 3)
+        angles = poses[self._ray_robot, 2] + self._ray_angle
+        starts = poses[self._ray_robot, :2]
+        deltas = np.stack((np.cos(angles), np.sin(angles)), axis=1) * self._ray_range[:, None]
+
+        alphas = np.full(ray_count, np.inf)
+        hit_ids = np.full(ray_count, BatchLidar.NO_HIT, dtype=np.int64)
+
+        if self._circle_shapes:
+            circle_alphas = self._query_circles(starts, deltas)
+            best = np.argmin(circle_alphas, axis=1)
+            best_alphas = circle_alphas[np.arange(ray_count), best]
+            closer = best_alphas < alphas
+            alphas[closer] = best_alphas[closer]
+            hit_ids[closer] = best[closer]
+
+        if self._poly_shapes:
+            poly_alphas = self._query_polys(starts, deltas)
+            best = np.argmin(poly_alphas, axis=1)
+            best_alphas = poly_alphas[np.arange(ray_count), best]
+            closer = best_alphas < alphas
+            alphas[closer] = best_alphas[closer]
+            hit_ids[closer] = best[closer] + len(self._circle_shapes)
+
+        hit = hit_ids != BatchLidar.NO_HIT
+        self.distances = np.where(hit, alphas * self._ray_range, self._ray_range)
+        self.hit_ids = hit_ids
+
+    def _build_rays(self):
+        ray_robot, ray_angle, ray_range, ray_group = [], [], [], []
+        self._robot_slices = {}
+        for index, robot in enumerate(self._robots.values()):
+            self._robot_slices[robot.entity_id] = (len(ray_robot), len(robot._ir_sensors))
+            for sensor in robot._ir_sensors:
+                ray_robot.append(index)
+                ray_angle.append(sensor.angle)
+                ray_range.append(robot._lidar_range)
+                ray_group.append(robot.robot_group)
+        self._ray_robot = np.array(ray_robot, dtype=np.int64)
+        self._ray_angle = np.array(ray_angle, dtype=float)
+        self._ray_range = np.array(ray_range, dtype=float)
+        self._ray_group = np.array(ray_group, dtype=np.int64)
+        self.distances = self._ray_range.copy()
+        self.hit_ids = np.full(len(ray_robot), BatchLidar.NO_HIT, dtype=np.int64)
+        self._read_frames = {}
+        self._rays_dirty = False
+
+    def _build_targets(self):
+        self._circle_shapes = []
+        self._poly_shapes = []
+        for shape in self.sim.space.shapes:
+            if shape.sensor:
+                continue
+            if isinstance(shape, pymunk.Circle):
+                self._circle_shapes.append(shape)
+            elif isinstance(shape, pymunk.Poly):
+                self._poly_shapes.append(shape)
+        self.target_shapes = self._circle_shapes + self._poly_shapes
+        self._targets_dirty = False
+
+    def _accepts(self, shapes: list[pymunk.Shape]) -> np.ndarray:
+        """Matrix (rays x shapes) of which shapes pass the ray's shape filter."""
+        filters = [shape.filter for shape in shapes]
+        groups = np.array([f.group for f in filters], dtype=np.int64)
+        categories = np.array([f.categories for f in filters], dtype=np.int64)
+        masks = np.array([f.mask for f in filters], dtype=np.int64)
+
+        same_group = (groups[None, :] != 0) & (groups[None, :] == self._ray_group[:, None])
+        # The ray has every category, so the shape only needs a non-empty mask
+        passes = ((categories & BatchLidar.RAY_MASK) != 0) & (masks != 0)
+        return ~same_group & passes[None, :]
+
+    def _query_circles(self, starts: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+        """Alpha (0-1) along each ray where it first touches each circle, inf if never."""
+        centers = np.array([shape.body.local_to_world(shape.offset) for shape in self._circle_shapes]).reshape(-1, 2)
+        radii = np.array([shape.radius for shape in self._circle_shapes])
+        return self._segment_circle_alphas(starts, deltas, centers, radii + BatchLidar.RAY_RADIUS) + np.where(
+            self._accepts(self._circle_shapes), 0.0, np.inf
+        )
+
+    def _query_polys(self, starts: np.ndarray, deltas: np.ndarray) -> np.ndarray:
+        """Alpha (0-1) along each ray where it first touches each polygon, inf if never."""
+        ray_count = len(starts)
+        alphas = np.full((ray_count, len(self._poly_shapes)), np.inf)
+
+        for index, shape in enumerate(self._poly_shapes):
+            vertices = np.array([shape.body.local_to_world(v) for v in shape.get_vertices()])
+            radius = shape.radius + BatchLidar.RAY_RADIUS
+            previous = np.roll(vertices, 1, axis=0)
+
+            # Faces (outward normals for counter-clockwise vertices)
+            edges = vertices - previous
+            normals = np.stack((edges[:, 1], -edges[:, 0]), axis=1)
+            normals /= np.linalg.norm(normals, axis=1)[:, None]
+            start_n = starts @ normals.T
+            end_n = (starts + deltas) @ normals.T
+            plane_n = np.sum(vertices * normals, axis=1)
+            d = start_n - plane_n[None, :] - radius
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = d / (start_n - end_n)
+            points = starts[:, None, :] + t[:, :, None] * deltas[:, None, :]
+            tangent = normals[None, :, 0] * points[:, :, 1] - normals[None, :, 1] * points[:, :, 0]
+            tangent_min = normals[:, 0] * previous[:, 1] - normals[:, 1] * previous[:, 0]
+            tangent_max = normals[:, 0] * vertices[:, 1] - normals[:, 1] * vertices[:, 0]
+            valid = (d >= 0) & (t >= 0) & (t <= 1) & (tangent >= tangent_min) & (tangent <= tangent_max)
+            face_alphas = np.where(valid, t, np.inf).min(axis=1)
+
+            # Rounded corners (also covers rays starting near a corner)
+            corner_alphas = self._segment_circle_alphas(starts, deltas, vertices, np.full(len(vertices), radius)).min(axis=1)
+
+            # Rays starting inside or near a face touch it immediately
+            face_dist = start_n - plane_n[None, :]
+            start_tangent = normals[None, :, 0] * starts[:, 1, None] - normals[None, :, 1] * starts[:, 0, None]
+            near_face = (face_dist <= radius) & (start_tangent >= tangent_min) & (start_tangent <= tangent_max)
+            inside = np.all(face_dist <= 0, axis=1)
+            overlapping = inside | np.any(near_face & (face_dist >= 0), axis=1)
+
+            alphas[:, index] = np.where(overlapping, 0.0, np.minimum(face_alphas, corner_alphas))
+
+        return alphas + np.where(self._accepts(self._poly_shapes), 0.0, np.inf)
+
+    @staticmethod
+    def _segment_circle_alphas(starts: np.ndarray, deltas: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Alpha (0-1) where each segment first touches each circle, inf if never.
+        Solves |start + t * delta - center| = radius for the smallest t. Like pymunk,
+        segments starting within the radius touch the circle at 0."""
+        to_start_x = starts[:, 0, None] - centers[None, :, 0]
+        to_start_y = starts[:, 1, None] - centers[None, :, 1]
+        qa = (deltas[:, 0] * deltas[:, 0] + deltas[:, 1] * deltas[:, 1])[:, None]
+        qb = to_start_x * deltas[:, 0, None] + to_start_y * deltas[:, 1, None]
+        qc = to_start_x * to_start_x + to_start_y * to_start_y - radii[None, :] ** 2
+        det = qb * qb - qa * qc
+        with np.errstate(invalid="ignore"):
+            t = (-qb - np.sqrt(det)) / qa
+        valid = (det >= 0) & (t >= 0) & (t <= 1)
+        return np.where(qc <= 0, 0.0, np.where(valid, t, np.inf))
@@ -0,0 +1,149 @@
+import math
+import numpy as np
+
+from engine.types import ILocationData, ILocationEvent, IWaypointData, LocationEventKind
+from engine.waypoints import WaypointGrid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.robot import RobotBase
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class LocationService:
+    """Where every robot is on the waypoint grid, computed once per frame for all robots.
+
+    Per robot: the grid cell and nearest waypoint (by grid arithmetic on the robot grid's
+    positions), the distance to that waypoint, and which registered regions (axis-aligned
+    bounds, the homebase among them) contain the robot's center.
+
+    Robots get events for the frame they:
+        - ARRIVED at a waypoint: came within their radius of a waypoint they were not at before
+        - ENTERED or EXITED a region
+
+    Updated at the start of each frame after the physics step, or on the first query. Robots
+    added or removed during a frame update it again, still against the previous frame.
+    """
+
+    def __init__(self, sim: "SimulationBase", grid: WaypointGrid):
+        self.sim = sim
+        self.grid = grid
+        self._frame = -1
+        self._generation = -1  # of the robot grid at the last update
+
+        # Regions by name, bounds as (left, bottom, right, top)
+        self.region_names: list[str] = []
+        self._region_bounds = np.zeros((0, 4))
+
+        # Per robot, in robot grid order at the last update
+        self._entity_ids = np.zeros(0, dtype=np.int64)
+        self._slots: dict[int, int] = {}  # entity id -> index in the arrays
+        self.positions = np.zeros((0, 2))
+        self.cells = np.zeros((0, 2), dtype=np.int64)
+        self.waypoint_ids = np.zeros(0, dtype=np.int64)
+        self.waypoint_distances = np.zeros(0)
+        self.inside = np.zeros((0, 0), dtype=bool)
+        self._at_waypoint = np.zeros(0, dtype=np.int64)  # within the robot's radius, or NO_NEIGHBOR
+        self._events: dict[int, list[ILocationEvent]] = {}  # by entity id, this frame only
+        # State of the previous frame, the events compare against it
+        self._previous = (self._entity_ids, self._at_waypoint, self.inside)
+
+        # The homebase waypoint controllers start from, the first in id order
+        homebase_ids = np.flatnonzero(grid.is_homebase)
+        self.home_waypoint: IWaypointData | None = grid.data[homebase_ids[0]] if len(homebase_ids) else None
+
+    def register_region(self, name: str, bounds: tuple[float, float, float, float]):
+        """Add or move a region, bounds as (left, bottom, right, top)"""
+        left, bottom, right, top = (float(value) for value in bounds)
+        if name in self.region_names:
+            self._region_bounds[self.region_names.index(name)] = (left, bottom, right, top)
+        else:
+            self.region_names.append(name)
+            self._region_bounds = np.vstack((self._region_bounds, (left, bottom, right, top)))
+            self.inside = np.zeros((len(self._entity_ids), len(self.region_names)), dtype=bool)
+            previous_ids, previous_at, _ = self._previous
+            self._previous = (previous_ids, previous_at, np.zeros((len(previous_ids), len(self.region_names)), dtype=bool))
+        self._generation = -1
+
+    def update(self):
+        """Locate all robots and gather the events of this frame"""
+        if self._frame != self.sim.frame_count:
+            self._previous = (self._entity_ids, self._at_waypoint, self.inside)
+        self._frame = self.sim.frame_count
+        robot_grid = self.sim.robot_grid
+        self._generation = robot_grid.generation
+        robot_grid.ensure_built()
+        positions = robot_grid.positions
+        grid = self.grid
+
+        cells = grid.nearest_cells(positions)
+        waypoint_ids = grid.grid_index(cells[:, 0], cells[:, 1])
+        delta = positions - grid.positions[waypoint_ids]
+        distances = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+        bounds = self._region_bounds
+        inside = (
+            (positions[:, None, 0] >= bounds[None, :, 0]) & (positions[:, None, 1] >= bounds[None, :, 1])
+            & (positions[:, None, 0] <= bounds[None, :, 2]) & (positions[:, None, 1] <= bounds[None, :, 3])
+        )
+        at_waypoint = np.where(distances < robot_grid.radii, waypoint_ids, WaypointGrid.NO_NEIGHBOR)
+
+        # Compare with the previous frame, by entity id when robots were added or removed
+        entity_ids = np.array([robot.entity_id for robot in robot_grid.robots], dtype=np.int64)
+        previous_ids, previous_at, previous_inside = self._previous
+        if not np.array_equal(entity_ids, previous_ids):
+            slots = {entity_id: slot for slot, entity_id in enumerate(previous_ids.tolist())}
+            known_at, known_inside = previous_at, previous_inside
+            previous_at = np.full(len(entity_ids), WaypointGrid.NO_NEIGHBOR, dtype=np.int64)
+            previous_inside = np.zeros(inside.shape, dtype=bool)
+            for index, entity_id in enumerate(entity_ids.tolist()):
+                slot = slots.get(entity_id)
+                if slot is not None:
+                    previous_at[index] = known_at[slot]
+                    previous_inside[index] = known_inside[slot]
+
+        self._events = {}
+        frame = self.sim.frame_count
+        arrived = (at_waypoint != WaypointGrid.NO_NEIGHBOR) & (at_waypoint != previous_at)
+        for index in np.flatnonzero(arrived).tolist():
+            event = ILocationEvent(LocationEventKind.ARRIVED, frame, waypoint_id=int(at_waypoint[index]))
+            self._events.setdefault(int(entity_ids[index]), []).append(event)
+        for kind, changed in ((LocationEventKind.ENTERED, inside & ~previous_inside), (LocationEventKind.EXITED, previous_inside & ~inside)):
+            for index, region in zip(*(axis.tolist() for axis in np.nonzero(changed))):
+                event = ILocationEvent(kind, frame, region=self.region_names[region])
+                self._events.setdefault(int(entity_ids[index]), []).append(event)
+
+        self._entity_ids = entity_ids
+        self._slots = {entity_id: index for index, entity_id in enumerate(entity_ids.tolist())}
+        self.positions = positions
+        self.cells, self.waypoint_ids, self.waypoint_distances = cells, waypoint_ids, distances
+        self.inside, self._at_waypoint = inside, at_waypoint
+
+    def _index(self, robot: "RobotBase") -> int:
+        if self._frame != self.sim.frame_count or self._generation != self.sim.robot_grid.generation:
+            self.update()
+        return self._slots[robot.entity_id]
+
+    def location(self, robot: "RobotBase") -> ILocationData:
+        index = self._index(robot)
+        return ILocationData(
+            cell=tuple(self.cells[index].tolist()),
+            waypoint_id=int(self.waypoint_ids[index]),
+            waypoint_distance=float(self.waypoint_distances[index]),
+            regions=tuple(name for name, inside in zip(self.region_names, self.inside[index].tolist()) if inside),
+        )
+
+    def is_inside(self, robot: "RobotBase", region: str) -> bool:
+        return bool(self.inside[self._index(robot), self.region_names.index(region)])
+
+    def is_near(self, robot: "RobotBase", waypoint: IWaypointData, threshold: float) -> bool:
+        """Whether the robot is closer than threshold to the waypoint. Within half the waypoint
+        distance only the nearest waypoint can be that close, so this is a lookup."""
+        index = self._index(robot)
+        if 2 * threshold <= self.grid.distance:
+            return bool(self.waypoint_ids[index] == waypoint.id and self.waypoint_distances[index] < threshold)
+        x, y = self.positions[index].tolist()
+        return math.sqrt((waypoint.position.x - x) ** 2 + (waypoint.position.y - y) ** 2) < threshold
+
+    def events(self, robot: "RobotBase") -> list[ILocationEvent]:
+        """Events of this frame"""
+        self._index(robot)
+        return self._events.get(robot.entity_id, [])
@@ -0,0 +1,118 @@
+from enum import IntEnum
+import numpy as np
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.robot import RobotBase
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class MessageKind(IntEnum):
+    RETRIEVE_PATH = 1
+
+
+class BusMessage:
+    """Typed radio message: a kind, an integer qualifier and an array of waypoint ids.
+    Messages are immutable, so a sender keeps sending the same object until its content changes.
+
+    Messages from MessageBus.intern are unique per content while they are interned, so two of
+    them are equal exactly when they are the same object. Their version tells the contents
+    with the same kind and qualifier apart (0 for messages that are not interned)."""
+
+    __slots__ = ("kind", "qualifier", "waypoint_ids", "length", "version")
+
+    def __init__(self, kind: int, qualifier: int = 0, waypoint_ids=(), version: int = 0):
+        self.kind = int(kind)
+        self.qualifier = int(qualifier)
+        self.waypoint_ids = np.array(waypoint_ids, dtype=np.int32)
+        self.waypoint_ids.flags.writeable = False
+        self.length = len(self.waypoint_ids)
+        self.version = version
+
+    def __len__(self) -> int:
+        return self.length
+
+    def same_content(self, other: "BusMessage") -> bool:
+        return (
+            self.kind == other.kind
+            and self.qualifier == other.qualifier
+            and np.array_equal(self.waypoint_ids, other.waypoint_ids)
+        )
+
+    def __repr__(self) -> str:
+        return f"BusMessage({self.kind}, {self.qualifier}, {self.waypoint_ids.tolist()}, version={self.version})"
+
+
+class MessageBus:
+    """Range-limited delivery of typed messages, alongside the string messages of the robots.
+
+    The messages sent are published at the start of each frame, before the robots' preupdate,
+    like the string messages that are exchanged in preupdate. As with those, a robot receives
+    the messages of the robots within its comms range while it is sending one itself. The
+    inbox is only gathered when the robot asks for it, at most once per frame.
+
+    Interned messages that no robot is sending anymore are dropped when the next frame is
+    published, so the tables hold at most one message per sending robot. Versions of a kind
+    and qualifier start over once none of its messages are left.
+    """
+
+    def __init__(self, sim: "SimulationBase"):
+        self.sim = sim
+        self._outboxes: dict[int, BusMessage] = {}  # by entity id, sent messages
+        self._published: dict[int, BusMessage] = {}  # snapshot of the outboxes for this frame
+        self._inboxes: dict[int, list[BusMessage]] = {}
+        self._frame = -1
+        # Interned messages by content, and the last version per kind and qualifier
+        self._interned: dict[tuple, BusMessage] = {}
+        self._versions: dict[tuple[int, int], int] = {}
+
+    def intern(self, kind: int, qualifier: int, waypoint_ids) -> BusMessage:
+        """The one message with this content, created the first time it is asked for"""
+        key = (int(kind), int(qualifier), tuple(waypoint_ids))
+        message = self._interned.get(key)
+        if message is None:
+            version = self._versions.get(key[:2], 0) + 1
+            self._versions[key[:2]] = version
+            message = self._interned[key] = BusMessage(kind, qualifier, key[2], version=version)
+        return message
+
+    def send(self, robot: "RobotBase", message: BusMessage | None):
+        if message is None:
+            self._outboxes.pop(robot.entity_id, None)
+        else:
+            self._outboxes[robot.entity_id] = message
+
+    def sent(self, robot: "RobotBase") -> BusMessage | None:
+        return self._outboxes.get(robot.entity_id)
+
+    def remove_robot(self, robot: "RobotBase"):
+        self._outboxes.pop(robot.entity_id, None)
+        self._published.pop(robot.entity_id, None)
+
+    def publish(self):
+        """Make the messages sent so far visible to the receivers of this frame"""
+        self._frame = self.sim.frame_count
+        self._published = self._outboxes.copy()
+        self._inboxes.clear()
+        if len(self._interned) > len(self._outboxes):
+            self._evict()
+
+    def _evict(self):
+        """Drop the interned messages that are not being sent"""
+        sent = {id(message) for message in self._outboxes.values()}
+        self._interned = {key: message for key, message in self._interned.items() if id(message) in sent}
+        live = {key[:2] for key in self._interned}
+        self._versions = {key: version for key, version in self._versions.items() if key in live}
+
+    def receive(self, robot: "RobotBase") -> list[BusMessage]:
+        """Messages of the robots in range, if the robot was sending when they were published"""
+        if self._frame != self.sim.frame_count or robot.entity_id not in self._published:
+            return []
+        inbox = self._inboxes.get(robot.entity_id)
+        if inbox is None:
+            grid = self.sim.robot_grid
+            indices, _ = grid.query(robot, robot._comms_range)
+            robots = grid.robots
+            published = self._published
+            inbox = [published[entity_id] for entity_id in (robots[index].entity_id for index in indices.tolist()) if entity_id in published]
+            self._inboxes[robot.entity_id] = inbox
+        return inbox
@@ -43,9 +43,12 @@ class DcMotor(IMotor):
         self.max_force = self._to_robot_force(motor_torque=max_torque)
         # self.max_voltage = max_voltage
         self._wheel_prev_pos = self.body.local_to_world(self.wheel_position)
-        self._wheel_speed = AngularSpeed.in_base_unit(0.0)
+        # Per frame state is kept as plain floats in the base units, see the properties below
+        self._wheel_speed__rad_frame = 0.0
         self._back_emf__v = 0.0
-        self._force = Force.in_base_unit(0.0)
+        self._force__dyne = 0.0
+        self._amps = 0.0
+        self._volts = 0.0
         self._explanation_points = []
 
         self.ke = DcMotorAssumptions.KE / AngularSpeed.in_krpm(1).rad_s  # Convert to V/(rad/s)
@@ -59,27 +62,48 @@ class DcMotor(IMotor):
             self.wheel_position[1] * 0.9,
         )
 
+    @property
+    def _force(self) -> Force:
+        return Force.in_base_unit(self._force__dyne)
+
+    @_force.setter
+    def _force(self, force: Force):
+        self._force__dyne = force.base_unit
+
+    @property
+    def _wheel_speed(self) -> AngularSpeed:
+        return AngularSpeed.in_base_unit(self._wheel_speed__rad_frame)
+
+    @_wheel_speed.setter
+    def _wheel_speed(self, wheel_speed: AngularSpeed):
+        self._wheel_speed__rad_frame = wheel_speed.base_unit
+
     @override
     def request_force(self, force: Force) -> None:
         """Requests a force (N) to be applied to the wheel.
         The force is applied at the wheel position during the postupdate phase.
         """
-        if not self.unrestricted_force:
-            force = max(-self.max_force, min(self.max_force, force))
-        self._force = force
+        self._request_force__dyne(force.base_unit)
 
     @override
     def request_force_scaled(self, force_scaler: float) -> None:
         """Requests a to be applied to the wheel from a value of -1 to 1.
         The force is applied at the wheel position during the postupdate phase.
         """
-        self.request_force(force=self.max_force * force_scaler)
+        self._request_force__dyne(self.max_force.base_unit * force_scaler)
+
+    def _request_force__dyne(self, force: float) -> None:
+        if not self.unrestricted_force:
+            max_force = self.max_force.base_unit
+            force = max(-max_force, min(max_force, force))
+        self._force__dyne = force
 
     @override
     def preupdate(self):
-        self._explain(lambda: f"1 timestep = 1/{TimeSpan.in_second(1).base_unit:.0f}s")
-        self._explain(lambda: f"Max force: {self.max_force.n:.2f}N")
-        self._explain(lambda: f"Gear ratio: {self._gear_ratio}:1")
+        if self.print_math:
+            self._explain(lambda: f"1 timestep = 1/{TimeSpan.in_second(1).base_unit:.0f}s")
+            self._explain(lambda: f"Max force: {self.max_force.n:.2f}N")
+            self._explain(lambda: f"Gear ratio: {self._gear_ratio}:1")
         self._calc_motor_speed()
         self._calc_back_emf()
 
@@ -117,19 +141,21 @@ class DcMotor(IMotor):
         """Applies the force to the wheel based on the requested force.
         The force is applied at the wheel position.
         """
-        requested_torque = self._to_motor_torque(force=self._force)
-        self._explain(lambda: f"Requested force: {self._force.n:.2f}N at wheel radius {self.wheel_radius.m:.2f}m -> torque: {requested_torque.nm:.2f}Nm")
-        amps = self._calc_required_amps(t=requested_torque)
+        requested_torque__nm = self._to_motor_torque__nm(force__dyne=self._force__dyne)
+        self._explain(lambda: f"Requested force: {self._force.n:.2f}N at wheel radius {self.wheel_radius.m:.2f}m -> torque: {requested_torque__nm:.2f}Nm")
+        amps = self._calc_required_amps__nm(torque__nm=requested_torque__nm)
         volts = self._calc_volts_to_achieve_amps(amps=amps)
         # self._explain(lambda: f"Capping voltage {volts:.2f}V to max voltage {self.max_voltage:.2f}V")
         # volts = min(volts, self.max_voltage)
+        self._amps = amps
+        self._volts = volts
         got_power = self.battery.draw_power(volts=volts, amps=amps)
 
         if got_power:
             # Forward force
-            force = self._force.base_unit * self.motor_force_scaler
+            force = self._force__dyne * self.motor_force_scaler
             force_vector = (force, 0)
-            self._explain(lambda: f"Applying force: {self._force.n:.2f}N, meaning torque: {requested_torque.nm:.2f}Nm")
+            self._explain(lambda: f"Applying force: {self._force.n:.2f}N, meaning torque: {requested_torque__nm:.2f}Nm")
             self.body.apply_force_at_local_point(force=force_vector, point=self.wheel_position)
 
     def _calc_motor_speed(self):
@@ -147,9 +173,9 @@ class DcMotor(IMotor):
 
         # Calculates the wheel speed in rad/timestep
         if dist_in_direction == 0:
-            self._wheel_speed = AngularSpeed.in_base_unit(0.0)
+            self._wheel_speed__rad_frame = 0.0
         else:
-            self._wheel_speed = AngularSpeed.in_base_unit((self._gear_ratio * dist_in_direction) / self.wheel_radius.base_unit)
+            self._wheel_speed__rad_frame = (self._gear_ratio * dist_in_direction) / self.wheel_radius.base_unit
         self._explain(lambda: f"With wheel radius of {self.wheel_radius.to_str(Distance.CM, 1)} and gear raio {self._gear_ratio}:1, motor speed: {self._wheel_speed.to_str(AngularSpeed.RAD_S, 1)} or {self._wheel_speed.to_str(AngularSpeed.RPM, 1)}")
 
     def _calc_back_emf(self):
@@ -161,7 +187,7 @@ class DcMotor(IMotor):
             kE = back EMF constant (V/(rad/s))
             ω = wheel speed (rad/s)
         """
-        self._back_emf__v = self.ke * self._wheel_speed.rad_s
+        self._back_emf__v = self.ke * AngularSpeed.RAD_S.to_unit(self._wheel_speed__rad_frame)
         self._explain(lambda: f"Given the motors kE {self.ke:.2f}V/(rad/s) and the wheel speed {self._wheel_speed.to_str(AngularSpeed.RAD_S, 2)} or {self._wheel_speed.to_str(AngularSpeed.RPM, 2)} the back EMF is {self._back_emf__v:.2f}V.")
 
     def _calc_required_amps(self, t: Torque) -> float:
@@ -173,11 +199,14 @@ class DcMotor(IMotor):
             T = torque (Nm)
             kT = torque constant (Nm/A)
         """
-        if t.base_unit == 0:
+        return self._calc_required_amps__nm(torque__nm=t.nm)
+
+    def _calc_required_amps__nm(self, torque__nm: float) -> float:
+        if torque__nm == 0:
             self._explain(lambda: "Torque is zero, no amps required.")
             return 0.0
-        amps = t.nm / self.kt
-        self._explain(lambda: f"To achieve torque: {t.nm:.2f}Nm with the motor's torque constant {self.kt:.2f}Nm/A requires {amps:.2f}A")
+        amps = torque__nm / self.kt
+        self._explain(lambda: f"To achieve torque: {torque__nm:.2f}Nm with the motor's torque constant {self.kt:.2f}Nm/A requires {amps:.2f}A")
         return amps
 
     def _calc_volts_to_achieve_amps(self, amps: float) -> float:
@@ -219,7 +248,9 @@ class DcMotor(IMotor):
             r = wheel radius (m)
             G = gear ratio (dimensionless)
         """
-        if force.base_unit == 0:
-            return Torque.in_nm(0.0)
-        torque = (force.n * self.wheel_radius.m) / self._gear_ratio
-        return Torque.in_nm(torque)
+        return Torque.in_nm(self._to_motor_torque__nm(force__dyne=force.base_unit))
+
+    def _to_motor_torque__nm(self, force__dyne: float) -> float:
+        if force__dyne == 0:
+            return 0.0
+        return (Force.N.to_unit(force__dyne) * self.wheel_radius.m) / self._gear_ratio
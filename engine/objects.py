@@ -9,6 +9,9 @@ if TYPE_CHECKING: from engine.simulation import SimulationBase
 
 
 class IGameObject:
+    # Scenery never moves and is drawn once onto the cached background layer
+    is_scenery: bool = False
+
     def __init__(
         self,
         body: pymunk.Body,
@@ -22,6 +25,7 @@ class IGameObject:
         self.density = density
         self.virtual_height = virtual_height
         self.sim: "SimulationBase" = sim
+        self.entity_id: int | None = None
         if self.sim is not None:
             self.sim.add_game_object(self)
 
@@ -31,7 +35,11 @@ class IGameObject:
 
     @property
     def has_update(self):
-        return getattr(self.__class__, "update") is not getattr(IGameObject, "update")
+        return self.overrides("update")
+
+    def overrides(self, method_name: str) -> bool:
+        """Whether the object's class overrides the given IGameObject method"""
+        return getattr(self.__class__, method_name) is not getattr(IGameObject, method_name)
 
     def preupdate(self):
         pass
@@ -45,6 +53,10 @@ class IGameObject:
     def draw(self, surface: Surface):
         raise NotImplementedError()
 
+    def draw_bounds(self) -> pymunk.BB | None:
+        """World-space area covered by draw, or None if it cannot be bounded"""
+        return self.shape.bb
+
     def distance_to_obj_center(self, obj):
         return self.body.position.get_distance(obj.body.position)
 
@@ -0,0 +1,52 @@
+import numpy as np
+
+from engine.waypoints import WaypointGrid
+
+
+class PheromoneField:
+    """World-level pheromone field over the waypoint grid, one NumPy row per channel.
+
+    Robots deposit onto a waypoint and read it back by id, so both are O(1) and the memory
+    does not grow with the run. Every Nth frame each channel evaporates in one step, keeping
+    1 - rate of its amount; a rate of 0 keeps a plain visit count.
+    """
+
+    def __init__(self, grid: WaypointGrid, channels: dict[str, float], every: int = 1):
+        self.grid = grid
+        self.every = max(1, every)
+        self.channels: dict[str, int] = {name: index for index, name in enumerate(channels)}
+        self.rates = np.array([float(rate) for rate in channels.values()])
+        if np.any((self.rates < 0) | (self.rates > 1)):
+            raise ValueError(f"evaporation rates must be between 0 and 1, got {self.rates.tolist()}")
+        self._retention = (1.0 - self.rates)[:, None]
+        self._evaporates = bool(np.any(self.rates > 0))
+        self.values = np.zeros((len(self.channels), len(grid)))
+
+        # Neighbor lookups, amounts of missing neighbors read as NaN
+        self._neighbors = grid.neighbors
+        self._missing = grid.neighbors == WaypointGrid.NO_NEIGHBOR
+
+    def channel(self, name: str) -> int:
+        try:
+            return self.channels[name]
+        except KeyError:
+            raise KeyError(f"unknown pheromone channel {name!r}, the field has {list(self.channels)}") from None
+
+    def deposit(self, channel: str, waypoint_id: int, amount: float = 1.0):
+        self.values[self.channel(channel), waypoint_id] += amount
+
+    def read(self, channel: str, waypoint_id: int) -> float:
+        return float(self.values[self.channel(channel), waypoint_id])
+
+    def read_neighbors(self, channel: str, waypoint_id: int) -> np.ndarray:
+        """Amounts at the neighbors of a waypoint, in WaypointGrid.DIRECTIONS order"""
+        amounts = self.values[self.channel(channel), self._neighbors[waypoint_id]]
+        amounts[self._missing[waypoint_id]] = np.nan
+        return amounts
+
+    def evaporate(self):
+        if self._evaporates:
+            self.values *= self._retention
+
+    def clear(self):
+        self.values.fill(0.0)
@@ -0,0 +1,182 @@
+import numpy as np
+from pymunk import Vec2d
+
+from engine.battery import Battery
+from engine.motor import DcMotor
+from sim_math.units import AngularSpeed, Force
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.robot import RobotBase
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class FleetPowertrain:
+    """Swarm-level power train. Steps the DcMotors and Battery of all robots in NumPy arrays,
+    instead of two motor objects and a battery per robot.
+
+    Follows DcMotor and Battery.draw_power step by step:
+        - wheel speed from the distance the wheel moved along the heading, times the gear ratio
+        - back EMF E = kE * ω, current I = T / kT, voltage V = I * R + E
+        - energy drawn from the battery, the left motor before the right one
+        - the requested force applied at the wheel when the battery delivered the power
+
+    The layout (and the motor and battery settings) is gathered when robots are added or
+    removed. Robots with a motor that has print_math on at that time, or with other motor or
+    battery types, keep stepping their own components, so their explanations are printed.
+    The wheel speed, back EMF, current, voltage and battery energy accounting are written
+    back to the objects each frame.
+    """
+
+    def __init__(self, sim: "SimulationBase"):
+        self.sim = sim
+        self._robots: dict[int, "RobotBase"] = {}  # by entity id
+        self._dirty = True
+        self.robots: list["RobotBase"] = []  # stepped in batch, in slot order
+
+        # Motors, the left motors of all robots followed by the right motors
+        self._motors: list[DcMotor] = []
+        self._wheel_positions = np.zeros((0, 2))
+        self._wheel_prev_positions = np.zeros((0, 2))
+        self._wheel_radii__cm = np.zeros(0)
+        self._wheel_radii__m = np.zeros(0)
+        self._gear_ratios = np.zeros(0)
+        self._ke = np.zeros(0)
+        self._kt = np.zeros(0)
+        self._resistances = np.zeros(0)
+        self._force_scalers = np.zeros(0)
+
+        # Batteries, one per robot
+        self._batteries: list[Battery] = []
+        self._capacities__wh = np.zeros(0)
+        self._power_draw_scalers = np.zeros(0)
+        self._infinite_power = np.zeros(0, dtype=bool)
+
+        # Per frame state, one entry per motor
+        self.wheel_speeds__rad_frame = np.zeros(0)
+        self.back_emf__v = np.zeros(0)
+        self.amps = np.zeros(0)
+        self.volts = np.zeros(0)
+        self.energy__wh = np.zeros(0)
+        self.powered = np.zeros(0, dtype=bool)
+
+    def add_robot(self, robot: "RobotBase"):
+        if robot.entity_id not in self._robots:
+            self._robots[robot.entity_id] = robot
+            self._dirty = True
+
+    def remove_robot(self, robot: "RobotBase"):
+        if self._robots.get(robot.entity_id) is robot:
+            del self._robots[robot.entity_id]
+            self._dirty = True
+
+    @staticmethod
+    def _batchable(robot: "RobotBase") -> bool:
+        motors = (robot.motor_l, robot.motor_r)
+        return (
+            type(robot.battery) is Battery
+            and all(type(motor) is DcMotor and motor.battery is robot.battery for motor in motors)
+            and not any(motor.print_math for motor in motors)
+        )
+
+    def _build(self):
+        # Hand the state of the previous layout back to the objects before gathering it again
+        self._write_back(wheel_positions=True)
+
+        self.robots = [robot for robot in self._robots.values() if self._batchable(robot)]
+        for robot in self._robots.values():
+            batched = (robot.motor_l, robot.motor_r) if robot in self.robots else ()
+            robot._stepped_components = [component for component in robot.components if component not in batched]
+
+        self._motors = [robot.motor_l for robot in self.robots] + [robot.motor_r for robot in self.robots]
+        self._wheel_positions = np.array([tuple(motor.wheel_position) for motor in self._motors], dtype=float).reshape(-1, 2)
+        self._wheel_prev_positions = np.array([tuple(motor._wheel_prev_pos) for motor in self._motors], dtype=float).reshape(-1, 2)
+        self._wheel_radii__cm = np.array([motor.wheel_radius.base_unit for motor in self._motors], dtype=float)
+        self._wheel_radii__m = np.array([motor.wheel_radius.m for motor in self._motors], dtype=float)
+        self._gear_ratios = np.array([motor._gear_ratio for motor in self._motors], dtype=float)
+        self._ke = np.array([motor.ke for motor in self._motors], dtype=float)
+        self._kt = np.array([motor.kt for motor in self._motors], dtype=float)
+        self._resistances = np.array([motor.resistance for motor in self._motors], dtype=float)
+        self._force_scalers = np.array([motor.motor_force_scaler for motor in self._motors], dtype=float)
+
+        self._batteries = [robot.battery for robot in self.robots]
+        self._capacities__wh = np.array([battery.capacity__wh for battery in self._batteries], dtype=float)
+        self._power_draw_scalers = np.array([battery.power_draw_scaler for battery in self._batteries], dtype=float)
+        self._infinite_power = np.array([battery.infinite_power for battery in self._batteries], dtype=bool)
+
+        self.wheel_speeds__rad_frame = np.array([motor._wheel_speed__rad_frame for motor in self._motors], dtype=float)
+        self.back_emf__v = np.array([motor._back_emf__v for motor in self._motors], dtype=float)
+        motor_count = len(self._motors)
+        self.amps = np.zeros(motor_count)
+        self.volts = np.zeros(motor_count)
+        self.energy__wh = np.zeros(motor_count)
+        self.powered = np.zeros(motor_count, dtype=bool)
+        self._dirty = False
+
+    def _write_back(self, wheel_positions: bool = False):
+        for motor, wheel_speed, back_emf in zip(self._motors, self.wheel_speeds__rad_frame.tolist(), self.back_emf__v.tolist()):
+            motor._wheel_speed__rad_frame = wheel_speed
+            motor._back_emf__v = back_emf
+        for motor, amps, volts in zip(self._motors, self.amps.tolist(), self.volts.tolist()):
+            motor._amps = amps
+            motor._volts = volts
+        if wheel_positions:
+            for motor, (x, y) in zip(self._motors, self._wheel_prev_positions.tolist()):
+                motor._wheel_prev_pos = Vec2d(x, y)
+
+    def preupdate(self):
+        """Wheel speeds and back EMF of all motors, see DcMotor._calc_motor_speed and _calc_back_emf"""
+        if self._dirty:
+            self._build()
+        if not self.robots:
+            return
+
+        poses = np.array([(r.body.position.x, r.body.position.y, r.body.angle) for r in self.robots]).reshape(-1, 3)
+        poses = np.concatenate((poses, poses))  # left and right motors
+        cos, sin = np.cos(poses[:, 2]), np.sin(poses[:, 2])
+
+        # Body.local_to_world of the wheel positions
+        wheel_x = poses[:, 0] + self._wheel_positions[:, 0] * cos - self._wheel_positions[:, 1] * sin
+        wheel_y = poses[:, 1] + self._wheel_positions[:, 0] * sin + self._wheel_positions[:, 1] * cos
+        dist_in_direction = (wheel_x - self._wheel_prev_positions[:, 0]) * cos + (wheel_y - self._wheel_prev_positions[:, 1]) * sin
+        self._wheel_prev_positions = np.stack((wheel_x, wheel_y), axis=1)
+
+        self.wheel_speeds__rad_frame = np.where(dist_in_direction == 0, 0.0, (self._gear_ratios * dist_in_direction) / self._wheel_radii__cm)
+        self.back_emf__v = self._ke * (self.wheel_speeds__rad_frame * AngularSpeed.RAD_S.value_in_base_unit)
+
+    def update(self):
+        """Currents, voltages, battery draw and forces of all motors, see DcMotor._apply_force"""
+        if not self.robots:
+            return
+
+        # Forces requested by the controllers this frame
+        forces__dyne = np.array([motor._force__dyne for motor in self._motors], dtype=float)
+        torques__nm = np.where(forces__dyne == 0, 0.0, (forces__dyne * Force.N.value_in_base_unit * self._wheel_radii__m) / self._gear_ratios)
+        self.amps = np.where(torques__nm == 0, 0.0, torques__nm / self._kt)
+        self.volts = self.amps * self._resistances + self.back_emf__v
+
+        # Battery.draw_power, the left motors draw before the right ones
+        remaining__wh = np.array([battery.remaining__wh for battery in self._batteries], dtype=float)
+        requested__wh = (self.volts * self.amps) / self.sim.meta.hour_to_frames
+        requested__wh *= np.concatenate((self._power_draw_scalers, self._power_draw_scalers))
+        count = len(self.robots)
+        for side in (slice(0, count), slice(count, 2 * count)):
+            powered = self._infinite_power | (requested__wh[side] <= remaining__wh)
+            draws = powered & ~self._infinite_power
+            remaining__wh = np.where(draws, np.minimum(remaining__wh - requested__wh[side], self._capacities__wh), remaining__wh)
+            self.powered[side] = powered
+        self.energy__wh = np.where(self.powered, requested__wh, 0.0)
+
+        drawn__wh = (self.energy__wh[:count] + self.energy__wh[count:]).tolist()
+        failed_draws = (~self.powered).reshape(2, count).sum(axis=0).tolist()
+        for battery, remaining, drawn, failed in zip(self._batteries, remaining__wh.tolist(), drawn__wh, failed_draws):
+            battery.remaining__wh = remaining
+            battery.drawn__wh += drawn
+            battery.failed_draws += failed
+        self._write_back()
+
+        # Forward force at the wheels that got power
+        applied = forces__dyne * self._force_scalers
+        pushing = self.powered & (applied != 0)
+        for index, force in zip(np.flatnonzero(pushing).tolist(), applied[pushing].tolist()):
+            motor = self._motors[index]
+            motor.body.apply_force_at_local_point(force=(force, 0), point=motor.wheel_position)
@@ -0,0 +1,101 @@
+import threading
+from collections import defaultdict, deque
+from time import perf_counter
+
+
+class FrameProfiler:
+    """Times every frame phase, broken down by what ran in it (object type, component type,
+    controller class). Objects are instrumented by wrapping their bound methods, so a
+    simulation without a profiler runs the plain methods and pays nothing.
+
+    Times are exclusive: a robot's update time does not include the controller and motors it
+    calls, those are reported under their own names. Keys are (phase, name).
+    """
+
+    def __init__(self, history: int = 600):
+        self.frames = 0
+        self.totals: dict[tuple[str, str], float] = defaultdict(float)
+        self.calls: dict[tuple[str, str], int] = defaultdict(int)
+        self.max_frame: dict[tuple[str, str], float] = defaultdict(float)
+        self.last_frame: dict[tuple[str, str], float] = {}
+        # Total time per phase for the most recent frames
+        self.phase_history: deque[dict[str, float]] = deque(maxlen=history)
+        self._frame: dict[tuple[str, str], float] = defaultdict(float)
+        # The physics and render loops may run on different threads
+        self._local = threading.local()
+
+    def _state(self):
+        local = self._local
+        if not hasattr(local, "stack"):
+            local.stack = []
+            local.phase = "other"
+        return local
+
+    def call(self, phase: str, name: str, func, *args):
+        """Call func under the given phase, timing it as name"""
+        state = self._state()
+        previous_phase, state.phase = state.phase, phase
+        try:
+            return self._timed(state, name, func, args)
+        finally:
+            state.phase = previous_phase
+
+    def _timed(self, state, name: str, func, args, kwargs=None):
+        state.stack.append(0.0)
+        start = perf_counter()
+        try:
+            return func(*args, **(kwargs or {}))
+        finally:
+            elapsed = perf_counter() - start
+            children = state.stack.pop()
+            if state.stack:
+                state.stack[-1] += elapsed
+            key = (state.phase, name)
+            self._frame[key] += elapsed - children
+            self.calls[key] += 1
+
+    def wrap(self, name: str, func):
+        """Timed version of func, recorded under the phase it is called in"""
+        def timed(*args, **kwargs):
+            return self._timed(self._state(), name, func, args, kwargs)
+        return timed
+
+    def instrument(self, obj, methods: tuple[str, ...], name: str | None = None):
+        """Replace the given methods of obj with timed versions"""
+        name = name or type(obj).__name__
+        for method in methods:
+            setattr(obj, method, self.wrap(name, getattr(obj, method)))
+
+    def end_frame(self):
+        """Close the current physics frame. Draw time from the render thread is counted in
+        the frame during which it was recorded."""
+        frame, self._frame = self._frame, defaultdict(float)
+        self.frames += 1
+        phases = defaultdict(float)
+        for key, elapsed in frame.items():
+            self.totals[key] += elapsed
+            self.max_frame[key] = max(self.max_frame[key], elapsed)
+            phases[key[0]] += elapsed
+        self.last_frame = dict(frame)
+        self.phase_history.append(dict(phases))
+
+    def get_stats(self) -> dict[str, dict[str, dict]]:
+        """{phase: {name: {total_s, calls, mean_frame_ms, max_frame_ms}}}, slowest first"""
+        stats: dict[str, dict[str, dict]] = defaultdict(dict)
+        for (phase, name), total in sorted(self.totals.items(), key=lambda item: -item[1]):
+            stats[phase][name] = {
+                "total_s": total,
+                "calls": self.calls[(phase, name)],
+                "mean_frame_ms": total / max(self.frames, 1) * 1000,
+                "max_frame_ms": self.max_frame[(phase, name)] * 1000,
+            }
+        return dict(stats)
+
+    def report(self) -> str:
+        lines = [f"{self.frames} frames"]
+        for phase, names in self.get_stats().items():
+            phase_total = sum(entry["total_s"] for entry in names.values())
+            lines.append(f"{phase:12} {phase_total / max(self.frames, 1) * 1000:8.3f} ms/frame")
+            for name, entry in names.items():
+                lines.append(f"  {name:28} {entry['mean_frame_ms']:8.3f} ms/frame  max {entry['max_frame_ms']:7.3f} ms  {entry['calls']} calls")
+        return "\n".join(lines)
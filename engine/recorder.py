@@ -0,0 +1,71 @@
+import json
+import os
+import pygame
+
+from engine.renderer import Renderer
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class FrameRecorder:
+    """Records a simulation offscreen, without a window and without realtime pacing.
+
+    Every Nth physics frame is drawn onto a pygame.Surface at the simulation's resolution,
+    scaled to the requested size and written either as a PNG sequence (frame_000000.png,
+    ...) or as one raw RGB24 stream (frames.rgb) with a frames.json header, e.g. for
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS -i frames.rgb out.mp4
+    """
+
+    FORMATS = ("png", "raw")
+
+    def __init__(self, sim: "SimulationBase", path: str, every: int = 1, size: tuple[int, int] | None = None, format: str = "png"):
+        if format not in FrameRecorder.FORMATS:
+            raise ValueError(f"Unknown recording format {format}, expected one of {FrameRecorder.FORMATS}")
+        self.sim = sim
+        self.path = path
+        self.every = max(1, every)
+        self.size = size or (sim.pixels_x, sim.pixels_y)
+        self.format = format
+        self.frames_written = 0
+
+        # Offscreen drawing needs fonts but no display
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.surface = pygame.Surface((sim.pixels_x, sim.pixels_y))
+        self.renderer = Renderer(sim)
+
+        os.makedirs(path, exist_ok=True)
+        self._stream = open(os.path.join(path, "frames.rgb"), "wb") if format == "raw" else None
+        sim.recorder = self
+
+    def capture(self):
+        self.sim.draw_frame(self.surface, self.renderer)
+        frame = self.surface if self.size == self.surface.get_size() else pygame.transform.smoothscale(self.surface, self.size)
+        if self._stream is not None:
+            self._stream.write(pygame.image.tobytes(frame, "RGB"))
+        else:
+            pygame.image.save(frame, os.path.join(self.path, f"frame_{self.frames_written:06d}.png"))
+        self.frames_written += 1
+
+    def close(self):
+        """Stop recording and finish the raw stream header"""
+        if self.sim.recorder is self:
+            self.sim.recorder = None
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            header = {
+                "width": self.size[0],
+                "height": self.size[1],
+                "pixel_format": "rgb24",
+                "fps": self.sim.fps / self.every,
+                "frames": self.frames_written,
+            }
+            with open(os.path.join(self.path, "frames.json"), "w") as file:
+                json.dump(header, file, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,105 @@
+from functools import lru_cache
+import pygame
+import pymunk
+
+from engine.objects import IGameObject
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, system: bool = True) -> pygame.font.Font:
+    """Default font (system or pygame's own) of the given size, created once"""
+    return pygame.font.SysFont(None, size) if system else pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=1024)
+def render_text(text: str, size: int, color: tuple, system: bool = True) -> pygame.Surface:
+    """Rendered text surface, reused while the same text is shown"""
+    return get_font(size, system).render(text, True, color)
+
+
+def clear_font_cache():
+    # Fonts and text surfaces are invalid after pygame.quit()
+    render_text.cache_clear()
+    get_font.cache_clear()
+
+
+class Renderer:
+    """Draws a simulation frame. Scenery that never moves (background, waypoints, homebase)
+    is pre-rendered onto a cached surface that is rebuilt only when the camera or screen
+    changes. Moving objects are drawn on top each frame and only the screen regions they
+    cover (this frame and last frame) are pushed to the display."""
+
+    # Above this many dirty regions a full display update is cheaper
+    MAX_DIRTY_RECTS = 300
+
+    def __init__(self, sim: "SimulationBase"):
+        self.sim = sim
+        self._static: pygame.Surface | None = None
+        self._static_key = None
+        self._rects: list[pygame.Rect] = []
+        self._previous_rects: list[pygame.Rect] = []
+        self._full_update = True
+        # Something without bounds was drawn this frame or last frame
+        self._unbounded = False
+        self._previous_unbounded = False
+
+    def invalidate(self):
+        """Rebuild the scenery layer on the next frame"""
+        self._static_key = None
+
+    def _camera_key(self, surface: pygame.Surface):
+        meta = self.sim.meta
+        return tuple(meta.camera_offset), meta.camera_scale, surface.get_size(), self.sim.scenery_version
+
+    def _build_static(self, surface: pygame.Surface):
+        self._static = pygame.Surface(surface.get_size())
+        if pygame.display.get_surface() is not None:
+            self._static = self._static.convert()  # faster blits to the display
+        self._static.fill(self.sim.background_color)
+        for obj in list(self.sim._scenery.values()):
+            obj.draw(self._static)
+        if self.sim.environment:
+            self.sim.environment.draw(self._static)
+
+    def begin_frame(self, surface: pygame.Surface):
+        """Start the frame from the scenery layer"""
+        key = self._camera_key(surface)
+        if key != self._static_key:
+            self._build_static(surface)
+            self._static_key = key
+            self._full_update = True
+        surface.blit(self._static, (0, 0))
+        self._rects = []
+
+    def mark(self, rect: pygame.Rect | None):
+        """Mark a screen region as changed. None means the whole screen."""
+        if rect is None:
+            self._unbounded = True
+        else:
+            self._rects.append(rect)
+
+    def mark_world_bb(self, bb: pymunk.BB | None, surface: pygame.Surface, padding: int = 2):
+        if bb is None:
+            self.mark(None)
+            return
+        left, top = self.sim.meta.pymunk_to_pygame_point((bb.left, bb.top), surface)
+        right, bottom = self.sim.meta.pymunk_to_pygame_point((bb.right, bb.bottom), surface)
+        self.mark(pygame.Rect(left, top, right - left, bottom - top).inflate(2 * padding, 2 * padding))
+
+    def draw_object(self, obj: IGameObject, surface: pygame.Surface):
+        obj.draw(surface)
+        self.mark_world_bb(obj.draw_bounds(), surface)
+
+    def present(self):
+        """Push the changed regions of this frame to the display"""
+        rects = self._previous_rects + self._rects
+        if self._full_update or self._unbounded or self._previous_unbounded or len(rects) > Renderer.MAX_DIRTY_RECTS:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+        self._previous_rects = self._rects
+        self._previous_unbounded = self._unbounded
+        self._unbounded = False
+        self._full_update = False
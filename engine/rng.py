@@ -0,0 +1,32 @@
+import random
+
+
+class SimulationRNG:
+    """Seeded random streams of one simulation. Every stream is derived from the root seed and
+    its name, so adding draws to one stream (e.g. an extra robot) does not shift the others.
+
+    world:  resource placement and other world generation
+    spawn:  robot start positions
+    colors: debug colors
+    robot streams: one controller stream per robot, numbered in creation order
+    """
+
+    def __init__(self, seed: int | None = None):
+        # Without a seed, pick one so the run can still be replayed
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self.world = self.stream("world")
+        self.spawn = self.stream("spawn")
+        self.colors = self.stream("colors")
+        self._robot_count = 0
+
+    def stream(self, name: str, index: int | None = None) -> random.Random:
+        key = f"{self.seed}/{name}" if index is None else f"{self.seed}/{name}/{index}"
+        return random.Random(key)
+
+    def next_robot_index(self) -> int:
+        index = self._robot_count
+        self._robot_count += 1
+        return index
+
+    def controller(self, robot_index: int) -> random.Random:
+        return self.stream("controller", robot_index)
@@ -11,7 +11,8 @@ from engine.tether import Tether
 from engine.gpt_generated.closest_point_on_circle import closest_point_on_circle
 from engine.environment import Resource
 from engine.objects import Circle
-from sim_math.angles import calc_relative_angle
+from engine.renderer import get_font
+from sim_math.angles import calc_relative_angles
 import numpy as np
 import pymunk
 from pymunk import Vec2d
@@ -45,6 +46,7 @@ class RobotBase(Circle):
         ignore_battery: bool = False,
         robot_collision: bool = True,
         debug_color: IColor = None,
+        control_fps: int | None = None,
     ):
         self.spec = robot_spec
         self._comms_range = 50
@@ -116,9 +118,11 @@ class RobotBase(Circle):
         )
         # List of all IComponents
         self.components: list[IComponent] = [self.battery, self.motor_l, self.motor_r]
+        # Components stepped by the robot itself, the fleet power train takes over batched motors
+        self._stepped_components: list[IComponent] = self.components
 
         # Speedometer
-        self.speedometer = Speed.in_base_unit(0)
+        self._speed__cm_frame = 0.0
         self._prev_pos = self.body.position
 
         # Purely for visualization
@@ -135,7 +139,7 @@ class RobotBase(Circle):
         # Sensor setup
         self.num_ir_sensors = num_ir_sensors
         self._lidar_range = sensor_range
-        self.ir_sensors: list[ILidarData] = self._initialize_ir_sensors()
+        self._ir_sensors: list[ILidarData] = self._initialize_ir_sensors()
 
         # Set up the shape filter (ignores itself but detects other objects)
         self.robot_group = RobotBase._robot_counter
@@ -152,6 +156,20 @@ class RobotBase(Circle):
             group=self.robot_group,  # Ignores itself
         )
 
+        # Batch sensing
+        if sim.lidar:
+            sim.lidar.add_robot(self)
+        if sim.powertrain:
+            sim.powertrain.add_robot(self)
+        sim.robot_grid.add_robot(self)
+
+        # Index within this simulation, used for the controller random stream
+        self.robot_index = sim.rng.next_robot_index()
+
+        # Controller frequency (runs every Nth physics step, staggered between robots)
+        control_fps = control_fps or sim.control_fps or sim.fps
+        self.control_period = max(1, round(sim.fps / control_fps))
+
         # Create API objects
         sensors = RobotSensorAPI(self)
         controls = RobotControlAPI(self)
@@ -161,6 +179,27 @@ class RobotBase(Circle):
         self.controller = controller
         if controller:
             self.controller.set_apis(sensors, controls, debug)
+            self.controller.rng = sim.rng.controller(self.robot_index)
+
+        # Frame profiling, broken down by sensing step, component and controller
+        if sim.profiler:
+            sim.profiler.instrument(self, ("_scan_ir",), "RobotBase.ir")
+            sim.profiler.instrument(self, ("_emit_light",), "RobotBase.light")
+            sim.profiler.instrument(self, ("_send_message",), "RobotBase.comms")
+            for component in self.components:
+                sim.profiler.instrument(component, ("preupdate", "update", "postupdate"))
+            if controller:
+                sim.profiler.instrument(controller, ("update",))
+
+    @property
+    def ir_sensors(self) -> list[ILidarData]:
+        if self.sim.lidar:
+            self.sim.lidar.read(self)
+        return self._ir_sensors
+
+    @property
+    def speedometer(self) -> Speed:
+        return Speed.in_base_unit(self._speed__cm_frame)
 
     def set_motor_values(self, left: float, right: float):
         self.motor_l.request_force_scaled(force_scaler=left)
@@ -207,11 +246,35 @@ class RobotBase(Circle):
         return sensors
 
     def preupdate(self):
+        # IR sensor (or LIDAR), unless sensed in batch by the simulation
+        if not self.sim.lidar:
+            self._scan_ir()
+        # Light emitter
+        if self.light_switch:
+            self._emit_light()
+        # Send message
+        if self.message:
+            self._send_message()
+
+        # Update speedometer
+        dist_vector: Vec2d = self.body.position - self._prev_pos
+        self._prev_pos = self.body.position
+        direction_vector = Vec2d(1, 0).rotated(self.body.angle)
+        dist_in_direction = dist_vector.dot(direction_vector)
+        self._speed__cm_frame = dist_in_direction
+
+        # if self.battery.capacity__wh > :
+
+        # Other IComponents
+        for component in self._stepped_components:
+            component.preupdate()
+
+    def _scan_ir(self):
+        """One segment query per IR ray"""
         ray_filter = pymunk.ShapeFilter(
             mask=0b0001 | 0b0010 | 0b0100, group=self.robot_group
         )
-        # IR sensor (or LIDAR)
-        for sensor in self.ir_sensors:
+        for sensor in self._ir_sensors:
             sensor_pos = self.body.position  # Robot's center
             direction = (
                 np.cos(self.body.angle + sensor.angle),
@@ -238,48 +301,35 @@ class RobotBase(Circle):
                 sensor.distance = self._lidar_range
                 sensor.gameobject = None
 
-        # Light emitter
-        if self.light_switch:
-            query_result = self.body.space.point_query(
-                self.body.position, self._light_range, ray_filter
-            )
-            for result in query_result:
-                body: pymunk.Body = result.shape.body
-                robot: RobotBase = body.gameobject
-                if isinstance(robot, RobotBase):
-                    distance_cm = body.position.get_distance(self.body.position)
-                    # distance = result.distance
-                    angle = calc_relative_angle(
-                        subject_pos=body.position,
-                        subject_angle=body.angle,
-                        target_pos=self.body.position,
-                    )
-                    # Add the emitter to the target's detections
-                    robot.light_detectors.append(ILightData(distance_cm, angle))
-
-        # Send message
-        if self.message:
-            query_result = self.body.space.point_query(
-                self.body.position, self._comms_range, ray_filter
-            )
-            for result in query_result:
-                robot: RobotBase = result.shape.body.gameobject
-                if isinstance(robot, RobotBase):
-                    # print(f"Robot {self} has {robot} in communication range {self._comms_range}")
-                    self.received_messages.append(robot.message)
-
-        # Update speedometer
-        dist_vector: Vec2d = self.body.position - self._prev_pos
-        self._prev_pos = self.body.position
-        direction_vector = Vec2d(1, 0).rotated(self.body.angle)
-        dist_in_direction = dist_vector.dot(direction_vector)
-        self.speedometer = Speed.in_base_unit(dist_in_direction)
-
-        # if self.battery.capacity__wh > :
-
-        # Other IComponents
-        for component in self.components:
-            component.preupdate()
+    def _emit_light(self):
+        """Add this robot's light to the detections of the robots in range"""
+        grid = self.sim.robot_grid
+        indices, distances = grid.query(self, self._light_range)
+        # Angle from each target robot to the emitter
+        angles = calc_relative_angles(
+            subject_pos=grid.positions[indices],
+            subject_angle=grid.angles[indices],
+            target_pos=self.body.position,
+        )
+        for index, distance_cm, angle in zip(indices.tolist(), distances.tolist(), angles.tolist()):
+            # Add the emitter to the target's detections
+            grid.robots[index].light_detectors.append(ILightData(distance_cm, angle))
+
+    def _send_message(self):
+        """Receive the messages of the robots in range"""
+        grid = self.sim.robot_grid
+        indices, _ = grid.query(self, self._comms_range)
+        for index in indices.tolist():
+            self.received_messages.append(grid.robots[index].message)
+
+    def draw_bounds(self) -> pymunk.BB | None:
+        if self.debug_messages:
+            return None  # pop-up text can be any width
+        if any(getattr(component, "draw_debugging", False) for component in self.components):
+            return None  # debug drawings of the components are placed away from the robot
+        # Wheels stick out a little, the light circle a lot
+        margin = self._light_range if self.light_switch else self._wheel_size
+        return pymunk.BB.newForCircle(self.body.position, self.shape.radius + margin)
 
     def postupdate(self):
         self.light_detectors.clear()
@@ -293,7 +343,7 @@ class RobotBase(Circle):
             self.debug_messages.pop(0)
 
         # Other IComponents
-        for component in self.components:
+        for component in self._stepped_components:
             component.postupdate()
 
     def print(self, message: any, pop_up: bool = False):
@@ -312,7 +362,7 @@ class RobotBase(Circle):
             self.debug_messages.append(DebugMessage(message=message))
 
     def draw_sensors(self, screen):
-        for sensor in self.ir_sensors:
+        for sensor in self._ir_sensors:
             sensor_pos = self.body.position  # Robot's center
             direction = (
                 np.cos(self.body.angle + sensor.angle),
@@ -405,7 +455,7 @@ class RobotBase(Circle):
 
         # Display in-game text pop-up
         if self.debug_messages:
-            font = pygame.font.SysFont(None, 24)
+            font = get_font(24)
             font_color = self.debug_color.rgb if self.debug_color else (255, 255, 255)
             messages = self.debug_messages.copy()
             messages.reverse()
@@ -433,11 +483,11 @@ class RobotBase(Circle):
     def update(self):
         # todo change
         self.controller_update()
-        if self.controller:
+        if self.controller and (self.sim.frame_count + self.robot_index) % self.control_period == 0:
             self.controller.update()
 
         # Other IComponents
-        for component in self.components:
+        for component in self._stepped_components:
             component.update()
 
         forward = pymunk.Vec2d(1, 0).rotated(self.body.angle)
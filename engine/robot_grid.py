@@ -0,0 +1,92 @@
+import numpy as np
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.robot import RobotBase
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+
+class RobotGrid:
+    """Uniform grid (cell list) of robot positions, rebuilt once per frame. Serves the range
+    queries of light beacons and radio messages against robots only, instead of a
+    space.point_query over every shape per emitting robot.
+
+    A robot is in range when its shape is within the range of the querying robot's center,
+    matching space.point_query(position, range, filter).
+    """
+
+    def __init__(self, sim: "SimulationBase"):
+        self.sim = sim
+        self.robots: list["RobotBase"] = []
+        self._indices: dict[int, int] = {}  # entity id -> index in robots
+        self._frame = -1
+        self.generation = 0  # bumped whenever robots are added or removed
+
+        # Robot state, gathered once per frame
+        self.positions = np.zeros((0, 2))
+        self.angles = np.zeros(0)
+        self.radii = np.zeros(0)
+
+        # Cell list
+        self._cell_size = 1.0
+        self._cells: dict[tuple[int, int], list[int]] = {}
+
+    def add_robot(self, robot: "RobotBase"):
+        if robot.entity_id not in self._indices:
+            self._indices[robot.entity_id] = len(self.robots)
+            self.robots.append(robot)
+            self._frame = -1
+            self.generation += 1
+
+    def remove_robot(self, robot: "RobotBase"):
+        if robot.entity_id in self._indices and self.robots[self._indices[robot.entity_id]] is robot:
+            del self.robots[self._indices[robot.entity_id]]
+            self._indices = {r.entity_id: index for index, r in enumerate(self.robots)}
+            self._frame = -1
+            self.generation += 1
+
+    def rebuild(self):
+        """Gather all robot positions and sort them into cells."""
+        self._frame = self.sim.frame_count
+        state = [(r.body.position.x, r.body.position.y, r.body.angle, r.radius, max(r._light_range, r._comms_range)) for r in self.robots]
+        state = np.array(state, dtype=float).reshape(-1, 5)
+        self.positions = state[:, :2]
+        self.angles = state[:, 2]
+        self.radii = state[:, 3]
+
+        # Cells large enough that any query only needs the neighboring cells
+        self._cell_size = max(1.0, float(np.max(state[:, 4] + state[:, 3], initial=0.0)))
+        self._cells = {}
+        keys = np.floor(self.positions / self._cell_size).astype(np.int64).tolist()
+        for index, key in enumerate(keys):
+            self._cells.setdefault((key[0], key[1]), []).append(index)
+
+    def ensure_built(self):
+        """Rebuild unless the grid already holds this frame's positions"""
+        if self._frame != self.sim.frame_count:
+            self.rebuild()
+
+    def index_of(self, robot: "RobotBase") -> int:
+        """Index of the robot in robots and the per-robot arrays"""
+        return self._indices[robot.entity_id]
+
+    def query(self, robot: "RobotBase", radius: float) -> tuple[np.ndarray, np.ndarray]:
+        """Indices of the other robots in range of the robot's center, and their center distances."""
+        self.ensure_built()
+
+        index = self.index_of(robot)
+        position = self.positions[index]
+        reach = radius + float(np.max(self.radii, initial=0.0))
+        min_x, min_y = np.floor((position - reach) / self._cell_size).astype(np.int64).tolist()
+        max_x, max_y = np.floor((position + reach) / self._cell_size).astype(np.int64).tolist()
+
+        candidates = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                candidates.extend(self._cells.get((cell_x, cell_y), ()))
+        candidates = np.array(sorted(candidates), dtype=np.int64)
+        candidates = candidates[candidates != index]
+
+        delta = self.positions[candidates] - position
+        distances = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+        in_range = distances - self.radii[candidates] <= radius
+        return candidates[in_range], distances[in_range]
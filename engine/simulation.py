@@ -1,18 +1,46 @@
 from dataclasses import dataclass
 from time import time
+import io
+import pickle
 import pygame
 import pymunk
 import threading
 
 from engine.tether import Tether
+from engine.entities import EntityRegistry
 from engine.environment import Environment
+from engine.lidar import BatchLidar
+from engine.message_bus import MessageBus
+from engine.powertrain import FleetPowertrain
+from engine.robot_grid import RobotGrid
 from engine.objects import IGameObject
+from engine.profiler import FrameProfiler
+from engine.renderer import Renderer, clear_font_cache, render_text
+from engine.rng import SimulationRNG
+from engine.types import IWaypointData
 from sim_math.world_meta import WorldMeta
 
 
+class _CheckpointPickler(pickle.Pickler):
+    """Pickles waypoints with their neighbors by id, following the neighbor references instead
+    would recurse through the whole grid. WaypointGrid links them again when restored."""
+
+    def reducer_override(self, obj):
+        if type(obj) is IWaypointData:
+            neighbors = {direction: None if neighbor is None else neighbor.id for direction, neighbor in obj.neighbors.items()}
+            return IWaypointData, (obj.id, obj.position, neighbors, obj.is_homebase)
+        return NotImplemented
+
+
 @dataclass
 class SimulationBase:
+    PHASES = ("preupdate", "update", "postupdate", "draw")
+
     fps: int = 60
+    control_fps: int | None = None
+    batch_lidar: bool = True
+    batch_powertrain: bool = True
+    profile: bool = False
     enable_display: bool = True
     enable_realtime: bool = True
     pixels_x: int = 640
@@ -28,15 +56,25 @@ class SimulationBase:
     physics_sync_event = None
     initial_zoom: float = 1.0
     time_limit_seconds: float | None = None
+    seed: int | None = None
     counters: dict = None
     inputs: list[float] = None
     windows_caption: str | None = None
 
     def __post_init__(self):
-        self._game_objects: IGameObject = []
-        self._tethers: list[Tether] = []
+        self.entities = EntityRegistry()
+        # Objects per phase (by entity id), only those overriding the phase method are called each frame
+        self._phase_objects: dict[str, dict[int, IGameObject]] = {phase: {} for phase in SimulationBase.PHASES}
+        self._tethers: dict[int, Tether] = {}
+        # Drawn once onto the renderer's cached background layer instead of every frame
+        self._scenery: dict[int, IGameObject] = {}
         self.counters = {}
         self.physics_sync_event = threading.Event()
+        self._stepping_time = 0.0
+        self._stepping_frames = 0
+        # Random streams (world, spawn, per-robot controllers), all derived from one seed
+        self.rng = SimulationRNG(self.seed)
+        self.seed = self.rng.seed
 
         # Physics
         self.delta_time = 1 / self.fps
@@ -44,10 +82,30 @@ class SimulationBase:
         self.space = pymunk.Space()
         # How much energy is lost over time
         self.space.damping = 0.25
+        # Swarm-level IR/lidar sensing (None means one segment query per ray)
+        self.lidar: BatchLidar | None = BatchLidar(self) if self.batch_lidar else None
+        # Swarm-level motors and batteries (None means each robot steps its own components)
+        self.powertrain: FleetPowertrain | None = FleetPowertrain(self) if self.batch_powertrain else None
+        # Robot positions for light and message range queries
+        self.robot_grid = RobotGrid(self)
+        # Typed radio messages, delivered through the robot grid
+        self.message_bus = MessageBus(self)
+        # Per-phase frame timing (None means not profiled, at no cost)
+        self.profiler: FrameProfiler | None = FrameProfiler() if self.profile else None
+        if self.profiler and self.lidar:
+            self.profiler.instrument(self.lidar, ("update",))
+        if self.profiler and self.powertrain:
+            self.profiler.instrument(self.powertrain, ("preupdate", "update"))
 
         # Visualization
         self._display = None
         self._clock = None
+        self.renderer = Renderer(self)
+        # Bumped when scenery changes, so every renderer rebuilds its background layer
+        self.scenery_version = 0
+        self.recorder = None
+        self.trajectory = None
+        self.energy = None
 
         # World meta data
         self.meta: WorldMeta = WorldMeta(
@@ -58,6 +116,36 @@ class SimulationBase:
             camera_scale=self.initial_zoom
         )
 
+    def checkpoint(self) -> bytes:
+        """Snapshot of the whole world: physics, game objects, controllers, counters and random
+        streams. Take it between steps, not while the physics thread is running."""
+        blob = io.BytesIO()
+        _CheckpointPickler(blob, protocol=pickle.HIGHEST_PROTOCOL).dump(self)
+        return blob.getvalue()
+
+    @staticmethod
+    def restore(blob: bytes) -> "SimulationBase":
+        """Simulation from a checkpoint, continuing exactly where the original was"""
+        return pickle.loads(blob)
+
+    def fork(self) -> "SimulationBase":
+        """Independent copy of the simulation in its current state, e.g. to branch controller
+        or parameter variants from a common prefix"""
+        return SimulationBase.restore(self.checkpoint())
+
+    def __getstate__(self):
+        if self.profiler is not None:
+            raise RuntimeError("A profiled simulation cannot be checkpointed, the profiler wraps object methods")
+        state = self.__dict__.copy()
+        # The window, thread sync and output files belong to this process and run, not to the world
+        state.update(physics_sync_event=None, _display=None, _clock=None, renderer=None, recorder=None, trajectory=None, energy=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.physics_sync_event = threading.Event()
+        self.renderer = Renderer(self)
+
     def get_time_running(self):
         return self.frame_count / self.fps
 
@@ -83,8 +171,15 @@ class SimulationBase:
         expected_time = self.frame_count / self.fps
         # print(f"Ran faster by a factor of {expected_time / run_time}")
 
+        if self.energy is not None:
+            self.energy.export()
+        if self.trajectory is not None:
+            # Flushes the buffered records, so the file can be memory-mapped
+            self.trajectory.close()
+
         # Visualization
         if self.enable_display:
+            clear_font_cache()
             pygame.quit()
     
     def run(self):
@@ -95,9 +190,90 @@ class SimulationBase:
 
         return self.counters
 
+    @property
+    def is_headless(self) -> bool:
+        """Headless simulations are stepped inline on the calling thread."""
+        return not self.enable_display and not self.enable_realtime
+
+    @property
+    def steps_per_second(self) -> float:
+        """Simulated steps per wall-clock second spent stepping."""
+        if self._stepping_time == 0:
+            return 0.0
+        return self._stepping_frames / self._stepping_time
+
+    def step(self, n: int = 1) -> dict:
+        """Advance the simulation by up to n physics steps on the calling thread.
+        Stops early if the time limit is reached or the simulation is quit."""
+        return self.run_until(lambda sim: False, max_steps=n)
+
+    def run_until(self, predicate, max_steps: int | None = None) -> dict:
+        """Step the simulation on the calling thread until predicate(sim) is true.
+        Stops early if max_steps is reached, the time limit is reached or the simulation is quit."""
+        if self.start_time is None:
+            self.start_time = time()
+
+        start = time()
+        steps = 0
+        while self.physics_thread and not predicate(self):
+            if max_steps is not None and steps >= max_steps:
+                break
+            self._step_physics()
+            steps += 1
+        self._stepping_time += time() - start
+        self._stepping_frames += steps
+
+        return self.counters
+
+    def _step_physics(self):
+        # Counters
+        self.frame_count += 1
+
+        if self.profiler is None:
+            # Physics
+            self.space.step(self.delta_time)
+
+            # Update
+            self._preupdate()
+            self._update()
+            self._postupdate()
+        else:
+            self.profiler.call("physics", "Space", self.space.step, self.delta_time)
+            self.profiler.call("preupdate", "SimulationBase", self._preupdate)
+            self.profiler.call("update", "SimulationBase", self._update)
+            self.profiler.call("postupdate", "SimulationBase", self._postupdate)
+            self.profiler.end_frame()
+
+        # Pheromone evaporation
+        pheromones = self.environment.pheromones if self.environment is not None else None
+        if pheromones is not None and self.frame_count % pheromones.every == 0:
+            pheromones.evaporate()
+
+        # Offscreen recording
+        if self.recorder is not None and self.frame_count % self.recorder.every == 0:
+            self.recorder.capture()
+        # Trajectory log
+        if self.trajectory is not None and self.frame_count % self.trajectory.every == 0:
+            self.trajectory.capture()
+        # Energy ledger
+        if self.energy is not None and self.frame_count % self.energy.every == 0:
+            self.energy.capture()
+
+        # Check quit
+        if self.time_limit_seconds:
+            simulation_time = self.frame_count / self.fps
+            if simulation_time >= self.time_limit_seconds:
+                self.physics_thread = False
+
     def _run(self):
         self._start()
 
+        # Headless (no display, no realtime) runs inline without the physics thread
+        if self.is_headless:
+            self.run_until(lambda sim: False)
+            self._quit()
+            return
+
         def run_physics():
             while self.physics_thread:
                 # Realtime synchronization
@@ -105,22 +281,7 @@ class SimulationBase:
                     self.physics_sync_event.wait()  # Wait for render loop signal
                     self.physics_sync_event.clear()  # Reset for next frame
 
-                # Counters
-                self.frame_count += 1
-
-                # Physics
-                self.space.step(self.delta_time)
-
-                # Update
-                self._preupdate()
-                self._update()
-                self._postupdate()
-
-                # Check quit
-                if self.time_limit_seconds:
-                    simulation_time = self.frame_count / self.fps
-                    if simulation_time >= self.time_limit_seconds:
-                        self.physics_thread = False
+                self._step_physics()
 
         physics_thread = threading.Thread(target=run_physics)
         physics_thread.start()
@@ -151,8 +312,8 @@ class SimulationBase:
 
                 # Update visuals
                 self._update_visuals()
-                # Update the screen
-                pygame.display.update()
+                # Update the changed parts of the screen
+                self.renderer.present()
                 # Sleep to maintain FPS
                 if self.enable_realtime:
                     self.physics_sync_event.set()
@@ -163,35 +324,50 @@ class SimulationBase:
 
 
     def _preupdate(self):
-        for obj in self._game_objects:
+        self.message_bus.publish()
+        if self.environment is not None and self.environment.locations is not None:
+            self.environment.locations.update()
+        if self.powertrain:
+            self.powertrain.preupdate()
+        for obj in self._phase_objects["preupdate"].values():
             obj.preupdate()
 
     def _update(self):
-        for obj in self._game_objects:
+        for obj in self._phase_objects["update"].values():
             obj.update()
+        # After the controllers requested their forces
+        if self.powertrain:
+            self.powertrain.update()
 
     def _postupdate(self):
-        for obj in self._game_objects:
+        for obj in self._phase_objects["postupdate"].values():
             obj.postupdate()
 
     def _update_visuals(self):
         if self.enable_display:
-            self._display.fill(self.background_color)
-            # Draw all objects
-            for obj in self._game_objects:
-                obj.draw(self._display)
-            # Draw all tethers
-            for tether in self._tethers:
-                tether.draw(self._display)
-
-            # Draw camera position in lower-left corner
-            font = pygame.font.SysFont(None, 20)
-            cam_x, cam_y = self.meta.camera_offset
-            cam_text = font.render(f"Cam: ({int(cam_x)}, {int(cam_y)}) Zoom: {self.meta.camera_scale:.2f}", True, (200, 200, 200))
-
-            text_rect = cam_text.get_rect()
-            text_rect.bottomleft = (10, self._display.get_height() - 10)
-            self._display.blit(cam_text, text_rect)
+            if self.profiler is None:
+                self.draw_frame(self._display, self.renderer)
+            else:
+                self.profiler.call("draw", "SimulationBase", self.draw_frame, self._display, self.renderer)
+
+    def draw_frame(self, surface: pygame.Surface, renderer: Renderer):
+        """Draw the current state onto the surface (the display or an offscreen recording)"""
+        # Background, waypoints and other scenery come from the cached layer
+        renderer.begin_frame(surface)
+        # Draw all moving objects (copied, the physics thread may add or remove objects meanwhile)
+        for obj in list(self._phase_objects["draw"].values()):
+            renderer.draw_object(obj, surface)
+        # Draw all tethers
+        for tether in list(self._tethers.values()):
+            renderer.mark(tether.draw(surface))
+
+        # Draw camera position in lower-left corner
+        cam_x, cam_y = self.meta.camera_offset
+        cam_text = render_text(f"Cam: ({int(cam_x)}, {int(cam_y)}) Zoom: {self.meta.camera_scale:.2f}", 20, (200, 200, 200))
+
+        text_rect = cam_text.get_rect()
+        text_rect.bottomleft = (10, surface.get_height() - 10)
+        renderer.mark(surface.blit(cam_text, text_rect))
 
     def _update_camera(self):
         keys = pygame.key.get_pressed()  # Get key states
@@ -222,21 +398,44 @@ class SimulationBase:
 
     def add_game_object(self, obj: IGameObject):
         obj.sim = self
-        if obj not in self._game_objects:
-            self._game_objects.append(obj)
+        if obj not in self.entities:
+            entity_id = self.entities.add(obj)
+            for phase, objects in self._phase_objects.items():
+                if obj.overrides(phase):
+                    objects[entity_id] = obj
+            if obj.is_scenery:
+                # Drawn by the renderer's background layer instead
+                self._phase_objects["draw"].pop(entity_id, None)
+                self._scenery[entity_id] = obj
+                self.scenery_version += 1
             self.space.add(obj.body, obj.shape)
+            if self.lidar:
+                self.lidar.invalidate()
+            if self.profiler:
+                self.profiler.instrument(obj, tuple(phase for phase in SimulationBase.PHASES if obj.overrides(phase)))
 
     def remove_game_object(self, obj: IGameObject):
-        if obj in self._game_objects:
-            self._game_objects.remove(obj)
+        if obj in self.entities:
+            for objects in self._phase_objects.values():
+                objects.pop(obj.entity_id, None)
+            if self._scenery.pop(obj.entity_id, None) is not None:
+                self.scenery_version += 1
             self.space.remove(obj.body, obj.shape)
+            self.robot_grid.remove_robot(obj)
+            self.message_bus.remove_robot(obj)
+            if self.powertrain:
+                self.powertrain.remove_robot(obj)
+            if self.lidar:
+                self.lidar.remove_robot(obj)
+                self.lidar.invalidate()
+            self.entities.remove(obj)
 
     def add_tether(self, tether: Tether):
-        self._tethers.append(tether)
+        self._tethers[id(tether)] = tether
         self.space.add(tether.constraint)
 
     def remove_tether(self, tether: Tether):
-        self._tethers.remove(tether)
+        del self._tethers[id(tether)]
         self.space.remove(tether.constraint)
 
     def set_environment(self, env: Environment):
@@ -26,8 +26,8 @@ class Tether:
         )
         self.constraint.tether = self
 
-    def draw(self, surface: Surface):
-        pygame.draw.line(
+    def draw(self, surface: Surface) -> pygame.Rect:
+        return pygame.draw.line(
             surface=surface,
             color=(80, 80, 80),
             start_pos=self.robot.sim.meta.pymunk_to_pygame_point(self.robot.body.local_to_world(self.robot_offset), surface),
@@ -0,0 +1,151 @@
+import json
+from enum import Enum
+import numpy as np
+
+from engine.environment import Resource
+from engine.robot import RobotBase
+from typing import TYPE_CHECKING
+if TYPE_CHECKING: from engine.simulation import SimulationBase
+
+MAGIC = b"SIMTRAJ1"
+HEADER_ALIGNMENT = 4096
+NO_STATE = -1
+NOT_ATTACHED = -1
+
+ROBOT_DTYPE = np.dtype([
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("angle", "<f4"),
+    ("speed", "<f4"),  # cm per frame along the robot's heading
+    ("state", "<i2"),  # controller state value, see the header's state table
+    ("light", "?"),
+    ("attached", "<i2"),  # resource slot of the tether, or NOT_ATTACHED
+])
+
+RESOURCE_DTYPE = np.dtype([
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("present", "?"),  # False once collected
+])
+
+
+def frame_dtype(robot_count: int, resource_count: int) -> np.dtype:
+    return np.dtype([
+        ("frame", "<i4"),
+        ("robots", ROBOT_DTYPE, (robot_count,)),
+        ("resources", RESOURCE_DTYPE, (resource_count,)),
+    ])
+
+
+class TrajectoryLog:
+    """Streams robot and resource state to a file, one fixed-size record per logged frame.
+
+    The entity table is fixed when logging starts: the robots and resources in the simulation
+    at that moment get slots in every record. The file starts with a JSON header padded to
+    HEADER_ALIGNMENT bytes, followed by the records, so read_trajectory can memory-map them
+    without running the simulation again. Records are written as they are captured, so memory
+    stays bounded however long the run.
+    """
+
+    def __init__(self, sim: "SimulationBase", path: str, every: int = 1):
+        self.sim = sim
+        self.path = path
+        self.every = max(1, every)
+        self.frames_written = 0
+
+        # Slots in creation order
+        entities = sorted(sim.entities, key=lambda obj: obj.entity_id)
+        self.robots: list[RobotBase] = [obj for obj in entities if isinstance(obj, RobotBase)]
+        self.resources: list[Resource] = [obj for obj in entities if isinstance(obj, Resource)]
+        self._resource_slots = {resource.entity_id: slot for slot, resource in enumerate(self.resources)}
+        self.dtype = frame_dtype(len(self.robots), len(self.resources))
+        self._record = np.zeros(1, dtype=self.dtype)
+
+        self._file = open(path, "wb")
+        self._file.write(self._header())
+        sim.trajectory = self
+
+    def _header(self) -> bytes:
+        header = {
+            "fps": self.sim.fps,
+            "every": self.every,
+            "seed": self.sim.seed,
+            "robots": [
+                {
+                    "slot": slot,
+                    "entity_id": robot.entity_id,
+                    "radius": robot.shape.radius,
+                    "controller": type(robot.controller).__name__ if robot.controller else None,
+                }
+                for slot, robot in enumerate(self.robots)
+            ],
+            "resources": [
+                {"slot": slot, "entity_id": resource.entity_id, "radius": resource.shape.radius}
+                for slot, resource in enumerate(self.resources)
+            ],
+            "states": self._state_table(),
+            "dtype": self.dtype.descr,
+        }
+        body = json.dumps(header).encode()
+        size = -(-(len(MAGIC) + 8 + len(body)) // HEADER_ALIGNMENT) * HEADER_ALIGNMENT
+        return (MAGIC + size.to_bytes(8, "little") + body).ljust(size, b" ")
+
+    def _state_table(self) -> dict[str, int]:
+        """Names of the controller state values, for controllers that keep an Enum state"""
+        states = {}
+        for robot in self.robots:
+            state = getattr(robot.controller, "state", None)
+            if isinstance(state, Enum):
+                states.update({member.name: member.value for member in type(state)})
+        return states
+
+    def capture(self):
+        record = self._record[0]
+        record["frame"] = self.sim.frame_count
+
+        robots = record["robots"]
+        for slot, robot in enumerate(self.robots):
+            state = getattr(robot.controller, "state", None)
+            tether = robot.tether
+            robots[slot] = (
+                robot.body.position.x,
+                robot.body.position.y,
+                robot.body.angle,
+                robot._speed__cm_frame,
+                state.value if isinstance(state, Enum) else NO_STATE,
+                robot.light_switch,
+                self._resource_slots.get(tether.resource.entity_id, NOT_ATTACHED) if tether else NOT_ATTACHED,
+            )
+
+        resources = record["resources"]
+        for slot, resource in enumerate(self.resources):
+            if resource in self.sim.entities:
+                resources[slot] = (resource.body.position.x, resource.body.position.y, True)
+            else:
+                resources[slot] = (np.nan, np.nan, False)
+
+        self._file.write(self._record.tobytes())
+        self.frames_written += 1
+
+    def close(self):
+        if self.sim.trajectory is self:
+            self.sim.trajectory = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_trajectory(path: str) -> tuple[dict, np.memmap]:
+    """Header and memory-mapped frame records of a trajectory file"""
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a trajectory file")
+        size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(size - len(MAGIC) - 8).rstrip(b" "))
+    dtype = frame_dtype(len(header["robots"]), len(header["resources"]))
+    return header, np.memmap(path, dtype=dtype, mode="r", offset=size)
@@ -39,6 +39,28 @@ class IWaypointData:
         return cls(int(id), Vec2d(float(x), float(y)), {}, is_homebase == "True")
 
 
+@dataclass
+class ILocationData:
+    cell: tuple[int, int]
+    waypoint_id: int
+    waypoint_distance: float
+    regions: tuple[str, ...]
+
+
+class LocationEventKind(Enum):
+    ARRIVED = auto()
+    ENTERED = auto()
+    EXITED = auto()
+
+
+@dataclass
+class ILocationEvent:
+    kind: LocationEventKind
+    frame: int
+    waypoint_id: int | None = None
+    region: str | None = None
+
+
 class DebugMessage:
     def __init__(self, message: any):
         self.timestamp = time()
@@ -0,0 +1,159 @@
+import numpy as np
+import pygame
+from pymunk import Vec2d
+
+from engine.types import IWaypointData
+from sim_math.world_meta import WorldMeta
+
+
+class WaypointGrid:
+    """Data-only grid of waypoints. Positions, neighbors and homebase flags are kept in NumPy
+    arrays, and nothing is added to the pymunk space. Controllers read the IWaypointData list.
+
+    The hop distance to the closest homebase waypoint and the neighbor one hop closer to it
+    are computed once (breadth first over the neighbor table), so routes home cost nothing
+    per frame. Waypoints that cannot reach the homebase have NO_ROUTE for both.
+    """
+
+    DIRECTIONS = ("up", "down", "left", "right")
+    NO_NEIGHBOR = -1
+    NO_ROUTE = -1
+
+    def __init__(
+        self,
+        meta: WorldMeta,
+        distance: float = 10,
+        x_count: int = 5,
+        y_count: int = 5,
+        homebase_position: tuple = (0, 0),
+        homebase_threshold: float = 50,
+        visible: bool = True,
+        radius: float = 5,
+        color: tuple = (40, 40, 40),
+        homebase_color: tuple = (255, 255, 255),
+    ):
+        self.meta = meta
+        self.distance = distance
+        self.x_count = x_count
+        self.y_count = y_count
+        self.visible = visible
+        self.radius = radius
+        self.color = color
+        self.homebase_color = homebase_color
+
+        # Ids run over the y axis first, then the x axis
+        grid_x, grid_y = np.meshgrid(np.arange(x_count), np.arange(y_count), indexing="ij")
+        grid_x, grid_y = grid_x.ravel(), grid_y.ravel()
+        self.positions = np.stack(
+            (
+                -((distance * (x_count - 1)) / 2) + grid_x * distance,
+                -((distance * (y_count - 1)) / 2) + grid_y * distance,
+            ),
+            axis=1,
+        ).astype(float)
+        self.origin = self.positions[0].copy()  # position of waypoint 0, the grid's lowest corner
+        offsets = self.positions - np.asarray(homebase_position, dtype=float)
+        self.is_homebase = np.hypot(offsets[:, 0], offsets[:, 1]) < homebase_threshold
+
+        # Neighbor ids per direction (up, down, left, right)
+        self.neighbors = np.stack(
+            (
+                np.where(grid_y + 1 < y_count, self.grid_index(grid_x, grid_y + 1), WaypointGrid.NO_NEIGHBOR),
+                np.where(grid_y - 1 >= 0, self.grid_index(grid_x, grid_y - 1), WaypointGrid.NO_NEIGHBOR),
+                np.where(grid_x - 1 >= 0, self.grid_index(grid_x - 1, grid_y), WaypointGrid.NO_NEIGHBOR),
+                np.where(grid_x + 1 < x_count, self.grid_index(grid_x + 1, grid_y), WaypointGrid.NO_NEIGHBOR),
+            ),
+            axis=1,
+        )
+
+        self.hops_home, self.next_hop_home = self._routes_home()
+
+        self.data: list[IWaypointData] = [
+            IWaypointData(position=Vec2d(x, y), id=i, neighbors={}, is_homebase=is_homebase)
+            for i, (x, y, is_homebase) in enumerate(zip(self.positions[:, 0].tolist(), self.positions[:, 1].tolist(), self.is_homebase.tolist()))
+        ]
+        for waypoint, neighbor_ids in zip(self.data, self.neighbors.tolist()):
+            waypoint.neighbors = {
+                direction: None if neighbor_id == WaypointGrid.NO_NEIGHBOR else self.data[neighbor_id]
+                for direction, neighbor_id in zip(WaypointGrid.DIRECTIONS, neighbor_ids)
+            }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # Link the neighbors that checkpoints pickle by id
+        for waypoint in self.data:
+            waypoint.neighbors = {
+                direction: self.data[neighbor] if isinstance(neighbor, int) else neighbor
+                for direction, neighbor in waypoint.neighbors.items()
+            }
+
+    def grid_index(self, grid_x, grid_y):
+        """Waypoint id of a grid position"""
+        return grid_x * self.y_count + grid_y
+
+    def _routes_home(self) -> tuple[np.ndarray, np.ndarray]:
+        """Hop distance to the closest homebase waypoint and the next waypoint on the way there"""
+        hops = np.full(len(self.positions), WaypointGrid.NO_ROUTE, dtype=np.int64)
+        next_hop = np.full(len(self.positions), WaypointGrid.NO_ROUTE, dtype=np.int64)
+        frontier = np.flatnonzero(self.is_homebase)
+        hops[frontier] = 0
+        next_hop[frontier] = frontier
+        distance = 0
+        while len(frontier):
+            distance += 1
+            # Unreached neighbors of the frontier, each reached from its first frontier waypoint
+            candidates = self.neighbors[frontier]
+            sources = np.repeat(frontier, candidates.shape[1])
+            candidates = candidates.ravel()
+            valid = candidates != WaypointGrid.NO_NEIGHBOR
+            candidates, sources = candidates[valid], sources[valid]
+            unreached = hops[candidates] == WaypointGrid.NO_ROUTE
+            frontier, first = np.unique(candidates[unreached], return_index=True)
+            hops[frontier] = distance
+            next_hop[frontier] = sources[unreached][first]
+        return hops, next_hop
+
+    def nearest_cells(self, positions) -> np.ndarray:
+        """Grid positions (x, y) of the waypoints closest to an array of positions, by grid arithmetic"""
+        cells = np.floor((np.asarray(positions, dtype=float).reshape(-1, 2) - self.origin) / self.distance + 0.5).astype(np.int64)
+        cells[:, 0] = np.clip(cells[:, 0], 0, self.x_count - 1)
+        cells[:, 1] = np.clip(cells[:, 1], 0, self.y_count - 1)
+        return cells
+
+    def nearest_indices(self, positions) -> np.ndarray:
+        """Ids of the waypoints closest to an array of positions"""
+        cells = self.nearest_cells(positions)
+        return self.grid_index(cells[:, 0], cells[:, 1])
+
+    def nearest_index(self, position) -> int:
+        """Id of the waypoint closest to a position"""
+        return int(self.nearest_indices((position[0], position[1]))[0])
+
+    def nearest_waypoint(self, position) -> IWaypointData:
+        return self.data[self.nearest_index(position)]
+
+    def next_waypoint_home(self, waypoint: IWaypointData) -> IWaypointData | None:
+        """Neighbor one hop closer to the homebase, the waypoint itself on the homebase"""
+        next_id = int(self.next_hop_home[waypoint.id])
+        return None if next_id == WaypointGrid.NO_ROUTE else self.data[next_id]
+
+    def route_home(self, waypoint: IWaypointData) -> list[IWaypointData]:
+        """Shortest route from the waypoint to the homebase, ending on a homebase waypoint"""
+        if self.hops_home[waypoint.id] == WaypointGrid.NO_ROUTE:
+            return []
+        route = [waypoint]
+        while not route[-1].is_homebase:
+            route.append(self.data[self.next_hop_home[route[-1].id]])
+        return route
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def draw(self, surface):
+        if not self.visible:
+            return
+        radius = self.meta.pymunk_to_pygame_scale(self.radius)
+        for (x, y), is_homebase in zip(self.positions.tolist(), self.is_homebase.tolist()):
+            x, y = self.meta.pymunk_to_pygame_point((x, y), surface)
+            color = self.homebase_color if is_homebase else self.color
+            pygame.draw.circle(surface, color, (int(x), int(y)), radius)
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import sqlite3
+from dataclasses import asdict
+from time import time
+from evolutionary.colony import ColonyJob
+from evolutionary.evolutionary_test_02 import COLONY_TOTAL_WEIGHT, get_single_robot
+
+# Bump when a change to the engine or the controllers makes stored counters stale
+CACHE_VERSION = 2
+
+
+def _canonical_value(value):
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(item) for item in value]
+    if hasattr(value, "__dict__"):
+        # Tuning objects such as PID: keep their plain settings
+        return {key: _canonical_value(item) for key, item in sorted(vars(value).items()) if isinstance(item, (bool, int, float, str))}
+    return None
+
+
+def controller_constants(controller) -> dict:
+    """UPPER_CASE settings of a fresh controller, e.g. BASE_SPEED and the PID gains"""
+    instance = controller()
+    constants = {key: value for key, value in vars(type(instance)).items() if key.isupper()}
+    constants.update({key: value for key, value in vars(instance).items() if key.isupper()})
+    return {key: _canonical_value(value) for key, value in sorted(constants.items()) if value is not None}
+
+
+def _describe(job: ColonyJob) -> dict:
+    """Everything about a colony job that determines its outcome, except the seed"""
+    motor_weight, battery_weight, other_weight = get_single_robot(COLONY_TOTAL_WEIGHT, job.robot_count, job.motor_ratio)
+    return {
+        "version": CACHE_VERSION,
+        "robot_count": job.robot_count,
+        "robot": _canonical_value([motor_weight, battery_weight, other_weight]),
+        "world": _canonical_value(list(asdict(job.world).items())),
+        "controller": f"{job.controller.__module__}.{job.controller.__qualname__}",
+        "controller_constants": controller_constants(job.controller),
+        "time_limit": _canonical_value(float(job.time_limit)),
+    }
+
+
+def _digest(description: dict) -> str:
+    return hashlib.sha256(json.dumps(description, sort_keys=True).encode()).hexdigest()
+
+
+def job_key(job: ColonyJob) -> str:
+    """Canonical hash of everything that determines the outcome of a colony job. Genomes that
+    describe the same colony (e.g. 12.3 and 12.9 robots) share a key."""
+    return _digest(_describe(job) | {"seed": job.seed})
+
+
+def colony_seed(job: ColonyJob) -> int:
+    """Seed derived from the canonical colony, so the same colony always gets the same seed
+    (common random numbers) and repeated genomes share a cache key"""
+    return int(_digest(_describe(job))[:8], 16) & (2**31 - 1)
+
+
+class ResultsCache:
+    """Counters of finished colony jobs, stored in a local SQLite file so that repeat evaluations
+    are free across GA generations and across separate runs. Use ':memory:' for a throwaway cache."""
+
+    def __init__(self, path: str = "colony_results.sqlite"):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, counters TEXT NOT NULL, created REAL NOT NULL)")
+        self._connection.commit()
+
+        # Statistics for this session
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, job: ColonyJob) -> dict | None:
+        row = self._connection.execute("SELECT counters FROM results WHERE key = ?", (job_key(job),)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, job: ColonyJob, counters: dict):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results (key, counters, created) VALUES (?, ?, ?)",
+            (job_key(job), json.dumps(counters, sort_keys=True), time()),
+        )
+        self._connection.commit()
+
+    def get_stats(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.0%} hit rate), {len(self)} stored results"
@@ -0,0 +1,146 @@
+import os;os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+from dataclasses import dataclass, field
+from algorithms.base_controller import BaseController
+from algorithms.random_and_recruit_controller import RandomRecruitController
+from engine.energy import EnergyLedger
+from engine.environment import Environment
+from engine.recorder import FrameRecorder
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from evolutionary.evolutionary_test_02 import COLONY_TOTAL_WEIGHT, get_single_robot
+from sim_math.units import Mass
+
+
+@dataclass(frozen=True)
+class WorldParams:
+    id: int = 0
+    resource_count: int = 10
+    resource_radius: int = 150
+    min_dist: int = 500
+    max_dist: int = 1000
+    waypoint_distance: int = 90
+    waypoint_count: int = 31
+    homebase_threshold: int = 80
+    comms_range: int = 300
+    light_range: int = 300
+    pheromones: bool = False  # pheromone field, and the robots explore by it
+
+
+WORLDS: list[WorldParams] = [
+    WorldParams(id=0, resource_count=50, resource_radius=10, min_dist=500, max_dist=1400, waypoint_distance=100),  # World 0: 200 small resources
+    WorldParams(id=1, resource_count=10, resource_radius=50, min_dist=500, max_dist=1400, waypoint_distance=100),  # World 1: 30 medium resources
+    WorldParams(id=2, resource_count=3, resource_radius=200, min_dist=500, max_dist=1400, waypoint_distance=100),  # World 2: 3 large resources
+    WorldParams(id=3, resource_count=10, resource_radius=50, min_dist=400, max_dist=500, waypoint_distance=100),  # World 3: close by resources
+    WorldParams(id=4, resource_count=10, resource_radius=50, min_dist=1300, max_dist=1400, waypoint_distance=100),  # World 4: far away located resources
+]
+
+
+@dataclass(frozen=True)
+class ColonyJob:
+    """Picklable description of one colony simulation"""
+    robot_count: int
+    motor_ratio: float
+    time_limit: float
+    seed: int
+    world: WorldParams = field(default_factory=WorldParams)
+    controller: type[BaseController] = RandomRecruitController
+    batch_powertrain: bool = True  # same outcome either way, so not part of the cache key
+
+    @classmethod
+    def from_solution(cls, solution, time_limit: float, seed: int, world: WorldParams = None, controller: type[BaseController] = RandomRecruitController):
+        return cls(
+            robot_count=int(solution[0]),
+            motor_ratio=float(solution[1]),
+            time_limit=time_limit,
+            seed=seed,
+            world=world or WorldParams(),
+            controller=controller,
+        )
+
+
+def build_colony_simulation(job: ColonyJob) -> SimulationBase:
+    """Build a headless simulation of the colony described by the job"""
+    agent_motor_weight, agent_battery_weight, other_materials_weight = get_single_robot(COLONY_TOTAL_WEIGHT, job.robot_count, job.motor_ratio)
+    world = job.world
+
+    sim = SimulationBase(
+        enable_realtime=False,
+        enable_display=False,
+        time_limit_seconds=job.time_limit,
+        inputs=[job.robot_count, job.motor_ratio],
+        seed=job.seed,
+        batch_powertrain=job.batch_powertrain,
+    )
+    env = Environment(sim)
+    env.generate_waypoints(distance=world.waypoint_distance, x_count=world.waypoint_count, y_count=world.waypoint_count, homebase_threshold=world.homebase_threshold, visible=False)
+    if world.pheromones:
+        env.generate_pheromones()
+    env.generate_resources(count=world.resource_count, radius=world.resource_radius, min_dist=world.min_dist, max_dist=world.max_dist)
+    robot_spec = RobotSpec(
+        meta=sim.meta,
+        motor_mass=Mass.in_kg(agent_motor_weight),
+        battery_mass=Mass.in_kg(agent_battery_weight),
+        other_materials_mass=Mass.in_kg(other_materials_weight),
+    )
+    for _ in range(job.robot_count):
+        controller = job.controller()
+        if world.pheromones:
+            controller.PHEROMONE_EXPLORATION = True
+        robot = RobotBase(
+            sim=sim,
+            robot_spec=robot_spec,
+            position=(sim.rng.spawn.uniform(-1, 1) * 2, sim.rng.spawn.uniform(-1, 1) * 2),
+            angle=0,
+            controller=controller,
+            ignore_battery=True,
+            robot_collision=False,
+        )
+        robot._comms_range = world.comms_range
+        robot._light_range = world.light_range
+    return sim
+
+
+def run_colony_job(job: ColonyJob) -> dict:
+    """Run the colony simulation and return its counters"""
+    return build_colony_simulation(job).run()
+
+
+def record_colony_job(job: ColonyJob, path: str, every: int = 2, size: tuple[int, int] | None = None, format: str = "png") -> dict:
+    """Replay the colony job headless while recording every Nth frame to path"""
+    sim = build_colony_simulation(job)
+    sim.meta.camera_scale = 0.25  # fit the colony's resources
+    with FrameRecorder(sim, path, every=every, size=size, format=format):
+        return sim.run()
+
+
+def ledger_colony_job(job: ColonyJob, every: int = 10, path: str | None = None) -> tuple[dict, dict]:
+    """Run the colony job with an energy ledger sampling every Nth frame, returns the counters
+    and the ledger's arrays"""
+    sim = build_colony_simulation(job)
+    capacity = int(job.time_limit * sim.fps) // every + 1
+    with EnergyLedger(sim, every=every, capacity=capacity, path=path) as ledger:
+        counters = sim.run()
+    return counters, ledger.to_arrays()
+
+
+def run_colony_job_staged(job: ColonyJob, checkpoints: list[float], should_continue) -> dict:
+    """Run the colony simulation, pausing at each checkpoint (in simulated seconds) to ask
+    should_continue(checkpoint_index, counters) whether to go on. A stopped run gets a
+    "stopped_at" counter. Runs that are not stopped give the same counters as run_colony_job."""
+    sim = build_colony_simulation(job)
+    for index, checkpoint in enumerate(checkpoints):
+        sim.run_until(lambda s: s.get_time_running() >= checkpoint)
+        if not sim.physics_thread:
+            break  # finished early or reached the time limit
+        if not should_continue(index, dict(sim.counters)):
+            sim.set_counter("stopped_at", sim.get_time_running())
+            return sim.counters
+    sim.run_until(lambda s: False)
+    return sim.counters
+
+
+def colony_fitness(counters: dict, time_limit: float) -> float:
+    collected_resources = counters.get("collected_resources", 0)
+    completed_time = counters.get("finished_early_time", time_limit)
+    return time_limit / completed_time * collected_resources
@@ -0,0 +1,157 @@
+import os;os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
+import multiprocessing
+import random
+from time import time
+from algorithms.random_and_recruit_controller import RandomRecruitController
+from dataclasses import replace
+from evolutionary.cache import ResultsCache, colony_seed, job_key
+from evolutionary.colony import ColonyJob, WorldParams, colony_fitness, run_colony_job
+from evolutionary.halving import SuccessiveHalving, run_colony_job_halving
+
+
+def _init_worker():
+    # Pay for the heavy imports once per worker instead of once per job
+    import pygame  # noqa: F401
+    import pymunk  # noqa: F401
+    import engine.simulation  # noqa: F401
+
+
+class ColonyEvaluator:
+    """Evaluates colony jobs on a pool of long-lived worker processes.
+
+    Each job is sent to a worker as a small ColonyJob, and only the counters dict comes
+    back. With a ResultsCache, repeated colonies are answered from the cache and only the
+    distinct misses of a batch are simulated. With SuccessiveHalving, jobs that fall behind
+    at a checkpoint are stopped early (rung scores are kept for the life of the evaluator, so
+    later generations are compared against earlier ones). Use fitness_func as a batch fitness function for pygad:
+
+        with ColonyEvaluator(processes=8, time_limit=30) as evaluator:
+            pygad.GA(fitness_func=evaluator.fitness_func, fitness_batch_size=8, ...)
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        time_limit: float = 30,
+        world: WorldParams = None,
+        seed: int | None = None,
+        controller=RandomRecruitController,
+        cache: ResultsCache | None = None,
+        halving: SuccessiveHalving | None = None,
+    ):
+        self.processes = processes or os.cpu_count()
+        self.time_limit = time_limit
+        self.world = world or WorldParams()
+        self.seed = seed
+        self.controller = controller
+        self.cache = cache
+        self.halving = halving
+        self._pool = None
+        self._manager = None
+        self._rungs = None
+        self._rungs_lock = None
+
+        # Throughput statistics
+        self.evaluations = 0
+        self.evaluation_time = 0.0
+        self.stopped_early = 0
+        self.simulated_seconds = 0.0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        # The manager is started first, forking after the pool threads exist is unsafe
+        if self.halving is not None and self._manager is None:
+            self._manager = multiprocessing.Manager()
+            self._rungs = self._manager.dict()
+            self._rungs_lock = self._manager.Lock()
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(processes=self.processes, initializer=_init_worker)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+
+    @property
+    def evaluations_per_minute(self) -> float:
+        if self.evaluation_time == 0:
+            return 0.0
+        return self.evaluations / self.evaluation_time * 60
+
+    def make_job(self, solution) -> ColonyJob:
+        """Job for a genome. Without a fixed seed, a cached evaluator derives the seed from the
+        colony so repeats hit the cache, otherwise each job gets a random seed."""
+        if self.seed is not None:
+            seed = self.seed
+        elif self.cache is None:
+            seed = random.randint(0, 2**31 - 1)
+        else:
+            job = ColonyJob.from_solution(solution, time_limit=self.time_limit, seed=0, world=self.world, controller=self.controller)
+            return replace(job, seed=colony_seed(job))
+        return ColonyJob.from_solution(solution, time_limit=self.time_limit, seed=seed, world=self.world, controller=self.controller)
+
+    def evaluate(self, jobs: list[ColonyJob]) -> list[dict]:
+        """Run the jobs on the worker pool and return their counters, in order"""
+        if self.cache is None:
+            return self._run(jobs)
+
+        results = [self.cache.get(job) for job in jobs]
+        pending: dict[str, ColonyJob] = {}
+        for job, counters in zip(jobs, results):
+            if counters is None:
+                pending.setdefault(job_key(job), job)
+        for key, counters in zip(pending, self._run(list(pending.values()))):
+            if "stopped_at" not in counters:
+                self.cache.put(pending[key], counters)
+            pending[key] = counters
+        return [counters if counters is not None else pending[job_key(job)] for job, counters in zip(jobs, results)]
+
+    def _run(self, jobs: list[ColonyJob]) -> list[dict]:
+        if not jobs:
+            return []
+        self.start()
+        start = time()
+        if self.halving is None:
+            results = self._pool.map(run_colony_job, jobs, chunksize=1)
+        else:
+            arguments = [(job, self.halving, self._rungs, self._rungs_lock) for job in jobs]
+            results = self._pool.starmap(run_colony_job_halving, arguments, chunksize=1)
+        self.evaluation_time += time() - start
+        self.evaluations += len(jobs)
+        for job, counters in zip(jobs, results):
+            self.stopped_early += "stopped_at" in counters
+            self.simulated_seconds += counters.get("stopped_at", counters.get("finished_early_time", job.time_limit))
+        return results
+
+    def fitness_func(self, ga_instance, solutions, solution_indices) -> list[float]:
+        """Batch fitness function for pygad (set fitness_batch_size on the GA)"""
+        jobs = [self.make_job(solution) for solution in solutions]
+        return [colony_fitness(counters, job.time_limit) for counters, job in zip(self.evaluate(jobs), jobs)]
+
+    def get_stats(self) -> str:
+        stats = f"{self.evaluations} evaluations in {self.evaluation_time:.1f}s ({self.evaluations_per_minute:.1f} evaluations/min)"
+        if self.halving is not None:
+            stats += f", {self.stopped_early} stopped early, {self.simulated_seconds:.0f} simulated seconds"
+        if self.cache is not None:
+            stats += f", cache: {self.cache.get_stats()}"
+        return stats
+
+
+if __name__ == "__main__":
+    from evolutionary.evolutionary_test_02 import MIN_AGENT_COUNT, MAX_AGENT_COUNT, MIN_MOTOR_RATIO, MAX_MOTOR_RATIO
+
+    solutions = [(random.randint(MIN_AGENT_COUNT, MAX_AGENT_COUNT), random.uniform(MIN_MOTOR_RATIO, MAX_MOTOR_RATIO)) for _ in range(16)]
+    with ResultsCache() as cache, ColonyEvaluator(time_limit=10, cache=cache) as evaluator:
+        fitness = evaluator.fitness_func(None, solutions, list(range(len(solutions))))
+        print(f"Fitness: {fitness}")
+        print(evaluator.get_stats())
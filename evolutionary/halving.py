@@ -0,0 +1,42 @@
+import math
+from dataclasses import dataclass
+from evolutionary.colony import ColonyJob, colony_fitness, run_colony_job_staged
+
+
+@dataclass(frozen=True)
+class SuccessiveHalving:
+    """Early stopping for colony evaluations (asynchronous successive halving).
+
+    At each checkpoint (a fraction of the time limit) a running job reports its partial
+    fitness to a shared rung table. It keeps running only while fewer than
+    max(top_k, reports / eta) of the scores already reported at that rung beat it, so early
+    reporters always continue and later ones have to beat the field. Survivors run to the full
+    time limit and keep their full-fidelity score; stopped jobs score their partial fitness,
+    which is a lower bound because resources are never uncollected.
+    """
+    checkpoints: tuple[float, ...] = (0.25, 0.5)
+    eta: float = 2
+    top_k: int = 3
+
+    def checkpoint_times(self, time_limit: float) -> list[float]:
+        return [fraction * time_limit for fraction in self.checkpoints]
+
+    def keeps(self, score: float, rung_scores: list[float]) -> bool:
+        """Whether a job with this score continues, given all scores reported at the rung (including its own)"""
+        keep = max(self.top_k, math.ceil(len(rung_scores) / self.eta))
+        better = sum(1 for other in rung_scores if other > score)
+        return better < keep
+
+
+def run_colony_job_halving(job: ColonyJob, halving: SuccessiveHalving, rungs, lock) -> dict:
+    """Run one job in a worker, sharing partial scores through the rungs (a managed dict of
+    rung index -> list of scores) so that jobs running on other workers can be compared"""
+
+    def should_continue(rung_index: int, counters: dict) -> bool:
+        score = colony_fitness(counters, job.time_limit)
+        with lock:
+            rung_scores = rungs.get(rung_index, []) + [score]
+            rungs[rung_index] = rung_scores
+        return halving.keeps(score, rung_scores)
+
+    return run_colony_job_staged(job, halving.checkpoint_times(job.time_limit), should_continue)
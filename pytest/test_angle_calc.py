@@ -1,6 +1,7 @@
 import math
 import pytest
-from sim_math.angles import calc_relative_angle, calc_waypoint_dir_from_angle
+import numpy as np
+from sim_math.angles import calc_relative_angle, calc_relative_angles, calc_waypoint_dir_from_angle
 from engine.types import Direction
 
 PI = math.pi
@@ -259,3 +260,17 @@ def test_calc_neighbour_angle(subject_pose, neighbour_pos, allowe_values, desc):
             valid = True
     err_msg = f"Expected {expected}, got {actual}. For {desc}"
     assert valid, err_msg
+
+
+@pytest.mark.parametrize("subject_pose,neighbour_pos,allowe_values,desc", test_data)
+def test_calc_relative_angles__matches_scalar(subject_pose, neighbour_pos, allowe_values, desc):
+    # Arrange
+    subject_pos = np.array([[subject_pose[0], subject_pose[1]]], dtype=float)
+    subject_angle = np.array([subject_pose[2]])
+
+    # Act
+    actual = calc_relative_angles(subject_pos, subject_angle, neighbour_pos)[0]
+
+    # Assert
+    expected = calc_relative_angle((subject_pose[0], subject_pose[1]), subject_pose[2], neighbour_pos)
+    assert math.isclose(actual, expected, abs_tol=1e-12), f"Expected {expected}, got {actual}. For {desc}"
@@ -0,0 +1,58 @@
+from benchmarks.compare import compare
+import numpy as np
+from benchmarks.run import run_benchmarks, run_scenario
+from benchmarks.scenarios import Scenario, build_scenario
+from engine.robot import RobotBase
+
+
+def test_run_scenario__records_metrics():
+    result = run_scenario(Scenario(name="tiny", robot_count=3, waypoint_count=5, frames=10))
+
+    assert result["frames"] == 10
+    assert result["steps_per_second"] > 0
+    assert result["frame_ms"]["p50"] <= result["frame_ms"]["p99"] <= result["frame_ms"]["max"]
+    assert result["peak_rss_mb"] > 0
+
+
+def test_run_benchmarks__peak_rss_excludes_the_parent_process():
+    ballast = np.ones(40_000_000)  # 320 MB resident in this process
+    results = run_benchmarks([Scenario(name="tiny", robot_count=3, waypoint_count=5, frames=10)])
+
+    assert results["scenarios"]["tiny"]["peak_rss_mb"] < ballast.nbytes / 2**20
+    del ballast
+
+
+def test_build_scenario__no_lights_never_turns_a_light_on():
+    sim = build_scenario(Scenario(name="no_lights", robot_count=30, lights=False))
+    robots = [obj for obj in sim.entities if isinstance(obj, RobotBase)]
+    light_frames = 0
+    for _ in range(1200):
+        sim.step(1)
+        light_frames += sum(robot.light_switch for robot in robots)
+    assert light_frames == 0
+
+
+def test_build_scenario__pheromones_drive_exploration():
+    sim = build_scenario(Scenario(name="pheromones", robot_count=5, pheromones=True))
+    robots = [obj for obj in sim.entities if isinstance(obj, RobotBase)]
+    sim.step(200)
+
+    assert all(robot.controller.PHEROMONE_EXPLORATION for robot in robots)
+    assert sim.environment.pheromones.values.any()
+
+
+def get_results(steps_per_second, p99):
+    return {"scenarios": {"robots_3": {"steps_per_second": steps_per_second, "frame_ms": {"p50": 1.0, "p99": p99}, "peak_rss_mb": 30.0}}}
+
+
+def test_compare__flags_regressions():
+    rows = compare(get_results(1000, 2.0), get_results(800, 2.1), threshold=0.1)
+    regressions = {row["metric"] for row in rows if row["regression"]}
+
+    assert regressions == {"steps_per_second"}, f"Expected only steps_per_second to regress, but got {regressions}"
+
+
+def test_compare__improvements_are_not_regressions():
+    rows = compare(get_results(1000, 2.0), get_results(2000, 1.0))
+
+    assert not any(row["regression"] for row in rows)
@@ -0,0 +1,34 @@
+from dataclasses import replace
+
+from evolutionary.cache import ResultsCache, job_key
+from evolutionary.colony import ColonyJob, WorldParams
+
+JOB = ColonyJob(robot_count=10, motor_ratio=0.5, time_limit=30, seed=1)
+
+
+def test_job_key__ignores_truncated_genes():
+    assert job_key(JOB) == job_key(ColonyJob.from_solution((10.8, 0.5), time_limit=30, seed=1))
+
+
+def test_job_key__changes_with_setup():
+    keys = {
+        job_key(JOB),
+        job_key(replace(JOB, robot_count=11)),
+        job_key(replace(JOB, motor_ratio=0.6)),
+        job_key(replace(JOB, seed=2)),
+        job_key(replace(JOB, time_limit=60)),
+        job_key(replace(JOB, world=WorldParams(resource_count=11))),
+    }
+
+    assert len(keys) == 6, "Expected every change to give a new key"
+
+
+def test_results_cache__persists_between_connections(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    with ResultsCache(path) as cache:
+        assert cache.get(JOB) is None
+        cache.put(JOB, {"collected_resources": 3})
+
+    with ResultsCache(path) as cache:
+        assert cache.get(JOB) == {"collected_resources": 3}
+        assert cache.hits == 1 and cache.misses == 0
@@ -0,0 +1,77 @@
+import pytest
+
+from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+from engine.simulation import SimulationBase
+
+SMALL_WORLD = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+
+
+def get_positions(sim):
+    return {obj.entity_id: tuple(obj.body.position) for obj in sim.entities}
+
+
+def get_colony_sim():
+    return build_colony_simulation(ColonyJob(robot_count=5, motor_ratio=0.5, time_limit=5, seed=4, world=SMALL_WORLD))
+
+
+def test_restore__continues_like_the_original():
+    sim = get_colony_sim()
+    sim.step(60)
+
+    restored = SimulationBase.restore(sim.checkpoint())
+    sim.step(120)
+    restored.step(120)
+
+    assert restored.frame_count == sim.frame_count
+    assert restored.counters == sim.counters
+    assert get_positions(restored) == get_positions(sim)
+
+
+def test_fork__is_independent():
+    sim = get_colony_sim()
+    sim.step(30)
+    positions = get_positions(sim)
+
+    fork = sim.fork()
+    fork.step(30)
+
+    assert get_positions(sim) == positions
+    assert fork.frame_count == sim.frame_count + 30
+
+
+def test_fork__keeps_controller_and_waypoint_state():
+    sim = get_colony_sim()
+    sim.step(60)
+
+    fork = sim.fork()
+    robots = [obj for obj in fork.entities if hasattr(obj, "controller")]
+    waypoints = fork.environment.waypointData
+
+    assert all(robot.controller.sensors._robot is robot for robot in robots)
+    assert all(robot.controller.state.name for robot in robots)
+    assert waypoints[0].neighbors["up"] is waypoints[1]
+
+
+def test_checkpoint__rejects_profiled_simulation():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, profile=True)
+
+    with pytest.raises(RuntimeError):
+        sim.checkpoint()
+
+
+def test_checkpoint__large_waypoint_grid():
+    sim = build_colony_simulation(ColonyJob(robot_count=2, motor_ratio=0.5, time_limit=5, seed=4))
+    waypoints = SimulationBase.restore(sim.checkpoint()).environment.waypointData
+
+    assert len(waypoints) == 31 * 31
+    assert waypoints[0].neighbors["right"] is waypoints[31]
+
+
+def test_waypoint__pickles_and_copies_with_its_neighbor_objects():
+    import copy
+    import pickle
+
+    waypoints = get_colony_sim().environment.waypointData
+    for clone in (copy.deepcopy(waypoints[0]), pickle.loads(pickle.dumps(waypoints[0]))):
+        assert clone.neighbors["up"].id == waypoints[1].id
+        assert clone.neighbors["up"].neighbors["down"] is clone
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from engine.energy import EnergyLedger
+from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation, ledger_colony_job
+
+SMALL_WORLD = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+JOB = ColonyJob(robot_count=4, motor_ratio=0.5, time_limit=2, seed=4, world=SMALL_WORLD)
+
+
+def get_sim(finite_battery: bool = False):
+    sim = build_colony_simulation(JOB)
+    if finite_battery:
+        for robot in sim.robot_grid.robots:
+            robot.battery.infinite_power = False
+    return sim
+
+
+def test_ledger__samples_every_nth_frame():
+    sim = get_sim()
+    ledger = EnergyLedger(sim, every=5)
+    sim.step(50)
+    arrays = ledger.to_arrays()
+
+    assert arrays["frame"].tolist() == list(range(5, 51, 5))
+    assert arrays["watts"].shape == (10, 4)
+    assert arrays["amps"].shape == (10, 4, 2)
+    assert len(arrays["entity_id"]) == 4
+
+
+def test_ledger__watts_add_up_to_the_energy_drawn():
+    sim = get_sim(finite_battery=True)
+    ledger = EnergyLedger(sim, every=10)
+    sim.step(60)
+    arrays = ledger.to_arrays()
+
+    drawn__wh = arrays["watts"].sum(axis=0) * 10 / sim.meta.hour_to_frames
+    expected = [robot.battery.drawn__wh for robot in ledger.robots]
+    assert drawn__wh == pytest.approx(expected)
+    assert arrays["state_of_charge"][-1] == pytest.approx([robot.battery.remaining__wh / robot.battery.capacity__wh for robot in ledger.robots])
+
+
+def test_ledger__counts_failed_draws():
+    sim = get_sim(finite_battery=True)
+    for robot in sim.robot_grid.robots:
+        robot.battery.remaining__wh = 0.0
+    ledger = EnergyLedger(sim, every=10)
+    sim.step(60)
+
+    assert ledger.to_arrays()["failed_draws"].sum() == sum(robot.battery.failed_draws for robot in ledger.robots) > 0
+
+
+def test_ledger__ring_buffer_keeps_the_latest_samples():
+    sim = get_sim()
+    ledger = EnergyLedger(sim, every=1, capacity=8)
+    sim.step(20)
+
+    assert ledger.to_arrays()["frame"].tolist() == list(range(13, 21))
+
+
+def test_ledger_colony_job__exports_at_the_end_of_the_run(tmp_path):
+    path = tmp_path / "energy.npz"
+    counters, arrays = ledger_colony_job(JOB, every=10, path=str(path))
+
+    saved = np.load(path)
+    assert arrays["frame"][-1] == 120
+    assert np.array_equal(saved["watts"], arrays["watts"])
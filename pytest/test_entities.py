@@ -0,0 +1,74 @@
+from engine.entities import EntityRegistry
+from engine.environment import Environment, Resource
+from engine.objects import Circle
+from engine.simulation import SimulationBase
+
+
+def get_circles(count):
+    return [Circle(x=i * 10, y=0, radius=5) for i in range(count)]
+
+
+def test_add__assigns_stable_ids():
+    registry = EntityRegistry()
+    circles = get_circles(3)
+
+    ids = [registry.add(circle) for circle in circles]
+
+    assert ids == [0, 1, 2]
+    assert registry.add(circles[1]) == 1, "Registering twice should keep the id"
+    assert len(registry) == 3
+
+
+def test_lookups_by_id_shape_and_body():
+    registry = EntityRegistry()
+    circles = get_circles(3)
+    for circle in circles:
+        registry.add(circle)
+
+    for circle in circles:
+        assert registry.get(circle.entity_id) is circle
+        assert registry.get_by_shape(circle.shape) is circle
+        assert registry.get_by_body(circle.body) is circle
+
+
+def test_remove__swaps_last_into_slot():
+    registry = EntityRegistry()
+    circles = get_circles(4)
+    for circle in circles:
+        registry.add(circle)
+
+    assert registry.remove(circles[1])
+    assert not registry.remove(circles[1]), "Removing twice should be a no-op"
+
+    assert circles[1] not in registry
+    assert registry.get_by_shape(circles[1].shape) is None
+    assert list(registry) == [circles[0], circles[3], circles[2]]
+    assert registry.get(circles[3].entity_id) is circles[3]
+
+
+def test_remove__identical_objects_are_distinct():
+    # Dataclass equality would consider these equal
+    registry = EntityRegistry()
+    first, second = Circle(x=0, y=0, radius=5), Circle(x=0, y=0, radius=5)
+    registry.add(first)
+    registry.add(second)
+
+    registry.remove(second)
+
+    assert first in registry
+    assert second not in registry
+
+
+def test_homebase_collision__delivers_resource_by_shape():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_resources(count=3, min_dist=500, max_dist=600, radius=10)
+    resource: Resource = env.resources[1]
+
+    # Move the resource into the homebase
+    resource.body.position = (0, 0)
+    sim.step(1)
+
+    assert resource not in env.resources
+    assert resource not in sim.entities
+    assert sim.counters["collected_resources"] == 1
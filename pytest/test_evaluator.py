@@ -0,0 +1,57 @@
+from evolutionary.cache import ResultsCache
+from evolutionary.colony import ColonyJob, WorldParams, colony_fitness, run_colony_job
+from evolutionary.evaluator import ColonyEvaluator
+
+SMALL_WORLD = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+
+
+def test_run_colony_job__same_seed_same_counters():
+    job = ColonyJob(robot_count=5, motor_ratio=0.5, time_limit=2, seed=3, world=SMALL_WORLD)
+
+    first = run_colony_job(job)
+    second = run_colony_job(job)
+
+    assert first == second, f"Expected {first} to equal {second}"
+
+
+def test_colony_fitness():
+    assert colony_fitness({}, time_limit=30) == 0
+    assert colony_fitness({"collected_resources": 4}, time_limit=30) == 4
+    assert colony_fitness({"collected_resources": 10, "finished_early_time": 15}, time_limit=30) == 20
+
+
+def test_evaluator__matches_inline_runs():
+    solutions = [(4, 0.3), (6, 0.6), (3, 0.5)]
+
+    with ColonyEvaluator(processes=2, time_limit=1, world=SMALL_WORLD, seed=11) as evaluator:
+        fitness = evaluator.fitness_func(None, solutions, [0, 1, 2])
+
+    expected = [colony_fitness(run_colony_job(evaluator.make_job(solution)), time_limit=1) for solution in solutions]
+    assert fitness == expected, f"Expected {expected}, but got {fitness}"
+    assert evaluator.evaluations == 3
+    assert evaluator.evaluations_per_minute > 0
+
+
+def test_evaluator__cache_skips_repeated_colonies():
+    solutions = [(4, 0.3), (4.7, 0.3), (6, 0.6)]  # the first two describe the same colony
+
+    with ResultsCache(":memory:") as cache, ColonyEvaluator(processes=2, time_limit=1, world=SMALL_WORLD, seed=11, cache=cache) as evaluator:
+        first = evaluator.fitness_func(None, solutions, [0, 1, 2])
+        second = evaluator.fitness_func(None, solutions, [0, 1, 2])
+
+        assert first == second, f"Expected {first} to equal {second}"
+        assert first[0] == first[1]
+        assert evaluator.evaluations == 2, f"Expected 2 simulations, but got {evaluator.evaluations}"
+        assert len(cache) == 2
+        assert cache.hits == 3 and cache.misses == 3, cache.get_stats()
+
+
+def test_evaluator__cache_without_seed_hits_on_repeated_genomes():
+    with ResultsCache(":memory:") as cache, ColonyEvaluator(processes=1, time_limit=1, world=SMALL_WORLD, cache=cache) as evaluator:
+        first = evaluator.fitness_func(None, [(4, 0.3)], [0])
+        assert evaluator.evaluations == 1
+        second = evaluator.fitness_func(None, [(4, 0.3)], [0])
+
+        assert first == second
+        assert evaluator.evaluations == 1, f"Expected no new simulation, but got {evaluator.evaluations}"
+        assert cache.hits == 1 and cache.misses == 1, cache.get_stats()
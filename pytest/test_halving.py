@@ -0,0 +1,50 @@
+from evolutionary.colony import ColonyJob, WorldParams, colony_fitness, run_colony_job, run_colony_job_staged
+from evolutionary.evaluator import ColonyEvaluator
+from evolutionary.halving import SuccessiveHalving
+
+SMALL_WORLD = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+JOB = ColonyJob(robot_count=5, motor_ratio=0.5, time_limit=2, seed=3, world=SMALL_WORLD)
+
+
+def test_keeps__early_reporters_continue():
+    halving = SuccessiveHalving(eta=2, top_k=2)
+
+    assert halving.keeps(0, [0])
+    assert halving.keeps(0, [5, 0])
+
+
+def test_keeps__later_reporters_must_beat_the_field():
+    halving = SuccessiveHalving(eta=2, top_k=1)
+    rung_scores = [5, 4, 3, 2, 1, 0]
+
+    assert halving.keeps(3, rung_scores)
+    assert not halving.keeps(2, rung_scores)
+
+
+def test_run_colony_job_staged__matches_full_run():
+    counters = run_colony_job_staged(JOB, [0.5, 1], lambda index, counters: True)
+
+    assert counters == run_colony_job(JOB), f"Expected {run_colony_job(JOB)}, but got {counters}"
+
+
+def test_run_colony_job_staged__stops_at_checkpoint():
+    counters = run_colony_job_staged(JOB, [0.5, 1], lambda index, counters: index == 0)
+
+    assert counters["stopped_at"] == 1
+
+
+def test_evaluator__survivors_get_full_scores():
+    solutions = [(4, 0.3), (6, 0.6), (3, 0.5), (8, 0.4)]
+    halving = SuccessiveHalving(checkpoints=(0.5,), eta=2, top_k=1)
+
+    with ColonyEvaluator(processes=2, time_limit=1, world=SMALL_WORLD, seed=11, halving=halving) as evaluator:
+        jobs = [evaluator.make_job(solution) for solution in solutions]
+        results = evaluator.evaluate(jobs)
+
+    assert evaluator.evaluations == 4
+    for job, counters in zip(jobs, results):
+        full_fitness = colony_fitness(run_colony_job(job), time_limit=1)
+        if "stopped_at" in counters:
+            assert colony_fitness(counters, time_limit=1) <= full_fitness
+        else:
+            assert counters == run_colony_job(job)
@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+import pymunk
+from engine.environment import Environment
+from engine.objects import Box
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from sim_math.units import Mass
+
+
+def get_world(robot_count=30, robot_collision=True):
+    random.seed(42)
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_waypoints(distance=50, x_count=5, y_count=5)
+    env.generate_resources(count=8, min_dist=50, max_dist=200, radius=20)
+    Box(x=120, y=-80, angle=0.3, width=60, length=20, sim=sim)
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    robots = []
+    for _ in range(robot_count):
+        robot = RobotBase(
+            robot_spec=spec,
+            sim=sim,
+            position=(random.uniform(-200, 200), random.uniform(-200, 200)),
+            sensor_range=150,
+            robot_collision=robot_collision,
+        )
+        robot.body.angle = random.uniform(0, 2 * np.pi)
+        robots.append(robot)
+    return sim, robots
+
+
+def expected_lidar(robot: RobotBase):
+    """Single segment query per ray, as done without batch sensing."""
+    ray_filter = pymunk.ShapeFilter(mask=0b0001 | 0b0010 | 0b0100, group=robot.robot_group)
+    expected = []
+    for sensor in robot._ir_sensors:
+        angle = robot.body.angle + sensor.angle
+        start = robot.body.position
+        end = start + pymunk.Vec2d(np.cos(angle), np.sin(angle)) * robot._lidar_range
+        hit = robot.sim.space.segment_query_first(start, end, 1.0, shape_filter=ray_filter)
+        if hit:
+            expected.append((hit.alpha * robot._lidar_range, hit.shape.body.gameobject))
+        else:
+            expected.append((robot._lidar_range, None))
+    return expected
+
+
+def assert_matches_segment_queries(robots: list[RobotBase]):
+    hits = 0
+    for robot in robots:
+        for sensor, (distance, gameobject) in zip(robot.ir_sensors, expected_lidar(robot)):
+            assert abs(sensor.distance - distance) < 1e-6, f"Expected distance {distance}, but got {sensor.distance}"
+            assert sensor.gameobject is gameobject, f"Expected {gameobject}, but got {sensor.gameobject}"
+            hits += gameobject is not None
+    assert hits > 0, "Expected the world to produce some hits"
+
+
+def test_batch_lidar__matches_segment_queries():
+    sim, robots = get_world()
+
+    sim.step(1)
+
+    assert_matches_segment_queries(robots)
+
+
+def test_batch_lidar__matches_segment_queries_without_robot_collision():
+    sim, robots = get_world(robot_collision=False)
+
+    sim.step(1)
+
+    assert_matches_segment_queries(robots)
+
+
+def test_batch_lidar__ignores_removed_objects():
+    sim, robots = get_world()
+    sim.step(1)
+
+    for resource in list(sim.environment.resources):
+        sim.remove_game_object(resource)
+    sim.remove_game_object(robots.pop())
+    sim.step(1)
+
+    assert_matches_segment_queries(robots)
@@ -0,0 +1,120 @@
+import math
+import random
+
+import pytest
+from engine.environment import Environment
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from engine.types import LocationEventKind
+from sim_math.units import Mass
+
+
+def get_world(positions, distance=100, count=7):
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_waypoints(distance=distance, x_count=count, y_count=count, homebase_threshold=80, visible=False)
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    robots = [RobotBase(robot_spec=spec, sim=sim, position=position, robot_collision=False) for position in positions]
+    return sim, env, robots
+
+
+def nearest_by_scan(env, position):
+    return min(env.get_all_waypoints(), key=lambda waypoint: (waypoint.position.get_distance(position), waypoint.id))
+
+
+def test_location__matches_a_scan_over_all_waypoints():
+    random.seed(3)
+    positions = [(random.uniform(-450, 450), random.uniform(-450, 450)) for _ in range(40)]
+    sim, env, robots = get_world(positions)
+    sim.frame_count += 1
+
+    for robot in robots:
+        location = env.locations.location(robot)
+        nearest = nearest_by_scan(env, robot.body.position)
+        assert location.waypoint_id == nearest.id
+        assert location.waypoint_distance == pytest.approx(nearest.position.get_distance(robot.body.position))
+        assert location.cell == (nearest.id // 7, nearest.id % 7)
+        homebase = env.homebase.shape.cache_bb()
+        assert ("homebase" in location.regions) == homebase.contains_vect(robot.body.position)
+
+
+def test_is_near__matches_the_distance_check():
+    random.seed(5)
+    positions = [(random.uniform(-350, 350), random.uniform(-350, 350)) for _ in range(40)]
+    sim, env, robots = get_world(positions)
+    sim.frame_count += 1
+
+    for robot in robots:
+        for waypoint in env.get_all_waypoints():
+            for threshold in (robot.radius, 30, 50, 120):
+                expected = waypoint.position.get_distance(robot.body.position) < threshold
+                assert env.locations.is_near(robot, waypoint, threshold) == expected
+
+
+def test_events__arrivals_and_regions_once_per_change():
+    sim, env, robots = get_world([(340, 340)])
+    robot = robots[0]
+    env.register_region("corner", (250, 250, 350, 350))
+    sim.step(1)
+    assert [event.kind for event in env.locations.events(robot)] == [LocationEventKind.ENTERED]
+    assert env.locations.events(robot)[0].region == "corner"
+
+    # Onto a waypoint, then leaving the corner into the homebase
+    robot.body.position = (200, 200)
+    sim.step(1)
+    events = env.locations.events(robot)
+    assert [(event.kind, event.waypoint_id, event.region) for event in events] == [
+        (LocationEventKind.ARRIVED, env.nearest_waypoint((200, 200)).id, None),
+        (LocationEventKind.EXITED, None, "corner"),
+    ]
+    assert events[0].frame == sim.frame_count
+    sim.step(1)
+    assert env.locations.events(robot) == []
+
+    robot.body.position = (0, 0)
+    sim.step(1)
+    kinds = {(event.kind, event.region) for event in env.locations.events(robot)}
+    assert kinds == {(LocationEventKind.ARRIVED, None), (LocationEventKind.ENTERED, "homebase")}
+    assert env.locations.is_inside(robot, "homebase")
+
+
+def test_location__follows_robots_added_and_removed_mid_frame():
+    sim, env, robots = get_world([(0, 0), (300, 300)])
+    sim.step(1)
+    before = env.locations.location(robots[1])
+
+    sim.remove_game_object(robots[0])
+    assert env.locations.location(robots[1]) == before
+    assert before.waypoint_id == env.nearest_waypoint((300, 300)).id and before.regions == ()
+
+    spec = robots[1].spec
+    added = RobotBase(robot_spec=spec, sim=sim, position=(-300, 300), robot_collision=False)
+    assert env.locations.location(added).waypoint_id == env.nearest_waypoint((-300, 300)).id
+    assert env.locations.location(robots[1]) == before
+    # The new robot arrived this frame, the others keep their events of the frame
+    assert [event.kind for event in env.locations.events(added)] == [LocationEventKind.ARRIVED]
+
+
+def test_recruit_controller__arrival_checks_match_distances():
+    from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+    from algorithms.sensor_api import RobotSensorAPI
+
+    world = WorldParams(resource_count=2, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+    sim = build_colony_simulation(ColonyJob(robot_count=5, motor_ratio=0.5, time_limit=10, seed=4, world=world))
+    checks = []
+    is_near_waypoint = RobotSensorAPI.is_near_waypoint
+
+    def checked(sensors, waypoint, threshold):
+        near = is_near_waypoint(sensors, waypoint, threshold)
+        checks.append(near == (waypoint.position.get_distance(sensors.get_robot_position()) < threshold))
+        return near
+
+    RobotSensorAPI.is_near_waypoint = checked
+    try:
+        sim.step(400)
+    finally:
+        RobotSensorAPI.is_near_waypoint = is_near_waypoint
+    assert checks and all(checks)
+    controller = next(robot.controller for robot in sim.entities if isinstance(robot, RobotBase))
+    assert controller.HOME_BASE_WAYPOINT is next(waypoint for waypoint in controller.ALL_WAYPOINTS if waypoint.is_homebase)
@@ -0,0 +1,136 @@
+import random
+
+import numpy as np
+import pymunk
+import pytest
+from engine.message_bus import BusMessage, MessageKind
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from sim_math.units import Mass
+
+
+def get_world(robot_count=30):
+    random.seed(7)
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    robots = []
+    for i in range(robot_count):
+        robot = RobotBase(robot_spec=spec, sim=sim, position=(random.uniform(-400, 400), random.uniform(-400, 400)), robot_collision=False)
+        robot._comms_range = random.choice([50, 300])
+        if i % 2 == 0:
+            sim.message_bus.send(robot, BusMessage(MessageKind.RETRIEVE_PATH, qualifier=i, waypoint_ids=[i, i + 1]))
+        robots.append(robot)
+    return sim, robots
+
+
+def robots_in_range(robot: RobotBase, radius: float) -> list[RobotBase]:
+    ray_filter = pymunk.ShapeFilter(mask=0b0001 | 0b0010 | 0b0100, group=robot.robot_group)
+    results = robot.sim.space.point_query(robot.body.position, radius, ray_filter)
+    return [r.shape.body.gameobject for r in results if isinstance(r.shape.body.gameobject, RobotBase)]
+
+
+def test_receive__matches_point_queries_of_sending_robots():
+    sim, robots = get_world()
+    bus = sim.message_bus
+    sim.frame_count += 1
+    sim._preupdate()
+
+    received = 0
+    for robot in robots:
+        expected = []
+        if bus.sent(robot):
+            expected = [bus.sent(other).qualifier for other in robots_in_range(robot, robot._comms_range) if bus.sent(other)]
+        actual = [message.qualifier for message in bus.receive(robot)]
+        assert sorted(actual) == sorted(expected)
+        received += len(actual)
+    assert received > 0, "Expected the world to produce some messages"
+
+
+def test_receive__sees_messages_published_at_the_start_of_the_frame():
+    sim, robots = get_world(robot_count=2)
+    sender, receiver = robots
+    receiver.body.position = sender.body.position + (10, 0)
+    bus = sim.message_bus
+    bus.send(sender, BusMessage(MessageKind.RETRIEVE_PATH, qualifier=5))
+    bus.send(receiver, BusMessage(MessageKind.RETRIEVE_PATH, qualifier=6))
+    sim.frame_count += 1
+    sim._preupdate()
+
+    bus.send(sender, None)
+    assert [message.qualifier for message in bus.receive(receiver)] == [5]
+
+    sim.frame_count += 1
+    sim._preupdate()
+    assert bus.receive(receiver) == []
+
+
+def test_bus_message__is_immutable():
+    message = BusMessage(MessageKind.RETRIEVE_PATH, qualifier=3, waypoint_ids=[1, 2, 3])
+
+    with pytest.raises(ValueError):
+        message.waypoint_ids[0] = 7
+    with pytest.raises(AttributeError):
+        message.extra = 1
+    assert message.waypoint_ids.dtype == np.int32
+    assert message.same_content(BusMessage(MessageKind.RETRIEVE_PATH, qualifier=3, waypoint_ids=(1, 2, 3)))
+
+
+def test_intern__same_content_is_the_same_message():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    bus = sim.message_bus
+
+    first = bus.intern(MessageKind.RETRIEVE_PATH, 7, [1, 2, 3])
+    again = bus.intern(MessageKind.RETRIEVE_PATH, 7, (1, 2, 3))
+    shorter = bus.intern(MessageKind.RETRIEVE_PATH, 7, [1, 2])
+    other = bus.intern(MessageKind.RETRIEVE_PATH, 8, [1, 2, 3])
+
+    assert first is again
+    assert (first.length, first.qualifier, first.version) == (3, 7, 1)
+    assert (shorter.length, shorter.qualifier, shorter.version) == (2, 7, 2)
+    assert other.version == 1
+
+
+def test_publish__drops_interned_messages_nobody_sends():
+    sim, (robot,) = get_world(robot_count=1)
+    bus = sim.message_bus
+
+    sent = bus.intern(MessageKind.RETRIEVE_PATH, 7, [1, 2, 3])
+    bus.send(robot, sent)
+    bus.intern(MessageKind.RETRIEVE_PATH, 7, [1, 2])
+    bus.intern(MessageKind.RETRIEVE_PATH, 8, [4])
+    bus.publish()
+
+    assert bus.intern(MessageKind.RETRIEVE_PATH, 7, [1, 2, 3]) is sent
+    assert list(bus._interned.values()) == [sent]
+    assert list(bus._versions) == [(MessageKind.RETRIEVE_PATH, 7)]
+    assert bus.intern(MessageKind.RETRIEVE_PATH, 8, [4]).version == 1
+
+
+def test_recruit_controller__sends_interned_paths_only_when_they_change():
+    from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+    from algorithms.random_and_recruit_controller import RobotState
+
+    world = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+    sim = build_colony_simulation(ColonyJob(robot_count=6, motor_ratio=0.5, time_limit=30, seed=4, world=world))
+    bus = sim.message_bus
+    sends = []
+    send = bus.send
+    bus.send = lambda robot, message: (sends.append(message), send(robot, message))
+    checked = 0
+    for _ in range(600):
+        sim.step(1)
+        for robot in sim.robot_grid.robots:
+            message = robot.controller.path_message
+            if robot.controller.state != RobotState.RETRIEVE or message is None:
+                continue
+            ids = [waypoint.id for waypoint in robot.controller.visited_waypoints] + [robot.controller.target_waypoint.id]
+            assert bus.sent(robot) is message
+            assert message.waypoint_ids.tolist() == ids
+            checked += 1
+
+    sent = [message for message in sends if message is not None]
+    assert checked > 0
+    assert len(sent) < checked
+    # Only the messages being sent stay interned
+    assert len(bus._interned) <= len(bus._outboxes) + len(sim.robot_grid.robots)
@@ -3,7 +3,7 @@ from typing import override
 from pymunk import Vec2d
 from engine.motor import DcMotor
 from engine.types import IBattery
-from sim_math.units import AngularSpeed, Distance, Torque
+from sim_math.units import AngularSpeed, Distance, Force, Torque
 from sim_math.world_meta import WorldMeta
 
 
@@ -101,3 +101,13 @@ def test_calc_required_amps():
     actual_current = motor._calc_required_amps(torque)
 
     assert actual_current == expected_current, f"Expected {expected_current}, but got {actual_current}"
+
+
+def test_request_force_scaled__clamped_and_typed():
+    _, _, _, motor = get_mocks(max_torque=0.1, max_voltage=12)
+
+    motor.request_force_scaled(force_scaler=2)
+
+    assert motor._force__dyne == motor.max_force.base_unit
+    assert isinstance(motor._force, Force)
+    assert motor._force == motor.max_force
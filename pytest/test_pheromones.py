@@ -0,0 +1,125 @@
+import math
+
+import numpy as np
+import pytest
+from engine.environment import Environment
+from engine.simulation import SimulationBase
+from engine.waypoints import WaypointGrid
+
+
+def get_env(channels=None, every=10, **kwargs):
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_waypoints(**({"distance": 10, "x_count": 5, "y_count": 5} | kwargs))
+    env.generate_pheromones(channels, every=every)
+    return sim, env
+
+
+def test_deposit_and_read__per_channel_and_waypoint():
+    _, env = get_env({"visits": 0.0, "trail": 0.5})
+    field = env.pheromones
+    field.deposit("visits", 3)
+    field.deposit("visits", 3, 2.0)
+    field.deposit("trail", 7, 0.25)
+
+    assert field.values.shape == (2, 25)
+    assert field.read("visits", 3) == 3.0
+    assert field.read("trail", 3) == 0.0
+    assert field.read("trail", 7) == 0.25
+    with pytest.raises(KeyError):
+        field.read("food", 3)
+
+
+def test_read_neighbors__nan_for_missing_neighbors():
+    _, env = get_env()
+    field = env.pheromones
+    grid = env.waypoint_grid
+    corner = 0
+    for neighbor_id in grid.neighbors[corner].tolist():
+        if neighbor_id != WaypointGrid.NO_NEIGHBOR:
+            field.deposit("visits", neighbor_id, neighbor_id)
+
+    amounts = field.read_neighbors("visits", corner)
+    for neighbor_id, amount in zip(grid.neighbors[corner].tolist(), amounts.tolist()):
+        if neighbor_id == WaypointGrid.NO_NEIGHBOR:
+            assert math.isnan(amount)
+        else:
+            assert amount == neighbor_id
+    # The field itself is untouched by the lookup
+    assert not np.isnan(field.values).any()
+
+
+def test_evaporation__every_nth_frame_per_channel_rate():
+    sim, env = get_env({"visits": 0.0, "trail": 0.5}, every=4)
+    field = env.pheromones
+    field.deposit("visits", 12, 1.0)
+    field.deposit("trail", 12, 1.0)
+
+    sim.step(3)
+    assert field.read("trail", 12) == 1.0
+    sim.step(1)
+    assert field.read("trail", 12) == 0.5
+    sim.step(8)
+    assert field.read("trail", 12) == 0.125
+    assert field.read("visits", 12) == 1.0
+
+
+def test_generate_pheromones__rejects_invalid_rates_and_missing_grid():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    with pytest.raises(RuntimeError):
+        env.generate_pheromones()
+    env.generate_waypoints()
+    with pytest.raises(ValueError):
+        env.generate_pheromones({"trail": 1.5})
+
+
+def test_generate_waypoints__keeps_the_channels_over_the_new_grid():
+    _, env = get_env({"visits": 0.0, "trail": 0.25}, every=3)
+    env.pheromones.deposit("visits", 0)
+    env.generate_waypoints(distance=10, x_count=7, y_count=3)
+
+    assert env.pheromones.grid is env.waypoint_grid
+    assert env.pheromones.values.shape == (2, 21)
+    assert env.pheromones.every == 3
+    assert env.pheromones.rates.tolist() == [0.0, 0.25]
+    assert not env.pheromones.values.any()
+
+
+def test_recruit_controller__deposits_visits_and_explores_least_visited():
+    from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+
+    world = WorldParams(resource_count=2, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9, pheromones=True)
+    sim = build_colony_simulation(ColonyJob(robot_count=4, motor_ratio=0.5, time_limit=10, seed=4, world=world))
+    field = sim.environment.pheromones
+    controllers = [robot.controller for robot in sim.entities if hasattr(robot, "controller")]
+    assert all(controller.PHEROMONE_EXPLORATION for controller in controllers)
+    sim.step(300)
+
+    # The visits count the arrivals of the whole swarm, on the fixed size field
+    assert field.values.shape == (2, 81)
+    assert field.read("visits", controllers[0].HOME_BASE_WAYPOINT.id) >= 1
+
+    # Exploring from a waypoint picks one of its least visited neighbors
+    controller = controllers[0]
+    controller.target_waypoint = controller.HOME_BASE_WAYPOINT
+    visits = controller.sensors.get_neighbor_pheromones("visits", controller.target_waypoint)
+    least = min(visits.values())
+    for _ in range(10):
+        choice = controller.get_random_waypoint()
+        assert field.read("visits", choice.id) == least
+
+
+def test_colony__pheromones_are_opt_in():
+    from dataclasses import replace
+    from evolutionary.cache import job_key
+    from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+
+    world = WorldParams(resource_count=2, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+    job = ColonyJob(robot_count=2, motor_ratio=0.5, time_limit=10, seed=4, world=world)
+    sim = build_colony_simulation(job)
+
+    assert sim.environment.pheromones is None
+    assert not any(robot.controller.PHEROMONE_EXPLORATION for robot in sim.entities if hasattr(robot, "controller"))
+    pheromone_job = ColonyJob(robot_count=2, motor_ratio=0.5, time_limit=10, seed=4, world=replace(world, pheromones=True))
+    assert job_key(job) != job_key(pheromone_job)
@@ -0,0 +1,60 @@
+import pytest
+
+from evolutionary.colony import ColonyJob, WorldParams, build_colony_simulation
+from engine.robot import RobotBase
+
+SMALL_WORLD = WorldParams(resource_count=3, resource_radius=30, min_dist=150, max_dist=300, waypoint_count=9)
+
+
+def get_colony_sim(batch_powertrain: bool):
+    return build_colony_simulation(ColonyJob(robot_count=5, motor_ratio=0.5, time_limit=5, seed=4, world=SMALL_WORLD, batch_powertrain=batch_powertrain))
+
+
+def get_robots(sim) -> list[RobotBase]:
+    return sorted((obj for obj in sim.entities if isinstance(obj, RobotBase)), key=lambda robot: robot.entity_id)
+
+
+def test_powertrain__matches_per_robot_components():
+    batched = get_colony_sim(batch_powertrain=True)
+    single = get_colony_sim(batch_powertrain=False)
+    batched.step(120)
+    single.step(120)
+
+    for robot, expected in zip(get_robots(batched), get_robots(single)):
+        assert tuple(robot.body.position) == pytest.approx(tuple(expected.body.position), abs=1e-6)
+        assert robot.battery.remaining__wh == pytest.approx(expected.battery.remaining__wh, rel=1e-9)
+        assert robot.motor_l._back_emf__v == pytest.approx(expected.motor_l._back_emf__v, abs=1e-9)
+        assert robot.motor_r._wheel_speed.rad_s == pytest.approx(expected.motor_r._wheel_speed.rad_s, abs=1e-9)
+
+
+def test_powertrain__disabled_robots_step_their_own_components():
+    sim = get_colony_sim(batch_powertrain=False)
+
+    assert sim.powertrain is None
+    assert all(robot.motor_l in robot._stepped_components and robot.battery in robot._stepped_components for robot in get_robots(sim))
+
+
+def test_powertrain__print_math_robot_steps_its_own_motors():
+    sim = get_colony_sim(batch_powertrain=True)
+    debugged, *others = get_robots(sim)
+    debugged.motor_l.print_math = True
+    sim.step(1)
+
+    assert debugged not in sim.powertrain.robots
+    assert debugged.motor_l in debugged._stepped_components
+    assert all(robot.motor_l not in robot._stepped_components for robot in others)
+
+
+def test_powertrain__drained_battery_matches_per_robot_components():
+    batched = get_colony_sim(batch_powertrain=True)
+    single = get_colony_sim(batch_powertrain=False)
+    for sim in (batched, single):
+        for robot in get_robots(sim):
+            robot.battery.infinite_power = False
+            robot.battery.remaining__wh = 1e-6
+        sim.step(60)
+
+    for robot, expected in zip(get_robots(batched), get_robots(single)):
+        assert robot.battery.remaining__wh == pytest.approx(expected.battery.remaining__wh, rel=1e-9)
+        assert tuple(robot.body.position) == pytest.approx(tuple(expected.body.position), abs=1e-6)
+    assert not batched.powertrain.powered.all()
@@ -0,0 +1,39 @@
+import json
+import os
+
+from engine.environment import Environment
+from engine.objects import Circle
+from engine.recorder import FrameRecorder
+from engine.simulation import SimulationBase
+
+
+def get_headless_sim():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, pixels_x=64, pixels_y=48, time_limit_seconds=0.5)
+    env = Environment(sim)
+    env.generate_waypoints(distance=20, x_count=3, y_count=3)
+    circle = Circle(x=0, y=0, radius=10, sim=sim)
+    circle.body.velocity = (60, 0)
+    return sim
+
+
+def test_recorder__writes_png_sequence(tmp_path):
+    sim = get_headless_sim()
+
+    with FrameRecorder(sim, str(tmp_path), every=10):
+        sim.run()
+
+    assert sorted(os.listdir(tmp_path)) == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+    assert sim.recorder is None
+
+
+def test_recorder__writes_raw_stream(tmp_path):
+    sim = get_headless_sim()
+
+    with FrameRecorder(sim, str(tmp_path), every=3, size=(32, 24), format="raw") as recorder:
+        sim.run()
+
+    with open(tmp_path / "frames.json") as file:
+        header = json.load(file)
+    assert header["frames"] == recorder.frames_written == 10
+    assert header["fps"] == 20
+    assert os.path.getsize(tmp_path / "frames.rgb") == 10 * 32 * 24 * 3
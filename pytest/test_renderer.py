@@ -0,0 +1,74 @@
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+from engine.environment import Environment
+from engine.objects import Circle
+from engine.renderer import Renderer, get_font
+from engine.simulation import SimulationBase
+
+
+def get_display_sim():
+    sim = SimulationBase(enable_display=True, enable_realtime=False, pixels_x=200, pixels_y=200)
+    env = Environment(sim)
+    env.generate_waypoints(distance=20, x_count=5, y_count=5)
+    Circle(x=0, y=0, radius=10, sim=sim)
+    sim._start()
+    return sim
+
+
+def count_static_builds(sim, monkeypatch):
+    builds = []
+    build = sim.renderer._build_static
+    monkeypatch.setattr(sim.renderer, "_build_static", lambda surface: (builds.append(1), build(surface)))
+    return builds
+
+
+def test_static_layer__rebuilt_only_on_camera_change(monkeypatch):
+    sim = get_display_sim()
+    builds = count_static_builds(sim, monkeypatch)
+    try:
+        for _ in range(3):
+            sim._update_visuals()
+            sim.renderer.present()
+        assert len(builds) == 1, f"Expected 1 build, but got {len(builds)}"
+
+        sim.meta.camera_offset[0] += 10
+        sim._update_visuals()
+        assert len(builds) == 2, f"Expected 2 builds, but got {len(builds)}"
+    finally:
+        sim._quit()
+
+
+def test_scenery__not_drawn_per_frame():
+    sim = get_display_sim()
+    try:
+        homebase = sim.environment.homebase
+
+        assert homebase.entity_id in sim._scenery
+        assert homebase.entity_id not in sim._phase_objects["draw"]
+    finally:
+        sim._quit()
+
+
+def test_present__updates_only_dirty_rects(monkeypatch):
+    sim = get_display_sim()
+    updates = []
+    monkeypatch.setattr("pygame.display.update", lambda rects=None: updates.append(rects))
+    try:
+        sim._update_visuals()
+        sim.renderer.present()
+        sim._update_visuals()
+        sim.renderer.present()
+
+        assert updates[0] is None  # first frame shows the new background
+        assert 0 < len(updates[1]) <= Renderer.MAX_DIRTY_RECTS
+    finally:
+        sim._quit()
+
+
+def test_get_font__cached():
+    sim = get_display_sim()
+    try:
+        assert get_font(20) is get_font(20)
+    finally:
+        sim._quit()
@@ -0,0 +1,39 @@
+import random
+
+from engine.environment import Environment
+from engine.rng import SimulationRNG
+from engine.simulation import SimulationBase
+
+
+def get_resource_positions(seed):
+    sim = SimulationBase(enable_display=False, enable_realtime=False, seed=seed)
+    env = Environment(sim)
+    env.generate_resources(count=5)
+    return [tuple(resource.body.position) for resource in env.resources]
+
+
+def test_world__same_seed_same_resources():
+    random.seed(1)
+    first = get_resource_positions(seed=42)
+    random.seed(2)  # the global random state must not matter
+    second = get_resource_positions(seed=42)
+
+    assert first == second, f"Expected {first} to equal {second}"
+    assert first != get_resource_positions(seed=43)
+
+
+def test_streams__are_independent():
+    rng = SimulationRNG(seed=7)
+    other = SimulationRNG(seed=7)
+    other.spawn.random()  # extra draws on one stream do not shift the others
+
+    assert rng.world.random() == other.world.random()
+    assert rng.controller(0).random() == other.controller(0).random()
+    assert rng.controller(0).random() != rng.controller(1).random()
+
+
+def test_simulation__picks_seed_when_missing():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+
+    assert sim.seed is not None
+    assert SimulationRNG(sim.seed).world.random() == SimulationRNG(sim.seed).world.random()
@@ -0,0 +1,84 @@
+from algorithms.base_controller import BaseController
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from sim_math.units import Mass
+
+
+class CountingController(BaseController):
+    def __init__(self):
+        super().__init__()
+        self.update_count = 0
+
+    def robot_start(self):
+        pass
+
+    def robot_update(self):
+        self.update_count += 1
+
+
+def get_robot(sim: SimulationBase, control_fps: int = None) -> RobotBase:
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    return RobotBase(robot_spec=spec, sim=sim, controller=CountingController(), control_fps=control_fps, ignore_battery=True)
+
+
+def test_controller__runs_every_physics_step_by_default():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    robot = get_robot(sim)
+
+    sim.step(60)
+
+    assert robot.controller.update_count == 60, f"Expected 60 updates, but got {robot.controller.update_count}"
+
+
+def test_controller__runs_at_simulation_control_fps():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, control_fps=15)
+    robot = get_robot(sim)
+
+    sim.step(60)
+
+    assert robot.controller.update_count == 15, f"Expected 15 updates, but got {robot.controller.update_count}"
+    assert robot.controller.sensors.get_control_dt() == 4 / 60
+
+
+def test_controller__robot_control_fps_overrides_simulation():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, control_fps=15)
+    robot = get_robot(sim, control_fps=30)
+
+    sim.step(60)
+
+    assert robot.controller.update_count == 30, f"Expected 30 updates, but got {robot.controller.update_count}"
+
+
+def test_profiler__separates_controller_and_components():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, profile=True, batch_powertrain=False)
+    robot = get_robot(sim)
+
+    sim.step(3)
+    update = sim.profiler.get_stats()["update"]
+
+    assert update["CountingController"]["calls"] == 3
+    assert update["DcMotor"]["calls"] == 6  # two motors
+    assert update["Battery"]["calls"] == 3
+    assert robot.controller.update_count == 3
+
+
+def test_profiler__batched_powertrain_replaces_motor_updates():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, profile=True)
+    get_robot(sim)
+
+    sim.step(3)
+    update = sim.profiler.get_stats()["update"]
+
+    assert update["FleetPowertrain"]["calls"] == 3
+    assert "DcMotor" not in update
+    assert update["Battery"]["calls"] == 3
+
+
+def test_draw_bounds__full_redraw_while_components_draw_debug():
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    robot = get_robot(sim)
+    assert robot.draw_bounds() is not None
+
+    robot.battery.draw_debugging = True
+    assert robot.draw_bounds() is None
@@ -0,0 +1,74 @@
+import random
+
+import pymunk
+from engine.environment import Environment
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from sim_math.angles import calc_relative_angle
+from sim_math.units import Mass
+
+
+def get_world(robot_count=40):
+    random.seed(7)
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_resources(count=5, min_dist=50, max_dist=300, radius=20)
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    robots = []
+    for i in range(robot_count):
+        robot = RobotBase(robot_spec=spec, sim=sim, position=(random.uniform(-600, 600), random.uniform(-600, 600)), robot_collision=False)
+        robot.body.angle = random.uniform(0, 6.28)
+        robot._light_range = random.choice([100, 200, 300])
+        robot._comms_range = random.choice([50, 300])
+        robot.light_switch = i % 3 == 0
+        robot.message = f"robot-{i}" if i % 2 == 0 else None
+        robots.append(robot)
+    return sim, robots
+
+
+def robots_in_range(robot: RobotBase, radius: float) -> list[RobotBase]:
+    """Robots found by a point query, as done without the robot grid."""
+    ray_filter = pymunk.ShapeFilter(mask=0b0001 | 0b0010 | 0b0100, group=robot.robot_group)
+    results = robot.sim.space.point_query(robot.body.position, radius, ray_filter)
+    return [r.shape.body.gameobject for r in results if isinstance(r.shape.body.gameobject, RobotBase)]
+
+
+def test_light_detectors__match_point_queries():
+    sim, robots = get_world()
+    expected = {id(robot): [] for robot in robots}
+    for emitter in robots:
+        if emitter.light_switch:
+            for robot in robots_in_range(emitter, emitter._light_range):
+                distance = robot.body.position.get_distance(emitter.body.position)
+                angle = calc_relative_angle(robot.body.position, robot.body.angle, emitter.body.position)
+                expected[id(robot)].append((distance, angle))
+
+    sim._preupdate()
+
+    detections = 0
+    for robot in robots:
+        actual = sorted((light.distance, light.angle) for light in robot.light_detectors)
+        assert len(actual) == len(expected[id(robot)])
+        for (distance, angle), (expected_distance, expected_angle) in zip(actual, sorted(expected[id(robot)])):
+            assert abs(distance - expected_distance) < 1e-9, f"Expected distance {expected_distance}, but got {distance}"
+            assert abs(angle - expected_angle) < 1e-9, f"Expected angle {expected_angle}, but got {angle}"
+        detections += len(actual)
+    assert detections > 0, "Expected the world to produce some light detections"
+
+
+def test_received_messages__match_point_queries():
+    sim, robots = get_world()
+    expected = {id(robot): [] for robot in robots}
+    for sender in robots:
+        if sender.message:
+            expected[id(sender)] = [robot.message for robot in robots_in_range(sender, sender._comms_range)]
+
+    sim._preupdate()
+
+    received = 0
+    for robot in robots:
+        actual = robot.get_received_messages()
+        assert sorted(actual, key=str) == sorted(expected[id(robot)], key=str)
+        received += len(actual)
+    assert received > 0, "Expected the world to produce some messages"
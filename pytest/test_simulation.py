@@ -0,0 +1,95 @@
+from engine.objects import Circle
+from engine.simulation import SimulationBase
+
+
+def get_headless_sim(time_limit_seconds=None):
+    return SimulationBase(
+        enable_display=False,
+        enable_realtime=False,
+        time_limit_seconds=time_limit_seconds,
+    )
+
+
+def test_step__advances_frames():
+    sim = get_headless_sim()
+
+    counters = sim.step(10)
+
+    assert sim.frame_count == 10, f"Expected 10 frames, but got {sim.frame_count}"
+    assert counters is sim.counters
+    assert sim.steps_per_second > 0
+
+
+def test_step__stops_at_time_limit():
+    sim = get_headless_sim(time_limit_seconds=1)
+
+    sim.step(1000)
+
+    assert sim.frame_count == sim.fps, f"Expected {sim.fps} frames, but got {sim.frame_count}"
+
+
+def test_run_until__stops_on_predicate():
+    sim = get_headless_sim()
+    circle = Circle(x=0, y=0, radius=10, sim=sim)
+    circle.body.velocity = (60, 0)
+
+    sim.run_until(lambda s: circle.body.position.x > 10, max_steps=1000)
+
+    assert circle.body.position.x > 10
+    assert sim.frame_count < 1000
+
+
+def test_run__headless_respects_time_limit():
+    sim = get_headless_sim(time_limit_seconds=0.5)
+
+    sim.run()
+
+    assert sim.frame_count == sim.fps // 2, f"Expected {sim.fps // 2} frames, but got {sim.frame_count}"
+
+
+class UpdatingCircle(Circle):
+    def update(self):
+        self.update_count = getattr(self, "update_count", 0) + 1
+
+
+def test_phase_objects__only_contain_overriding_objects():
+    sim = get_headless_sim()
+    static = Circle(x=0, y=0, radius=10, sim=sim)
+    updating = UpdatingCircle(x=50, y=0, radius=10, sim=sim)
+
+    assert list(sim._phase_objects["preupdate"].values()) == []
+    assert list(sim._phase_objects["update"].values()) == [updating]
+    assert list(sim._phase_objects["postupdate"].values()) == []
+    assert list(sim._phase_objects["draw"].values()) == [static, updating]
+
+
+def test_phase_objects__updated_on_remove():
+    sim = get_headless_sim()
+    updating = UpdatingCircle(x=50, y=0, radius=10, sim=sim)
+    sim.step(2)
+
+    sim.remove_game_object(updating)
+    sim.step(2)
+
+    assert updating.update_count == 2, f"Expected 2 updates, but got {updating.update_count}"
+    assert all(updating.entity_id not in objects for objects in sim._phase_objects.values())
+
+
+def test_profiler__off_by_default():
+    sim = get_headless_sim()
+
+    assert sim.profiler is None
+    assert "update" not in vars(UpdatingCircle(x=0, y=0, radius=10, sim=sim))
+
+
+def test_profiler__records_phases_by_type():
+    sim = SimulationBase(enable_display=False, enable_realtime=False, profile=True)
+    UpdatingCircle(x=0, y=0, radius=10, sim=sim)
+
+    sim.step(5)
+    stats = sim.profiler.get_stats()
+
+    assert sim.profiler.frames == 5
+    assert stats["physics"]["Space"]["calls"] == 5
+    assert stats["update"]["UpdatingCircle"]["calls"] == 5
+    assert len(sim.profiler.phase_history) == 5
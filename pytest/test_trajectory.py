@@ -0,0 +1,69 @@
+import numpy as np
+
+from algorithms.random_and_recruit_controller import RandomRecruitController, RobotState
+from engine.environment import Environment
+from engine.robot import RobotBase
+from engine.robot_spec import RobotSpec
+from engine.simulation import SimulationBase
+from engine.trajectory import NOT_ATTACHED, TrajectoryLog, read_trajectory
+from sim_math.units import Mass
+
+
+def get_colony_sim(robot_count=3):
+    sim = SimulationBase(enable_display=False, enable_realtime=False, time_limit_seconds=1, seed=5)
+    env = Environment(sim)
+    env.generate_waypoints(distance=100, x_count=5, y_count=5, homebase_threshold=80, visible=False)
+    env.generate_resources(count=2, radius=30, min_dist=150, max_dist=200)
+    spec = RobotSpec(meta=sim.meta, battery_mass=Mass.in_kg(1), motor_mass=Mass.in_kg(1), other_materials_mass=Mass.in_kg(1))
+    for _ in range(robot_count):
+        RobotBase(robot_spec=spec, sim=sim, controller=RandomRecruitController(), ignore_battery=True, robot_collision=False)
+    return sim
+
+
+def test_trajectory__round_trip(tmp_path):
+    path = str(tmp_path / "run.traj")
+    sim = get_colony_sim()
+
+    with TrajectoryLog(sim, path, every=6) as log:
+        sim.run()
+    header, frames = read_trajectory(path)
+
+    assert len(frames) == log.frames_written == 10
+    assert len(header["robots"]) == 3 and len(header["resources"]) == 2
+    assert header["states"]["SEARCH"] == RobotState.SEARCH.value
+    assert frames["frame"].tolist() == list(range(6, 61, 6))
+
+    last = frames[-1]
+    robots = [sim.entities.get(robot["entity_id"]) for robot in header["robots"]]
+    assert np.allclose(last["robots"]["x"], [robot.body.position.x for robot in robots], atol=1e-3)
+    assert set(last["robots"]["attached"].tolist()) <= {NOT_ATTACHED, 0, 1}
+    assert sim.trajectory is None
+
+
+def test_trajectory__closed_when_the_simulation_quits(tmp_path):
+    path = str(tmp_path / "run.traj")
+    sim = get_colony_sim()
+
+    log = TrajectoryLog(sim, path, every=6)
+    sim.run()
+    header, frames = read_trajectory(path)
+
+    assert log._file.closed
+    assert sim.trajectory is None
+    assert len(frames) == log.frames_written == 10
+
+
+def test_trajectory__marks_collected_resources(tmp_path):
+    path = str(tmp_path / "run.traj")
+    sim = get_colony_sim(robot_count=0)
+    log = TrajectoryLog(sim, path)
+    sim.step(1)
+    sim.remove_game_object(sim.environment.resources[0])
+    sim.step(1)
+    log.close()
+
+    _, frames = read_trajectory(path)
+
+    assert frames[0]["resources"]["present"].tolist() == [True, True]
+    assert frames[1]["resources"]["present"].tolist() == [False, True]
+    assert np.isnan(frames[1]["resources"]["x"][0])
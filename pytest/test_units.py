@@ -1,4 +1,5 @@
 import pytest
+import pickle
 from sim_math.units import (
     Distance,
     TimeSpan,
@@ -224,3 +225,29 @@ def test_angular_speed(first, second):
     # Assert
     is_almost_equal = abs(first - second) < 1e-6
     assert is_almost_equal, f"Expected {first} to be {second}"
+
+
+def test_units_have_no_instance_dict():
+    distance = Distance.in_m(1)
+
+    assert not hasattr(distance, "__dict__")
+    with pytest.raises(AttributeError):
+        distance.cached = 1
+
+
+def test_conversion_follows_initialized_fps():
+    speed = Speed.in_base_unit(1)
+    assert speed.cm_s == 60
+
+    try:
+        Speed.initialize(fps=30)
+        assert speed.cm_s == 30
+    finally:
+        Speed.initialize(fps=60)
+
+
+def test_units_pickle():
+    torque = pickle.loads(pickle.dumps(Torque.in_nm(2)))
+
+    assert isinstance(torque, Torque)
+    assert torque.nm == pytest.approx(2)
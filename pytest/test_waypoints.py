@@ -0,0 +1,118 @@
+import random
+import pytest
+from pymunk import Vec2d
+from engine.environment import Environment
+from engine.simulation import SimulationBase
+
+
+def get_env(**kwargs):
+    sim = SimulationBase(enable_display=False, enable_realtime=False)
+    env = Environment(sim)
+    env.generate_waypoints(**kwargs)
+    return sim, env
+
+
+@pytest.mark.parametrize(
+    "distance,x_count,y_count,homebase_threshold",
+    [
+        (10, 5, 5, 50),
+        (90, 31, 31, 80),
+        (100, 3, 7, 30),
+    ],
+)
+def test_generate_waypoints__grid_layout(distance, x_count, y_count, homebase_threshold):
+    _, env = get_env(distance=distance, x_count=x_count, y_count=y_count, homebase_threshold=homebase_threshold)
+    waypoints = env.get_all_waypoints()
+
+    i = 0
+    for grid_x in range(x_count):
+        for grid_y in range(y_count):
+            waypoint = waypoints[i]
+            x = -((distance * (x_count - 1)) / 2) + grid_x * distance
+            y = -((distance * (y_count - 1)) / 2) + grid_y * distance
+
+            assert waypoint.id == i
+            assert waypoint.position == Vec2d(x, y), f"Expected {Vec2d(x, y)}, but got {waypoint.position}"
+            assert waypoint.is_homebase == (Vec2d(x, y).get_distance((0, 0)) < homebase_threshold)
+
+            expected_neighbors = {
+                "up": (grid_x, grid_y + 1),
+                "down": (grid_x, grid_y - 1),
+                "left": (grid_x - 1, grid_y),
+                "right": (grid_x + 1, grid_y),
+            }
+            for direction, (nx, ny) in expected_neighbors.items():
+                neighbor = waypoint.neighbors[direction]
+                if 0 <= nx < x_count and 0 <= ny < y_count:
+                    assert neighbor is waypoints[nx * y_count + ny], f"Wrong {direction} neighbor of waypoint {i}"
+                else:
+                    assert neighbor is None, f"Expected no {direction} neighbor of waypoint {i}"
+            i += 1
+
+
+def test_generate_waypoints__adds_nothing_to_space():
+    sim, env = get_env(distance=90, x_count=31, y_count=31)
+
+    assert len(env.get_all_waypoints()) == 31 * 31
+    assert len(sim.space.shapes) == 1, "Expected only the homebase in the space"
+
+
+def bfs_hops(waypoints) -> dict[int, int]:
+    """Hops to the homebase by following the IWaypointData neighbors"""
+    hops = {waypoint.id: 0 for waypoint in waypoints if waypoint.is_homebase}
+    frontier = [waypoint for waypoint in waypoints if waypoint.is_homebase]
+    while frontier:
+        next_frontier = []
+        for waypoint in frontier:
+            for neighbor in waypoint.neighbors.values():
+                if neighbor is not None and neighbor.id not in hops:
+                    hops[neighbor.id] = hops[waypoint.id] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return hops
+
+
+@pytest.mark.parametrize("x_count,y_count,homebase_threshold", [(5, 5, 50), (31, 31, 80), (4, 9, 30)])
+def test_routes_home__shortest_by_breadth_first_search(x_count, y_count, homebase_threshold):
+    _, env = get_env(distance=20, x_count=x_count, y_count=y_count, homebase_threshold=homebase_threshold)
+    waypoints = env.get_all_waypoints()
+    expected = bfs_hops(waypoints)
+
+    for waypoint in waypoints:
+        hops = int(env.waypoint_grid.hops_home[waypoint.id])
+        assert hops == expected[waypoint.id]
+        next_waypoint = env.next_waypoint_home(waypoint)
+        if waypoint.is_homebase:
+            assert next_waypoint is waypoint
+        else:
+            assert next_waypoint in waypoint.neighbors.values()
+            assert env.waypoint_grid.hops_home[next_waypoint.id] == hops - 1
+        route = env.route_home(waypoint)
+        assert len(route) == hops + 1 and route[-1].is_homebase
+
+
+def test_routes_home__without_homebase_waypoints():
+    _, env = get_env(distance=100, x_count=4, y_count=4, homebase_threshold=1)
+    waypoint = env.get_all_waypoints()[0]
+
+    assert env.next_waypoint_home(waypoint) is None
+    assert env.route_home(waypoint) == []
+
+
+def test_nearest_waypoint__matches_closest_position():
+    _, env = get_env(distance=90, x_count=11, y_count=7)
+    rng = random.Random(3)
+
+    for _ in range(200):
+        position = Vec2d(rng.uniform(-700, 700), rng.uniform(-500, 500))
+        expected = min(env.get_all_waypoints(), key=lambda waypoint: (waypoint.position.get_distance(position), waypoint.id))
+        actual = env.nearest_waypoint(position)
+        assert actual.position.get_distance(position) == pytest.approx(expected.position.get_distance(position))
+
+
+def test_waypoints_dict__built_once():
+    _, env = get_env(distance=90, x_count=301, y_count=301)
+
+    assert env.get_waypoints_dict() is env.get_waypoints_dict()
+    assert env.get_waypoints_dict()[301 * 301 - 1] is env.get_all_waypoints()[-1]
+    assert env.waypoint_grid.hops_home.max() == 300
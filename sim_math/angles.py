@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 from engine.types import Direction
 
 
@@ -32,6 +34,16 @@ def calc_relative_angle(subject_pos, subject_angle, target_pos):
         return normalized_angle - 2 * math.pi
     return normalized_angle
 
+def calc_relative_angles(subject_pos: np.ndarray, subject_angle: np.ndarray, target_pos) -> np.ndarray:
+    """Vectorized calc_relative_angle for many subjects (N x 2 positions, N angles) and one target
+    The relative angles are always between -pi and pi. Left is positive, right is negative"""
+    delta = np.asarray(target_pos, dtype=float) - subject_pos
+    global_angle = np.arctan2(delta[:, 1], delta[:, 0])
+    global_angle = np.where(global_angle >= 0, global_angle, 2 * math.pi + global_angle)
+    normalized_angle = normalize_angle(global_angle - subject_angle)
+    return np.where(normalized_angle > math.pi, normalized_angle - 2 * math.pi, normalized_angle)
+
+
 def calc_waypoint_dir_from_angle(angle: float) -> Direction:
     """Return the direction of a waypoint based on the angle"""
     angle = normalize_angle(angle)
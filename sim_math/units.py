@@ -7,6 +7,8 @@ from sim_math.units_base import UnitBase, UnitConverter
 class Distance(UnitBase):
     """Class to convert between different units of distance. The base unit is in cm."""
 
+    __slots__ = ()
+
     CM: UnitConverter = UnitConverter(value_in_base_unit=1, name="cm")
     M: UnitConverter = UnitConverter(value_in_base_unit=1 / 100, name="m")
     KM: UnitConverter = UnitConverter(value_in_base_unit=1 / 100_000, name="km")
@@ -39,6 +41,8 @@ class Distance(UnitBase):
 class TimeSpan(UnitBase):
     """Class to convert between different units of time. The base unit is in frames (requires initilization)."""
 
+    __slots__ = ()
+
     SECOND: UnitConverter = UnitConverter(value_in_base_unit=None, name="s")
     MINUTE: UnitConverter = UnitConverter(value_in_base_unit=None, name="min")
     HOUR: UnitConverter = UnitConverter(value_in_base_unit=None, name="h")
@@ -77,6 +81,8 @@ class TimeSpan(UnitBase):
 class Volume(UnitBase):
     """Class to convert between different units of volume. The base unit is in cm³."""
 
+    __slots__ = ()
+
     CM3: UnitConverter = UnitConverter(value_in_base_unit=1, name="cm³")
     LITRE: UnitConverter = UnitConverter(value_in_base_unit=1 / 1000, name="l")
     M3: UnitConverter = UnitConverter(value_in_base_unit=1 / 1_000_000, name="m³")
@@ -109,6 +115,8 @@ class Volume(UnitBase):
 class Mass(UnitBase):
     """Class to convert between different units of mass. The base unit is in grams."""
 
+    __slots__ = ()
+
     G: UnitConverter = UnitConverter(value_in_base_unit=1, name="g")
     KG: UnitConverter = UnitConverter(value_in_base_unit=1 / 1000, name="kg")
 
@@ -133,6 +141,8 @@ class Density2d(UnitBase):
     """Class to convert between different units of 2D density. The base unit is in g/cm².
     Be aware that 1 g/cm² > 1 kg/m²."""
 
+    __slots__ = ()
+
     G_CM2: UnitConverter = UnitConverter(value_in_base_unit=1, name="g/cm²")
     KG_M2: UnitConverter = UnitConverter(value_in_base_unit=10, name="kg/m²")
 
@@ -161,6 +171,8 @@ class Density3d(UnitBase):
     """Class to convert between different units of 3D density. The base unit is in g/cm³.
     Be aware that 1 g/cm³ > 1 kg/m³."""
 
+    __slots__ = ()
+
     G_CM3: UnitConverter = UnitConverter(value_in_base_unit=1, name="g/cm³")
     KG_M3: UnitConverter = UnitConverter(value_in_base_unit=1000, name="kg/m³")
 
@@ -188,6 +200,8 @@ class Density3d(UnitBase):
 class Force(UnitBase):
     """Class to convert between different units of force. The base unit is in newtons."""
 
+    __slots__ = ()
+
     DYNE: UnitConverter = UnitConverter(value_in_base_unit=1, name="dyne")
     N: UnitConverter = UnitConverter(value_in_base_unit=1 / 100_000, name="N")
 
@@ -221,6 +235,8 @@ class Force(UnitBase):
 class Torque(UnitBase):
     """Class to convert between different units of torque. The base unit is in newton meters."""
 
+    __slots__ = ()
+
     DYNE_CM: UnitConverter = UnitConverter(value_in_base_unit=1, name="dyne cm")
     NM: UnitConverter = UnitConverter(value_in_base_unit=1 / 10_000_000, name="Nm")
 
@@ -254,6 +270,8 @@ class Torque(UnitBase):
 class Speed(UnitBase):
     """Class to convert between different units of speed. The base unit is in cm/frames (requires initilization)."""
 
+    __slots__ = ()
+
     CM_S: UnitConverter = UnitConverter(value_in_base_unit=None, name="cm/s")
     KM_H: UnitConverter = UnitConverter(value_in_base_unit=None, name="km/h")
 
@@ -282,6 +300,8 @@ class Speed(UnitBase):
 class AngularSpeed(UnitBase):
     """Class to convert between different units of rotational speed. The base unit is in rad/s."""
 
+    __slots__ = ()
+
     RAD_S: UnitConverter = UnitConverter(value_in_base_unit=None, name="rad/s")
     RPM: UnitConverter = UnitConverter(value_in_base_unit=None, name="rpm")
     KRPM: UnitConverter = UnitConverter(value_in_base_unit=None, name="krpm")
@@ -7,6 +7,8 @@ from math import floor
 class UnitConverter:
     """Class to convert between a unit and a base unit."""
 
+    __slots__ = ("value_in_base_unit", "name")
+
     def __init__(self, value_in_base_unit: float, name: str):
         self.value_in_base_unit = value_in_base_unit
         self.name = name
@@ -24,29 +26,34 @@ class UnitConverter:
 
 class UnitBase:
     """Base class for unit conversion within a specific type of measurement. For best
-    performance the base unit should be the unit used in the physics engine."""
+    performance the base unit should be the unit used in the physics engine.
+
+    Instances only hold the base value, the conversion factors live on the class-level
+    UnitConverters, so a unit costs no more than a float wrapper. Hot engine code can keep
+    plain floats in the base unit and convert with the UnitConverters directly, exposing
+    the typed units at its API."""
+
+    __slots__ = ("_base_value",)
 
     BASE_UNIT: UnitConverter = UnitConverter(value_in_base_unit=1, name="base_unit")
 
     def __init__(self, base_value: float):
         self._base_value = base_value
-        self._conversions = {}
 
     @classmethod
     def _in_unit(cls: Self, value: float, unit: UnitConverter) -> Self:
         """Create an instance of the class based on a unit and value in the given unit."""
-        return cls(base_value=unit.to_base(value))
+        return cls(value / unit.value_in_base_unit if value != 0 else 0)
 
     @classmethod
     def in_base_unit(cls, value: float) -> Self:
         """Create an instance of the class based on a value in the base unit."""
-        return cls._in_unit(value, cls.BASE_UNIT)
+        return cls(value)
 
     def _convert_to(self, unit: UnitConverter) -> float:
         """Convert the base value to the specified unit."""
-        if unit.name not in self._conversions:
-            self._conversions[unit.name] = unit.to_unit(self._base_value)
-        return self._conversions[unit.name]
+        value = self._base_value
+        return value * unit.value_in_base_unit if value != 0 else 0
 
     @property
     def base_unit(self) -> float:
@@ -38,6 +38,13 @@ class WorldMeta:
         self.cm_frames_to_km_h = self.fps * (self.hour_to_seconds / self.km_to_cm)
         self.newton_to_g_cm_2 = 100_000
 
+    def __setstate__(self, state):
+        # The unit classes hold the fps, set them up again when restored in a new process
+        self.__dict__.update(state)
+        TimeSpan.initialize(fps=self.fps)
+        Speed.initialize(fps=self.fps)
+        AngularSpeed.initialize(fps=self.fps)
+
     def pymunk_to_pygame_point(self, point: tuple, surface):
         return (
             point[0] - self.camera_offset[0]
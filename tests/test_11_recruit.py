@@ -33,7 +33,7 @@ def simulation():
             controller=controller,
             ignore_battery=True,
             robot_collision=False,
-            debug_color=Colors.get_random_color(),
+            debug_color=Colors.get_random_color(sim.rng.colors),
         )
         robot._comms_range = 300
         robot._light_range = 300
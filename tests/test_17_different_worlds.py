@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from typing import List
 import os;os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
-from random import uniform
 from algorithms.random_and_recruit_controller import RandomRecruitController
 from engine.debug_colors import Colors
 from engine.environment import Environment
@@ -69,12 +68,12 @@ def simulation(solution, screen_size, caption, realtime_display, time_limit, wor
         robot = RobotBase(
             sim=sim,
             robot_spec=robot_spec,
-            position=(uniform(-1, 1) * 2, uniform(-1, 1) * 2),
+            position=(sim.rng.spawn.uniform(-1, 1) * 2, sim.rng.spawn.uniform(-1, 1) * 2),
             angle=0,
             controller=controller,
             ignore_battery=True,
             robot_collision=False,
-            debug_color=Colors.get_random_color(),
+            debug_color=Colors.get_random_color(sim.rng.colors),
         )
         robot._comms_range = 300
         robot._light_range = 300
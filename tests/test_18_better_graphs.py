@@ -1,5 +1,4 @@
 import os;os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
-from random import uniform
 import pygad
 from algorithms.random_and_recruit_controller import RandomRecruitController
 from engine.debug_colors import Colors
@@ -48,12 +47,12 @@ def simulation(solution, screen_size, caption, realtime_display, time_limit) ->
         robot = RobotBase(
             sim=sim,
             robot_spec=robot_spec,
-            position=(uniform(-1, 1) * 2, uniform(-1, 1) * 2),
+            position=(sim.rng.spawn.uniform(-1, 1) * 2, sim.rng.spawn.uniform(-1, 1) * 2),
             angle=0,
             controller=controller,
             ignore_battery=True,
             robot_collision=False,
-            debug_color=Colors.get_random_color(),
+            debug_color=Colors.get_random_color(sim.rng.colors),
         )
         robot._comms_range = 300
         robot._light_range = 300